@@ -0,0 +1,7 @@
+from .scenarios import Scenario, LevelScenario, BossScenario, StressScenario, default_scenarios
+from .runner import run_scenario, run_benchmarks, compare_results
+
+__all__ = [
+    'Scenario', 'LevelScenario', 'BossScenario', 'StressScenario', 'default_scenarios',
+    'run_scenario', 'run_benchmarks', 'compare_results'
+]
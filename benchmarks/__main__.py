@@ -0,0 +1,92 @@
+"""
+Command line entry point for the benchmark suite.
+
+Usage:
+    python -m benchmarks                      # run everything, compare with baseline
+    python -m benchmarks --scenario stress    # only scenarios whose name contains "stress"
+    python -m benchmarks --save-baseline      # store this run as the new baseline
+"""
+
+import argparse
+import json
+import os
+import sys
+from benchmarks.runner import run_benchmarks, compare_results
+from benchmarks.scenarios import DEFAULT_TICKS, default_scenarios
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+
+def parse_args(argv=None):
+    """Parse the command line options"""
+    parser = argparse.ArgumentParser(description="Galaxy Shooter performance benchmarks")
+    parser.add_argument("--scenario", action="append", default=[],
+                        help="Only run scenarios whose name contains this text (repeatable)")
+    parser.add_argument("--ticks", type=int, default=DEFAULT_TICKS,
+                        help="Ticks simulated per scenario")
+    parser.add_argument("--output", help="Write the full report as JSON to this file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="Baseline report to compare against")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Write this run to the baseline file instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="Allowed relative p95 slowdown before failing")
+    return parser.parse_args(argv)
+
+
+def print_result(result):
+    """Print one scenario's summary line"""
+    frame = result['frame_ms']
+    phases = ' '.join(f"{phase}={values['p95']:.2f}" for phase, values in result['phases_ms'].items())
+    print(f"{result['name']:<20} frames={result['frames']:<6} "
+          f"p50={frame['p50']:.2f} p95={frame['p95']:.2f} p99={frame['p99']:.2f} ms  "
+          f"(p95 {phases})")
+    pairs = result['collision_pairs']
+    if pairs['total']:
+        print(f"{'':<20} bullet-enemy pairs tested: {pairs['tested']} of {pairs['total']} "
+              f"({100 * pairs['tested'] / pairs['total']:.1f}%)")
+
+
+def main(argv=None):
+    """
+    Run the benchmarks.
+
+    Returns:
+        Process exit code (1 if a regression against the baseline was found)
+    """
+    args = parse_args(argv)
+    scenarios = default_scenarios(args.ticks)
+    if args.scenario:
+        scenarios = [s for s in scenarios if any(text in s.name for text in args.scenario)]
+        if not scenarios:
+            print(f"No scenario matches {args.scenario}")
+            return 2
+
+    report = run_benchmarks(scenarios, progress=print_result)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare_results(report, baseline, args.tolerance)
+    for name, before, after in regressions:
+        print(f"REGRESSION {name}: p95 {before:.2f} ms -> {after:.2f} ms")
+    if not regressions:
+        print("No regressions against baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
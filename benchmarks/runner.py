@@ -0,0 +1,179 @@
+"""
+Benchmark Runner for Galaxy Shooter
+
+Drives scenarios frame by frame the way main.py's game loop does (one
+simulation tick, then a full draw and display update) and records how long
+each phase took, using the same frame profiler phases as the game's
+overlay. Results are plain dictionaries so they can be written as
+JSON and compared against a stored baseline.
+
+Design principles used:
+- Single Responsibility: Only times scenarios and summarises the timings
+- Machine-readable: Every report is JSON-serialisable
+"""
+
+import platform
+import time
+import pygame
+from core.assets import asset_cache
+from core.profiler import frame_profiler
+from managers.game_session import GameSession
+from managers.headless_runner import init_headless_display
+
+# Percentiles reported for frame and phase times
+PERCENTILES = (50, 95, 99)
+
+# A p95 frame time is only a regression if it also grew by this many ms;
+# keeps sub-millisecond scenarios from failing on timer noise
+ABSOLUTE_SLACK_MS = 0.25
+
+
+def percentile(sorted_values, pct):
+    """
+    Nearest-rank percentile of an already sorted list.
+
+    Args:
+        sorted_values: Values in ascending order
+        pct: Percentile (0-100)
+
+    Returns:
+        The percentile value, or 0.0 for an empty list
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-pct * len(sorted_values) // 100))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(samples):
+    """
+    Summarise a list of durations in milliseconds.
+
+    Args:
+        samples: Durations in milliseconds
+
+    Returns:
+        Dictionary with mean, max and the reported percentiles
+    """
+    ordered = sorted(samples)
+    summary = {f'p{pct}': percentile(ordered, pct) for pct in PERCENTILES}
+    summary['mean'] = sum(ordered) / len(ordered) if ordered else 0.0
+    summary['max'] = ordered[-1] if ordered else 0.0
+    return summary
+
+
+def run_scenario(scenario):
+    """
+    Run one scenario and time every frame.
+
+    Args:
+        scenario: Scenario instance
+
+    Returns:
+        Dictionary with the frame time summary, per-phase summaries, how
+        the run ended and how many bullet-enemy pairs the collision
+        broadphase let through out of all pairs
+    """
+    if pygame.display.get_surface() is None:
+        init_headless_display()
+    screen = pygame.display.get_surface()
+    width, height = screen.get_size()
+    background = asset_cache.image('background2.png')
+
+    session = GameSession(width, height)
+    scenario.setup(session)
+    input_source = scenario.create_input()
+
+    profiler = frame_profiler
+    was_enabled = profiler.enabled
+    profiler.set_enabled(True)
+    samples = {phase: [] for phase in profiler.phases}
+    frames = []
+    outcome = None
+    for tick in range(scenario.ticks):
+        scenario.before_tick(session, tick)
+        controls = input_source.poll()
+
+        profiler.begin_frame()
+        outcome = session.step(controls)
+        screen.blit(background, (0, 0))
+        session.draw(screen)
+        profiler.lap('draw')
+        pygame.display.update()
+        profiler.lap('display')
+        profiler.end_frame()
+
+        timings = profiler.latest()
+        for phase, values in samples.items():
+            values.append(timings[phase])
+        frames.append(timings['total'])
+
+        if outcome is not None and scenario.stop_on_outcome:
+            break
+    profiler.set_enabled(was_enabled)
+
+    return {
+        'name': scenario.name,
+        'frames': len(frames),
+        'outcome': outcome or "TIMEOUT",
+        'frame_ms': summarize(frames),
+        'phases_ms': {phase: summarize(values) for phase, values in samples.items()},
+        'collision_pairs': {
+            'tested': session.player_bullets.pairs_tested,
+            'total': session.player_bullets.pairs_total,
+        },
+    }
+
+
+def run_benchmarks(scenarios, progress=None):
+    """
+    Run several scenarios.
+
+    Args:
+        scenarios: Iterable of Scenario instances
+        progress: Optional callback called with each scenario result
+
+    Returns:
+        Report dictionary with machine info and one entry per scenario
+    """
+    results = {}
+    for scenario in scenarios:
+        result = run_scenario(scenario)
+        results[scenario.name] = result
+        if progress:
+            progress(result)
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'scenarios': results,
+    }
+
+
+def compare_results(report, baseline, tolerance=0.15):
+    """
+    Find scenarios whose p95 frame time got worse than the baseline.
+
+    Args:
+        report: Report from run_benchmarks()
+        baseline: Earlier report to compare against
+        tolerance: Allowed relative slowdown (0.15 = 15%)
+
+    Returns:
+        List of (scenario name, baseline p95 ms, current p95 ms) for every regression
+    """
+    regressions = []
+    old_results = baseline.get('scenarios', {})
+    for name, result in report['scenarios'].items():
+        old = old_results.get(name)
+        if old is None:
+            continue
+        before = old['frame_ms']['p95']
+        after = result['frame_ms']['p95']
+        if after > before * (1 + tolerance) and after - before > ABSOLUTE_SLACK_MS:
+            regressions.append((name, before, after))
+    return regressions
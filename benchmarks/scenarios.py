@@ -0,0 +1,167 @@
+"""
+Benchmark Scenarios for Galaxy Shooter
+
+Each scenario sets up a GameSession in a known state and then drives it
+tick by tick with scripted input. Scenarios use the real game objects
+(LevelManager, Level1-Level5, the bosses, the bullet systems) so the
+benchmark measures the same code the game runs.
+
+Design principles used:
+- Polymorphism: Every scenario exposes setup() and before_tick()
+- Reproducibility: Each scenario starts its level with a fixed RNG seed
+"""
+
+import random
+from core.input import ScriptedInput
+from core.world import ENEMY
+from entities.formation import Formation
+
+# Ticks simulated by default (20 seconds of game time)
+DEFAULT_TICKS = 1000
+
+
+class Scenario:
+    """
+    Base class for benchmark scenarios.
+
+    Subclasses prepare the session in setup() and can inject extra load
+    every tick in before_tick(). A scenario ends after `ticks` ticks, or
+    earlier when the level is won or lost if stop_on_outcome is set.
+    """
+
+    stop_on_outcome = True
+
+    def __init__(self, name, ticks=DEFAULT_TICKS, seed=0):
+        """
+        Initialize the scenario.
+
+        Args:
+            name: Unique name used in reports and baselines
+            ticks: Number of ticks to simulate
+            seed: Seed for the game RNG
+        """
+        self.name = name
+        self.ticks = ticks
+        self.seed = seed
+
+    def create_input(self):
+        """Return the input source driving the player"""
+        return ScriptedInput.sweep()
+
+    def setup(self, session):
+        """
+        Put the session into the scenario's starting state.
+        Must be implemented by subclasses.
+        """
+        raise NotImplementedError
+
+    def before_tick(self, session, tick):
+        """Hook called before every tick (e.g. to keep a load level constant)"""
+        pass
+
+
+class LevelScenario(Scenario):
+    """Play a stock level from its start"""
+
+    def __init__(self, level_index, ticks=DEFAULT_TICKS, seed=0):
+        super().__init__(f"level_{level_index + 1}", ticks, seed)
+        self.level_index = level_index
+
+    def setup(self, session):
+        session.start(self.level_index, self.seed)
+
+
+class BossScenario(Scenario):
+    """Skip a boss level's enemy wave and fight the boss"""
+
+    def __init__(self, level_index, ticks=DEFAULT_TICKS, seed=0):
+        super().__init__(f"boss_{level_index + 1}", ticks, seed)
+        self.level_index = level_index
+
+    def setup(self, session):
+        level = session.start(self.level_index, self.seed)
+        # With the wave gone, the level spawns its boss on the next update
+        for enemy in list(session.enemy_group):
+            enemy.kill()
+        level.update()
+
+
+class StressScenario(Scenario):
+    """
+    Synthetic wave: a level filled with one formation of `enemy_count`
+    enemies, with the number of live enemy bullets topped up to
+    `bullet_count` every tick.
+
+    Enemy bullets about to reach the player are removed so the player
+    survives and the whole run is measured under full load.
+
+    With `player_bullet_count` set, player bullets are topped up the same
+    way, spread over the screen below the enemies, to load the
+    bullet-vs-enemy broadphase.
+    """
+
+    stop_on_outcome = False
+
+    def __init__(self, enemy_count, bullet_count, ticks=DEFAULT_TICKS, seed=0, level_index=4,
+                 player_bullet_count=0):
+        name = f"stress_{enemy_count}e_{bullet_count}b"
+        if player_bullet_count:
+            name += f"_{player_bullet_count}p"
+        super().__init__(name, ticks, seed)
+        self.enemy_count = enemy_count
+        self.bullet_count = bullet_count
+        self.player_bullet_count = player_bullet_count
+        self.level_index = level_index
+        self._rng = random.Random(seed)
+
+    def setup(self, session):
+        level = session.start(self.level_index, self.seed)
+        for enemy in list(session.enemy_group):
+            enemy.kill()
+
+        # Enemies packed in a grid in a band at the top of the screen,
+        # high enough that they do not reach the bottom during the run
+        columns = 20
+        spacing_x = session.screen_width // columns
+        rows = max(1, -(-self.enemy_count // columns))
+        spacing_y = max(1, 80 // rows)
+        enemies = [level.create_enemy(spacing_x // 2 + (i % columns) * spacing_x,
+                                      40 + (i // columns) * spacing_y)
+                   for i in range(self.enemy_count)]
+        formation = Formation(level.get_enemy_speed_multiplier(), enemies[0].sweep_steps,
+                              enemies[0].drop_height, session.screen_width)
+        session.world.add_formation(formation)
+        for enemy in enemies:
+            session.world.spawn(ENEMY, enemy, formation)
+        level.total_enemies = self.enemy_count
+
+    def before_tick(self, session, tick):
+        bullets = session.enemy_bullets
+        bullets.kill(bullets.collide_rect(session.player.rect.inflate(0, 4 * bullets.speed)))
+
+        width = session.screen_width
+        height = session.screen_height - 200
+        rng = self._rng
+        while len(bullets) < self.bullet_count:
+            bullets.spawn(rng.randrange(width), rng.randrange(height))
+
+        player_bullets = session.player_bullets
+        while len(player_bullets) < self.player_bullet_count:
+            player_bullets.spawn(rng.randrange(width), rng.randrange(160, height))
+
+
+def default_scenarios(ticks=DEFAULT_TICKS):
+    """
+    Build the standard benchmark set.
+
+    Args:
+        ticks: Number of ticks each scenario simulates
+
+    Returns:
+        List of Scenario instances
+    """
+    scenarios = [LevelScenario(i, ticks) for i in range(5)]
+    scenarios += [BossScenario(i, ticks) for i in (2, 3, 4)]
+    scenarios += [StressScenario(count, count, ticks) for count in (100, 1000, 5000)]
+    scenarios.append(StressScenario(1000, 1000, ticks, player_bullet_count=200))
+    return scenarios
@@ -0,0 +1,207 @@
+"""
+Startup Benchmark for Galaxy Shooter
+
+Starts the real game (main.py on SDL's dummy video driver) in a fresh
+interpreter with `-X importtime`, lets it show the main menu once and
+quit, then reports:
+- how long importing took, in total and for the game's own modules
+- the time to first frame printed by main.py
+- the wall-clock time of the whole process
+
+Each measurement is checked against a budget, and none of the modules
+that are meant to be imported lazily (levels, bosses) may be imported
+before the first frame.
+
+The game is started once before the measured runs so every module is
+already compiled to bytecode: the budgets are for a normal start, not for
+the first start after a checkout, which also pays for compiling and
+takes several times as long to import the game's modules.
+
+This module is not imported by the benchmarks package, so it can be run
+with `python -m benchmarks.startup`.
+
+Usage:
+    python -m benchmarks.startup                  # 3 runs, median vs budgets
+    python -m benchmarks.startup --runs 5 --output startup.json
+
+Design principles used:
+- Realism: Measures the actual entry point in a cold interpreter
+- Machine-readable: The report is JSON-serialisable
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Top-level packages that belong to the game (everything else is third party)
+GAME_PACKAGES = ('core', 'entities', 'levels', 'managers', 'menus')
+
+# Modules that must not be imported before the first frame
+LAZY_MODULES = ('levels.', 'entities.base_boss', 'entities.boss')
+
+# Default budgets in milliseconds (medians over the runs)
+BUDGETS_MS = {
+    'import_total_ms': 1000.0,
+    'import_game_ms': 40.0,
+    'first_frame_ms': 250.0,
+    'process_ms': 2000.0,
+}
+
+_IMPORT_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$')
+_FIRST_FRAME_LINE = re.compile(r'Time to first frame: (\d+(?:\.\d+)?) ms')
+
+
+def parse_importtime(text):
+    """
+    Parse `-X importtime` output.
+
+    Args:
+        text: The interpreter's stderr
+
+    Returns:
+        List of (module name, self time in us, cumulative time in us), in import order
+    """
+    imports = []
+    for line in text.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, module = match.groups()
+            imports.append((module, int(self_us), int(cumulative_us)))
+    return imports
+
+
+def is_game_module(module):
+    """Check whether a module belongs to the game rather than to a library"""
+    return module.split('.')[0] in GAME_PACKAGES
+
+
+def measure_startup():
+    """
+    Start the game once, let it draw its first frame and quit.
+
+    Returns:
+        Dictionary with the timings of this run and the game modules it imported
+
+    Raises:
+        RuntimeError: If the game failed or did not report its first frame
+    """
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy',
+               PYGAME_HIDE_SUPPORT_PROMPT='1')
+    # Bytecode must be written for the warm-up start to be of any use
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', 'main.py', '--exit-after-first-frame'],
+        cwd=ROOT, env=env, capture_output=True, text=True)
+    process_ms = (time.perf_counter() - started) * 1000
+
+    first_frame = _FIRST_FRAME_LINE.search(completed.stdout)
+    if completed.returncode != 0 or first_frame is None:
+        raise RuntimeError(f"Game did not start (exit code {completed.returncode}):\n"
+                           f"{completed.stdout}{completed.stderr[-2000:]}")
+
+    imports = parse_importtime(completed.stderr)
+    game_imports = [(module, self_us) for module, self_us, _ in imports if is_game_module(module)]
+    return {
+        'import_total_ms': sum(self_us for _, self_us, _ in imports) / 1000,
+        'import_game_ms': sum(self_us for _, self_us in game_imports) / 1000,
+        'first_frame_ms': float(first_frame.group(1)),
+        'process_ms': process_ms,
+        'game_modules': [module for module, _ in game_imports],
+        'slowest_game_modules': sorted(game_imports, key=lambda item: -item[1])[:5],
+    }
+
+
+def run_startup_benchmark(runs=3):
+    """
+    Measure startup several times.
+
+    Args:
+        runs: Number of measured starts
+
+    Returns:
+        Report dictionary with the median of every timing and the per-run results
+    """
+    # Warm-up start: compiles every module, not counted
+    measure_startup()
+    results = [measure_startup() for _ in range(runs)]
+    medians = {key: statistics.median(result[key] for result in results) for key in BUDGETS_MS}
+    return {'median': medians, 'runs': results}
+
+
+def check_budgets(report, budgets=None):
+    """
+    Compare a startup report with the budgets.
+
+    Args:
+        report: Report from run_startup_benchmark()
+        budgets: Dictionary of timing name -> budget in ms (BUDGETS_MS if None)
+
+    Returns:
+        List of problems (empty if everything is within budget)
+    """
+    budgets = budgets or BUDGETS_MS
+    problems = []
+    for key, budget in budgets.items():
+        value = report['median'][key]
+        if value > budget:
+            problems.append(f"{key} {value:.1f} ms is over its {budget:.0f} ms budget")
+    for result in report['runs']:
+        eager = sorted({module for module in result['game_modules'] if module.startswith(LAZY_MODULES)})
+        if eager:
+            problems.append(f"imported before the first frame: {', '.join(eager)}")
+            break
+    return problems
+
+
+def parse_args(argv=None):
+    """Parse the command line options"""
+    parser = argparse.ArgumentParser(description="Galaxy Shooter startup benchmark")
+    parser.add_argument("--runs", type=int, default=3, help="Number of measured starts (default: 3)")
+    parser.add_argument("--output", help="Write the full report as JSON to this file")
+    for key, budget in BUDGETS_MS.items():
+        option = '--' + key.replace('_ms', '').replace('_', '-') + '-budget'
+        parser.add_argument(option, dest=key, type=float, default=budget,
+                            help=f"Budget in ms (default: {budget:.0f})")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Run the startup benchmark.
+
+    Returns:
+        Process exit code (1 if a budget was exceeded)
+    """
+    args = parse_args(argv)
+    report = run_startup_benchmark(args.runs)
+
+    median = report['median']
+    print(f"imports {median['import_total_ms']:.1f} ms (game {median['import_game_ms']:.1f} ms), "
+          f"first frame {median['first_frame_ms']:.0f} ms, process {median['process_ms']:.0f} ms "
+          f"(median of {args.runs})")
+    slowest = ', '.join(f"{module} {self_us / 1000:.1f}"
+                        for module, self_us in report['runs'][0]['slowest_game_modules'])
+    print(f"slowest game modules (ms): {slowest}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    problems = check_budgets(report, {key: getattr(args, key) for key in BUDGETS_MS})
+    for problem in problems:
+        print(f"OVER BUDGET: {problem}")
+    if not problems:
+        print("Startup within budget")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
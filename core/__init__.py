@@ -0,0 +1,7 @@
+from .assets import AssetCache, asset_cache
+from .pool import PooledSprite, ObjectPool, warm_pools, release_group, get_pool_stats
+
+__all__ = [
+    'AssetCache', 'asset_cache',
+    'PooledSprite', 'ObjectPool', 'warm_pools', 'release_group', 'get_pool_stats'
+]
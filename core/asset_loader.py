@@ -0,0 +1,100 @@
+"""
+Asynchronous Asset Loader for Galaxy Shooter
+
+Decodes image files on a thread pool while the main thread keeps drawing
+(a loading screen, for instance). Decoding is the slow part of loading and
+pygame releases the GIL while doing it, so several files are decoded in
+parallel. Converting to the display pixel format must happen on the main
+thread, so finished images are handed to the asset cache from poll().
+
+Design principles used:
+- Single Responsibility: Only schedules decoding and reports progress
+- Performance: File decoding overlaps with the main thread's start-up work
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+
+# Upper bound on decoding threads
+MAX_WORKERS = 4
+
+
+class AsyncAssetLoader:
+    """
+    Loads a list of images into an AssetCache in the background.
+
+    Usage:
+        loader = AsyncAssetLoader(asset_cache, asset_cache.manifest())
+        loader.start()
+        while not loader.done:
+            loader.poll()          # converts what finished, on this thread
+            draw_loading_screen(loader.progress())
+        loader.close()             # only needed when giving up early
+
+    The thread pool is created by start() only when there is something to
+    decode, and shut down as soon as every file has been handled.
+    """
+
+    def __init__(self, cache, names, workers=None):
+        """
+        Initialize the loader.
+
+        Args:
+            cache: AssetCache receiving the decoded images
+            names: File names to load
+            workers: Number of decoding threads (CPU count, at most MAX_WORKERS, if None)
+        """
+        self.cache = cache
+        self.names = list(names)
+        self.workers = workers or min(MAX_WORKERS, os.cpu_count() or 1)
+        self.loaded = 0
+        self.failed = []
+        self.done = not self.names
+        self._executor = None
+        self._pending = []
+
+    def start(self):
+        """Start decoding every file on the thread pool"""
+        if not self.names or self._executor is not None:
+            return
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="asset-decode")
+        self._pending = [(name, self._executor.submit(pygame.image.load, self.cache.path(name)))
+                         for name in self.names]
+
+    def poll(self):
+        """
+        Hand every finished image to the cache (converting it on this thread).
+
+        Returns:
+            Fraction of the files loaded so far (0.0-1.0)
+        """
+        still_pending = []
+        for name, future in self._pending:
+            if not future.done():
+                still_pending.append((name, future))
+                continue
+            try:
+                self.cache.add_decoded(name, future.result())
+                self.loaded += 1
+            except (pygame.error, OSError) as e:
+                print(f"Could not load image {name}: {e}")
+                self.failed.append(name)
+        self._pending = still_pending
+
+        if not self._pending and not self.done:
+            self.done = True
+            self.close()
+        return self.progress()
+
+    def close(self):
+        """Shut down the thread pool, dropping files not decoded yet"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def progress(self):
+        """Get the fraction of the files handled so far (0.0-1.0)"""
+        if not self.names:
+            return 1.0
+        return (self.loaded + len(self.failed)) / len(self.names)
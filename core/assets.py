@@ -0,0 +1,296 @@
+"""
+Asset Cache for Galaxy Shooter
+
+Central store for every sprite image used by the game. Each image is loaded
+from disk once, converted to the display pixel format once, and the same
+surface is then shared by every entity that needs it.
+
+Images can also come from a baked asset pack (see tools/bake_assets.py):
+one raw RGBA atlas, memory-mapped and wrapped in a surface without any
+PNG decoding, plus a JSON index of where each image sits in the atlas.
+The index records the size, modification time and content hash of every
+source file, so a pack baked from images that were edited since is
+ignored.
+
+Design principles used:
+- Single Responsibility: Only deals with loading and caching images
+- Reusability: Entities ask for images by name instead of loading files
+- Performance: No disk I/O or pixel-format conversion on the hot paths
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import pygame
+
+
+ASSET_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "images")
+
+# Baked asset pack: raw RGBA atlas and its JSON index
+PACK_DIR = os.path.join(os.path.dirname(ASSET_DIR), "baked")
+PACK_INDEX = "atlas.json"
+PACK_BLOB = "atlas.rgba"
+PACK_VERSION = 2
+
+# Size every boss image is scaled to
+BOSS_SIZE = (120, 90)
+
+# Levels that have a boss (boss3.png .. boss5.png)
+BOSS_LEVELS = (3, 4, 5)
+
+# Number of frames in the explosion animation (exp1.png .. exp5.png)
+EXPLOSION_FRAME_COUNT = 5
+
+# Background drawn behind the game and the menus
+BACKGROUND = "background2.png"
+
+
+class AssetCache:
+    """
+    Loads, converts and caches sprite surfaces.
+
+    Images are keyed by file name (e.g. "bullet.png"). Scaled variants are
+    keyed by file name and size, so a boss image is only scaled once.
+    Surfaces handed out by the cache are shared and must not be modified.
+    """
+
+    def __init__(self, asset_dir=ASSET_DIR):
+        """
+        Initialize the asset cache.
+
+        Args:
+            asset_dir: Directory containing the image files
+        """
+        self.asset_dir = asset_dir
+        self._images = {}
+        self._converted = set()
+        self._opaque = set()  # Packed images without transparency
+        self._pack_buffer = None  # Keeps the memory-mapped atlas alive
+
+    def path(self, name):
+        """Return the full path of an image file"""
+        return os.path.join(self.asset_dir, name)
+
+    def exists(self, name):
+        """Check whether an image file exists on disk"""
+        return os.path.exists(self.path(name))
+
+    def image(self, name):
+        """
+        Get a shared surface for an image file.
+
+        Args:
+            name: File name inside the asset directory
+
+        Returns:
+            The cached pygame Surface
+
+        Raises:
+            pygame.error / FileNotFoundError if the file cannot be loaded
+        """
+        key = name
+        surface = self._images.get(key)
+        if surface is None:
+            surface = pygame.image.load(self.path(name))
+            self._images[key] = surface
+        if key not in self._converted:
+            surface = self._convert(key, surface)
+        return surface
+
+    def scaled_image(self, name, size):
+        """
+        Get a shared surface for an image file scaled to a fixed size.
+
+        Args:
+            name: File name inside the asset directory
+            size: (width, height) tuple
+
+        Returns:
+            The cached, scaled pygame Surface
+        """
+        key = self.scaled_key(name, size)
+        surface = self._images.get(key)
+        if surface is None:
+            surface = pygame.transform.scale(self.image(name), size)
+            self._images[key] = surface
+        if key not in self._converted:
+            surface = self._convert(key, surface)
+        return surface
+
+    def boss_image(self, level):
+        """Get the pre-scaled image for the boss of a level"""
+        return self.scaled_image(f"boss{level}.png", BOSS_SIZE)
+
+    def add_decoded(self, name, surface):
+        """
+        Store an image decoded elsewhere (e.g. on a loader thread) and
+        convert it, if a display mode is set. Must run on the main thread.
+
+        Args:
+            name: File name the surface was loaded from
+            surface: Surface returned by pygame.image.load()
+        """
+        if name not in self._images:
+            self._images[name] = surface
+        self.image(name)
+
+    def source_stamp(self, name):
+        """
+        Describe an image file as it is on disk, for the asset pack index.
+
+        Args:
+            name: File name inside the asset directory
+
+        Returns:
+            Dictionary with the file's size, modification time and SHA-1
+        """
+        path = self.path(name)
+        stat = os.stat(path)
+        with open(path, 'rb') as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha1': digest}
+
+    def sources_changed(self, sources):
+        """
+        Check whether the image files differ from the ones a pack was baked
+        from. Files with the recorded size and modification time are
+        trusted; the others are hashed, so a touched but unchanged file
+        does not make the pack stale.
+
+        Args:
+            sources: File name -> source_stamp() of the baked files
+
+        Returns:
+            True if a file was added, removed or changed
+        """
+        names = self.manifest()
+        if sorted(names) != sorted(sources):
+            return True
+        for name in names:
+            stamp = sources[name]
+            try:
+                stat = os.stat(self.path(name))
+            except OSError:
+                return True
+            if stat.st_size != stamp['size']:
+                return True
+            if stat.st_mtime_ns != stamp['mtime_ns'] and self.source_stamp(name)['sha1'] != stamp['sha1']:
+                return True
+        return False
+
+    def manifest(self):
+        """
+        List the image files the game uses.
+
+        Returns:
+            List of file names inside the asset directory
+        """
+        names = [f"alien{i}.png" for i in range(1, 6)]
+        names += ["bullet.png", "alien_bullet.png", "spaceship.png", BACKGROUND]
+        names += [f"exp{i}.png" for i in range(1, EXPLOSION_FRAME_COUNT + 1)]
+        names += [f"boss{level}.png" for level in BOSS_LEVELS if self.exists(f"boss{level}.png")]
+        return names
+
+    def scaled_key(self, name, size):
+        """Get the cache key of a scaled variant of an image"""
+        return f"{name}@{size[0]}x{size[1]}"
+
+    def load_pack(self, pack_dir=PACK_DIR):
+        """
+        Install a baked asset pack, if one exists.
+
+        The atlas file is memory-mapped and wrapped in a single surface;
+        every packed image becomes a subsurface of it, so nothing is
+        decoded. Images are converted to the display format on first use
+        (or by preload()) as usual.
+
+        Args:
+            pack_dir: Directory containing the atlas and its index
+
+        Returns:
+            True if the pack was installed, False if there is none or it is unusable
+        """
+        if self._pack_buffer is not None:
+            return True
+        index_path = os.path.join(pack_dir, PACK_INDEX)
+        blob_path = os.path.join(pack_dir, PACK_BLOB)
+        if not (os.path.exists(index_path) and os.path.exists(blob_path)):
+            return False
+
+        with open(index_path) as f:
+            index = json.load(f)
+        width, height = index['size']
+        if (index.get('version') != PACK_VERSION or os.path.getsize(blob_path) != width * height * 4
+                or self.sources_changed(index['sources'])):
+            print(f"Ignoring stale asset pack in {pack_dir}; run tools/bake_assets.py again")
+            return False
+
+        with open(blob_path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        atlas = pygame.image.frombuffer(buffer, (width, height), 'RGBA')
+        for key, entry in index['images'].items():
+            self._images[key] = atlas.subsurface(pygame.Rect(entry['rect']))
+            self._converted.discard(key)
+            if entry.get('opaque'):
+                self._opaque.add(key)
+        self._pack_buffer = buffer
+        return True
+
+    def is_loaded(self, name):
+        """Check whether an image is already in the cache (loaded or packed)"""
+        return name in self._images
+
+    def explosion_frames(self):
+        """Get the explosion animation frames as a shared tuple"""
+        key = "explosion_frames"
+        frames = self._images.get(key)
+        if frames is None or key not in self._converted:
+            frames = tuple(self.image(f"exp{i}.png") for i in range(1, EXPLOSION_FRAME_COUNT + 1))
+            self._images[key] = frames
+            if pygame.display.get_surface() is not None:
+                self._converted.add(key)
+        return frames
+
+    def preload(self):
+        """
+        Load every image used by the game, plus the scaled and grouped
+        variants built from them. Call this once after the display mode
+        has been set.
+        """
+        bosses = {f"boss{level}.png": level for level in BOSS_LEVELS}
+        for name in self.manifest():
+            if name in bosses:
+                # Only the scaled copy is used (and it may come from the pack)
+                self.boss_image(bosses[name])
+            else:
+                self.image(name)
+        self.explosion_frames()
+
+    def clear(self):
+        """Drop every cached surface"""
+        self._images.clear()
+        self._converted.clear()
+        self._opaque.clear()
+        self._pack_buffer = None
+
+    def _convert(self, key, surface):
+        """
+        Convert a cached surface to the display pixel format.
+        Conversion needs a display mode, so it is deferred until one exists.
+        """
+        if pygame.display.get_surface() is None:
+            return surface
+        if key in self._opaque:
+            surface = surface.convert()
+        elif surface.get_flags() & pygame.SRCALPHA or surface.get_alpha() is not None:
+            surface = surface.convert_alpha()
+        else:
+            surface = surface.convert()
+        self._images[key] = surface
+        self._converted.add(key)
+        return surface
+
+
+# Shared cache used by all entities
+asset_cache = AssetCache()
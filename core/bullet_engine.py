@@ -0,0 +1,241 @@
+"""
+Bullet Engine for Galaxy Shooter
+
+Bullets are stored as a structure of NumPy arrays (position, velocity)
+instead of one pygame Sprite per bullet. Movement, off-screen culling and
+collision tests run vectorized over every live bullet at once, so the cost
+per tick stays flat even with thousands of bullets on screen.
+
+Live bullets are always packed at the front of the arrays; culling and
+kills compact them in one pass, so no alive flags need to be scanned.
+
+Design principles used:
+- Performance: One NumPy pass per tick instead of one Python call per bullet
+- Encapsulation: Callers spawn, test and kill bullets by index only
+- Reusability: The same system serves player and enemy bullets
+"""
+
+import numpy as np
+from core.assets import asset_cache
+from core.snapshot import RenderLayer, draw_layer
+
+# Initial number of bullet slots; grows by doubling when full
+DEFAULT_CAPACITY = 256
+
+
+class BulletSystem:
+    """
+    All bullets of one kind (same image, same velocity).
+
+    Positions are the top-left corner of each bullet's rect, matching how
+    pygame Rects are laid out, so collision results agree with
+    Rect.colliderect().
+    """
+
+    def __init__(self, image_name, speed, screen_width, screen_height, capacity=DEFAULT_CAPACITY):
+        """
+        Initialize the bullet system.
+
+        Args:
+            image_name: Asset name of the bullet image
+            speed: Vertical pixels per tick (negative = up)
+            screen_width: Width of the game screen
+            screen_height: Height of the game screen
+            capacity: Initial number of bullet slots
+        """
+        self.image_name = image_name
+        self.speed = speed
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+
+        width, height = asset_cache.image(image_name).get_size()
+        self.width = width
+        self.height = height
+
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.vx = np.zeros(capacity, dtype=np.float64)
+        self.vy = np.zeros(capacity, dtype=np.float64)
+        # Position before the last update(), for interpolated drawing; a
+        # bullet spawned since then starts from where it was spawned
+        self.px = np.zeros(capacity, dtype=np.float64)
+        self.py = np.zeros(capacity, dtype=np.float64)
+
+        # Bullet-sprite pairs tested by collide_grid(), and pairs there
+        # were in total (every bullet times every sprite in the grid)
+        self.pairs_tested = 0
+        self.pairs_total = 0
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """Remove every bullet"""
+        self.count = 0
+
+    def spawn(self, centerx, centery, vx=0, vy=None):
+        """
+        Add a bullet centred on a point.
+
+        Args:
+            centerx: X coordinate of the bullet centre
+            centery: Y coordinate of the bullet centre
+            vx: Horizontal pixels per tick
+            vy: Vertical pixels per tick (the system speed if None)
+        """
+        if self.count == len(self.x):
+            self._grow()
+        i = self.count
+        # Same rounding as setting Rect.center
+        self.x[i] = centerx - self.width // 2
+        self.y[i] = centery - self.height // 2
+        self.vx[i] = vx
+        self.vy[i] = self.speed if vy is None else vy
+        self.px[i] = self.x[i]
+        self.py[i] = self.y[i]
+        self.count = i + 1
+
+    def update(self):
+        """Move every bullet and drop the ones that left the screen"""
+        n = self.count
+        if n == 0:
+            return
+        x = self.x[:n]
+        y = self.y[:n]
+        self.px[:n] = x
+        self.py[:n] = y
+        x += self.vx[:n]
+        y += self.vy[:n]
+
+        on_screen = ((y + self.height >= 0) & (y <= self.screen_height) &
+                     (x + self.width >= 0) & (x <= self.screen_width))
+        if not on_screen.all():
+            self._keep(on_screen)
+
+    def collide_rect(self, rect):
+        """
+        Find the bullets overlapping a rect.
+
+        Args:
+            rect: pygame Rect (or (left, top, width, height) tuple)
+
+        Returns:
+            Array of indices of the overlapping bullets
+        """
+        n = self.count
+        if n == 0:
+            return np.empty(0, dtype=np.intp)
+        left, top, width, height = rect
+        x = self.x[:n]
+        y = self.y[:n]
+        hits = ((x < left + width) & (x + self.width > left) &
+                (y < top + height) & (y + self.height > top))
+        return np.flatnonzero(hits)
+
+    def collide_grid(self, grid):
+        """
+        Test every bullet against the sprites of a SpatialHash.
+
+        Bullets are grouped by the block of grid cells they cover, and each
+        group is only tested against the sprites in its own cells, so
+        bullets spread over the screen do not test every sprite.
+
+        Args:
+            grid: SpatialHash holding the sprites to test
+
+        Returns:
+            (bullet_indices, sprites): every overlapping pair, ordered by
+            bullet index and then by the sprites' order in the grid
+        """
+        n = self.count
+        if n == 0 or grid.count == 0:
+            return np.empty(0, dtype=np.intp), []
+        self.pairs_total += n * grid.count
+
+        spans, group_of = np.unique(grid.cell_spans(self.x[:n], self.y[:n], self.width, self.height),
+                                    axis=0, return_inverse=True)
+        group_of = group_of.reshape(-1)
+        order = np.argsort(group_of, kind='stable')
+        starts = np.searchsorted(group_of[order], np.arange(len(spans) + 1))
+
+        bullet_hits = []
+        rank_hits = []
+        for group, span in enumerate(spans.tolist()):
+            candidates = grid.query_span(*span)
+            if not candidates:
+                continue
+            bullets = order[starts[group]:starts[group + 1]]
+            self.pairs_tested += len(bullets) * len(candidates)
+            boxes = np.asarray([tuple(sprite.rect) for sprite in candidates], dtype=np.float64)
+            x = self.x[bullets, None]
+            y = self.y[bullets, None]
+            hits = ((x < boxes[:, 0] + boxes[:, 2]) & (x + self.width > boxes[:, 0]) &
+                    (y < boxes[:, 1] + boxes[:, 3]) & (y + self.height > boxes[:, 1]))
+            bullet_rows, candidate_columns = np.nonzero(hits)
+            if len(bullet_rows):
+                ranks = np.array([grid.rank(sprite) for sprite in candidates], dtype=np.intp)
+                bullet_hits.append(bullets[bullet_rows])
+                rank_hits.append(ranks[candidate_columns])
+
+        if not bullet_hits:
+            return np.empty(0, dtype=np.intp), []
+        bullet_hits = np.concatenate(bullet_hits)
+        rank_hits = np.concatenate(rank_hits)
+        pairs = np.lexsort((rank_hits, bullet_hits))
+        sprites = grid.sprites
+        return bullet_hits[pairs], [sprites[rank] for rank in rank_hits[pairs].tolist()]
+
+    def kill(self, indices):
+        """
+        Remove bullets by index.
+
+        Args:
+            indices: Indices as returned by the collide methods
+        """
+        if len(indices) == 0:
+            return
+        keep = np.ones(self.count, dtype=bool)
+        keep[indices] = False
+        self._keep(keep)
+
+    def draw(self, surface, alpha=1.0):
+        """
+        Draw every bullet with the shared cached image.
+
+        Args:
+            surface: Surface to draw on
+            alpha: Fraction of the next tick elapsed; positions are drawn
+                   between the previous and current tick
+
+        Returns:
+            List of the screen rects that were drawn to
+        """
+        return draw_layer(surface, self.render_layer(), alpha)
+
+    def render_layer(self):
+        """
+        Capture every bullet for drawing (see core.snapshot).
+
+        Returns:
+            RenderLayer of the bullets, all with the shared cached image
+        """
+        n = self.count
+        return RenderLayer(asset_cache.image(self.image_name), self.x[:n].copy(), self.y[:n].copy(),
+                           self.px[:n].copy(), self.py[:n].copy())
+
+    def _keep(self, mask):
+        """Compact the live bullets selected by a boolean mask to the front"""
+        n = self.count
+        kept = int(mask.sum())
+        for array in (self.x, self.y, self.vx, self.vy, self.px, self.py):
+            array[:kept] = array[:n][mask]
+        self.count = kept
+
+    def _grow(self):
+        """Double the number of bullet slots"""
+        size = len(self.x) * 2
+        for name in ('x', 'y', 'vx', 'vy', 'px', 'py'):
+            array = np.zeros(size, dtype=np.float64)
+            array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
@@ -0,0 +1,110 @@
+"""
+Dirty Rectangle Renderer for Galaxy Shooter
+
+Instead of repainting the whole background and pushing the full window to
+the display every frame, only the areas that changed are touched: the
+background is restored under everything drawn last frame, the new frame
+is drawn, and pygame.display.update() is given just the old and new rects.
+
+When the changed area gets large (many bullets, explosions everywhere) the
+bookkeeping costs more than it saves, so the renderer falls back to a full
+redraw for that frame.
+
+Design principles used:
+- Single Responsibility: Only decides what part of the screen to refresh
+- Performance: Fill-rate cost follows what moved, not the window size
+"""
+
+import pygame
+
+# Fall back to a full redraw when the dirty area covers more than this
+# fraction of the screen...
+DEFAULT_FULL_REDRAW_RATIO = 0.4
+
+# ...or when there are more than this many separate rects to update
+DEFAULT_MAX_RECTS = 256
+
+
+class DirtyRectRenderer:
+    """
+    Tracks what was drawn on the screen and refreshes only those areas.
+
+    Usage per frame:
+        renderer.begin_frame()
+        rects = <draw the frame, collecting the rects of every blit>
+        renderer.present(rects)
+
+    Anything that paints over the whole screen (menus, overlays) must call
+    invalidate() so the next frame is drawn in full.
+    """
+
+    def __init__(self, screen, background, full_redraw_ratio=DEFAULT_FULL_REDRAW_RATIO,
+                 max_rects=DEFAULT_MAX_RECTS):
+        """
+        Initialize the renderer.
+
+        Args:
+            screen: Display surface
+            background: Surface blitted at (0, 0) behind everything
+            full_redraw_ratio: Dirty area (fraction of the screen) that triggers a full redraw
+            max_rects: Number of dirty rects that triggers a full redraw
+        """
+        self.screen = screen
+        self.background = background
+        self.screen_rect = screen.get_rect()
+        self.full_redraw_ratio = full_redraw_ratio
+        self.max_rects = max_rects
+
+        self._previous_rects = []
+        self._full_redraw = True
+        self.full_redraws = 0
+        self.partial_redraws = 0
+
+    def invalidate(self):
+        """Force the next frame to be redrawn in full"""
+        self._full_redraw = True
+
+    def begin_frame(self):
+        """Restore the background under everything drawn last frame"""
+        if self._full_redraw or self._too_dirty(self._previous_rects):
+            self._full_redraw = True
+            self.screen.blit(self.background, (0, 0))
+            return
+
+        screen = self.screen
+        background = self.background
+        for rect in self._previous_rects:
+            screen.blit(background, rect, rect)
+
+    def present(self, rects):
+        """
+        Push the frame to the display.
+
+        Args:
+            rects: Rects of everything drawn this frame
+        """
+        screen_rect = self.screen_rect
+        drawn = [rect.clip(screen_rect) for rect in rects]
+        drawn = [rect for rect in drawn if rect.width and rect.height]
+
+        if self._full_redraw:
+            pygame.display.update()
+            self.full_redraws += 1
+        else:
+            dirty = self._previous_rects + drawn
+            if self._too_dirty(dirty):
+                pygame.display.update()
+                self.full_redraws += 1
+            else:
+                pygame.display.update(dirty)
+                self.partial_redraws += 1
+
+        self._previous_rects = drawn
+        self._full_redraw = False
+
+    def _too_dirty(self, rects):
+        """Check whether refreshing these rects one by one is not worth it"""
+        if len(rects) > self.max_rects:
+            return True
+        area = sum(rect.width * rect.height for rect in rects)
+        return area > self.full_redraw_ratio * self.screen_rect.width * self.screen_rect.height
@@ -0,0 +1,402 @@
+"""
+Entity-Component-System Core for Galaxy Shooter
+
+The gameplay state of the ships (player, enemies, bosses) lives in typed
+NumPy arrays, one ComponentStore per component, rather than in attributes
+spread over many Python objects. Systems then advance every entity that
+has the components they need with a handful of array operations per tick.
+
+The sprite classes stay thin facades over the stores: their attributes
+(speed, last_shot, current_hp, ...) are ComponentFields that read and
+write the arrays, and their rects are synced from the POSITION store once
+the systems have run, so drawing, collisions and the levels see ordinary
+sprites.
+
+A facade that is not attached to a registry (for example an enemy built
+ahead of time on a level prefetch thread) keeps its values in a plain
+dict; attach() moves them into the arrays and detach() moves them back,
+so only the main thread ever touches the stores.
+
+Design principles used:
+- Data-Oriented Design: Components stored as structure-of-arrays
+- Performance: Systems iterate whole arrays instead of single objects
+- Encapsulation: Sprites keep their attribute API as facades over the stores
+"""
+
+import numpy as np
+
+# Movement steps per tick. Enemies used to be updated twice per tick (by
+# the session and by the level); the game's pace is tuned to that, so the
+# single update per tick takes both steps.
+MOVE_STEPS_PER_TICK = 2
+
+# Component names
+POSITION = "position"
+VELOCITY = "velocity"
+ZIGZAG = "zigzag"
+SHOOTER = "shooter"
+HEALTH = "health"
+SPRITE = "sprite"
+
+# Component name -> (field, dtype) columns
+COMPONENTS = {
+    POSITION: (('x', np.int64), ('y', np.int64)),  # Rect top-left
+    VELOCITY: (('speed', np.float64), ('direction', np.int64)),  # Sideways pixels per step
+    ZIGZAG: (('counter', np.int64), ('sweep', np.int64),  # Steps per sweep
+             ('drop', np.int64), ('max_x', np.int64)),  # Pixels dropped per turn, right wall
+    SHOOTER: (('last_shot', np.int64), ('delay', np.int64), ('chance', np.float64)),
+    HEALTH: (('hp', np.int64), ('max_hp', np.int64)),
+    SPRITE: (('width', np.int64), ('height', np.int64)),
+}
+
+INITIAL_CAPACITY = 64
+
+
+def round_position(x):
+    """
+    Round positions the way pygame.Rect stores a float (half away from zero).
+
+    Args:
+        x: Float or NumPy array of floats
+
+    Returns:
+        Rounded value(s) as integers
+    """
+    return (np.sign(x) * np.floor(np.abs(x) + 0.5)).astype(np.int64)
+
+
+class ComponentStore:
+    """
+    Dense structure-of-arrays storage of one component.
+
+    Rows are kept packed: removing an entity moves the last row into its
+    place. `row_of` maps entity ids to rows (-1: no such component).
+    """
+
+    def __init__(self, name, fields, capacity=INITIAL_CAPACITY):
+        """
+        Initialize an empty store.
+
+        Args:
+            name: Component name
+            fields: Sequence of (field, dtype) columns
+            capacity: Initial number of rows
+        """
+        self.name = name
+        self.fields = tuple(field for field, _ in fields)
+        self.columns = {field: np.zeros(capacity, dtype=dtype) for field, dtype in fields}
+        self.entities = np.zeros(capacity, dtype=np.int64)  # Row -> entity id
+        self.objects = [None] * capacity  # Row -> facade, for systems writing back to sprites
+        self.row_of = np.full(capacity, -1, dtype=np.int64)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def has(self, entity):
+        """Check whether an entity has this component"""
+        return entity < len(self.row_of) and self.row_of[entity] >= 0
+
+    def add(self, entity, values, obj=None):
+        """
+        Give an entity this component.
+
+        Args:
+            entity: Entity id
+            values: Dict of field -> value (missing fields are 0)
+            obj: Facade the row belongs to
+        """
+        if entity >= len(self.row_of):
+            row_of = np.full(max(entity + 1, len(self.row_of) * 2), -1, dtype=np.int64)
+            row_of[:len(self.row_of)] = self.row_of
+            self.row_of = row_of
+        if self.count == len(self.entities):
+            self._grow()
+        row = self.count
+        for field, column in self.columns.items():
+            column[row] = values.get(field, 0)
+        self.entities[row] = entity
+        self.objects[row] = obj
+        self.row_of[entity] = row
+        self.count = row + 1
+
+    def remove(self, entity):
+        """
+        Take this component away from an entity.
+
+        Args:
+            entity: Entity id
+
+        Returns:
+            Dict of the removed field values
+        """
+        row = int(self.row_of[entity])
+        values = {field: column[row].item() for field, column in self.columns.items()}
+        last = self.count - 1
+        if row != last:
+            for column in self.columns.values():
+                column[row] = column[last]
+            moved = int(self.entities[last])
+            self.entities[row] = moved
+            self.objects[row] = self.objects[last]
+            self.row_of[moved] = row
+        self.objects[last] = None
+        self.row_of[entity] = -1
+        self.count = last
+        return values
+
+    def get(self, entity, field):
+        """Get one field of an entity as a Python number"""
+        return self.columns[field][self.row_of[entity]].item()
+
+    def set(self, entity, field, value):
+        """Set one field of an entity"""
+        self.columns[field][self.row_of[entity]] = value
+
+    def column(self, field):
+        """Get a view of one field for every row"""
+        return self.columns[field][:self.count]
+
+    def rows(self, entities):
+        """Get the rows of an array of entity ids (all must have the component)"""
+        return self.row_of[entities]
+
+    def clear(self):
+        """Remove every row"""
+        self.row_of[self.entities[:self.count]] = -1
+        self.objects[:self.count] = [None] * self.count
+        self.count = 0
+
+    def _grow(self):
+        """Double the number of rows"""
+        size = len(self.entities) * 2
+        for field, column in self.columns.items():
+            grown = np.zeros(size, dtype=column.dtype)
+            grown[:self.count] = column[:self.count]
+            self.columns[field] = grown
+        entities = np.zeros(size, dtype=np.int64)
+        entities[:self.count] = self.entities[:self.count]
+        self.entities = entities
+        self.objects.extend([None] * (size - len(self.objects)))
+
+
+class EntityRegistry:
+    """Entity ids and the component stores holding their data"""
+
+    def __init__(self):
+        self.stores = {name: ComponentStore(name, fields) for name, fields in COMPONENTS.items()}
+        self._next_id = 0
+        self._free = []  # Ids of destroyed entities, reused first
+
+    def __len__(self):
+        return self._next_id - len(self._free)
+
+    def create(self):
+        """
+        Allocate an entity id with no components.
+
+        Returns:
+            The new entity id
+        """
+        if self._free:
+            return self._free.pop()
+        entity = self._next_id
+        self._next_id += 1
+        return entity
+
+    def destroy(self, entity):
+        """
+        Remove every component of an entity and free its id.
+
+        Args:
+            entity: Entity id
+
+        Returns:
+            Dict of component name -> dict of its field values
+        """
+        removed = {}
+        for name, store in self.stores.items():
+            if store.has(entity):
+                removed[name] = store.remove(entity)
+        self._free.append(entity)
+        return removed
+
+    def clear(self):
+        """Destroy every entity"""
+        for store in self.stores.values():
+            store.clear()
+        self._next_id = 0
+        self._free = []
+
+
+class ComponentField:
+    """
+    Descriptor exposing one component field as a facade attribute.
+
+    Reads and writes go to the registry's store while the facade is
+    attached and has the component, and to the facade's own dict otherwise.
+    """
+
+    def __init__(self, component, field):
+        """
+        Initialize the descriptor.
+
+        Args:
+            component: Component name (e.g. VELOCITY)
+            field: Field of that component (e.g. 'speed')
+        """
+        self.key = (component, field)
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        registry = obj.registry
+        if registry is not None:
+            store = registry.stores[self.key[0]]
+            if store.has(obj.entity):
+                return store.get(obj.entity, self.key[1])
+        return obj._detached[self.key]
+
+    def __set__(self, obj, value):
+        registry = obj.registry
+        if registry is not None:
+            store = registry.stores[self.key[0]]
+            if store.has(obj.entity):
+                store.set(obj.entity, self.key[1], value)
+                return
+        obj._detached[self.key] = value
+
+
+class EntityFacade:
+    """
+    Mixin for sprites whose state lives in component stores.
+
+    Subclasses list their components in COMPONENTS and declare their
+    attributes with ComponentField. POSITION and SPRITE come from the
+    sprite's rect: the rect is the position while the facade is detached,
+    and is synced from the POSITION store while it is attached.
+    """
+
+    COMPONENTS = (POSITION, SPRITE)
+    registry = None
+    entity = None
+
+    def __init__(self):
+        self._detached = {}  # (component, field) -> value while not in the stores
+
+    def attach(self, registry, exclude=()):
+        """
+        Move the facade's state into a registry's stores.
+
+        Args:
+            registry: EntityRegistry to join
+            exclude: Components to leave out (their fields stay on the facade)
+        """
+        if self.registry is not None:
+            self.detach()
+        self.registry = registry
+        self.entity = entity = registry.create()
+        for name in self.COMPONENTS:
+            if name in exclude:
+                continue
+            if name == POSITION:
+                values = {'x': self.rect.x, 'y': self.rect.y}
+            elif name == SPRITE:
+                values = {'width': self.rect.width, 'height': self.rect.height}
+            else:
+                values = {field: self._detached.pop((name, field), 0) for field, _ in COMPONENTS[name]}
+            registry.stores[name].add(entity, values, self)
+
+    def detach(self):
+        """Move the facade's state out of its registry's stores"""
+        if self.registry is None:
+            return
+        removed = self.registry.destroy(self.entity)
+        self.registry = None
+        self.entity = None
+        for name, values in removed.items():
+            if name == POSITION:
+                self.rect.topleft = (values['x'], values['y'])
+            elif name != SPRITE:
+                for field, value in values.items():
+                    self._detached[(name, field)] = value
+
+    def store_rect(self):
+        """Copy the rect position into the POSITION store after moving the rect directly"""
+        if self.registry is not None:
+            position = self.registry.stores[POSITION]
+            position.set(self.entity, 'x', self.rect.x)
+            position.set(self.entity, 'y', self.rect.y)
+
+    def kill(self):
+        """Leave the registry and remove the sprite from all groups"""
+        self.detach()
+        super().kill()
+
+
+def zigzag_system(registry, steps=1):
+    """
+    Move every entity with a ZIGZAG component (enemies outside formations
+    and bosses): sideways by its speed, turning and dropping after a sweep
+    and bouncing off the screen edges.
+
+    Args:
+        registry: EntityRegistry to update
+        steps: Movement steps to take
+    """
+    zigzag = registry.stores[ZIGZAG]
+    n = len(zigzag)
+    if n == 0:
+        return
+    position = registry.stores[POSITION]
+    velocity = registry.stores[VELOCITY]
+    entities = zigzag.entities[:n]
+    position_rows = position.rows(entities)
+    velocity_rows = velocity.rows(entities)
+
+    x = position.columns['x'][position_rows]
+    y = position.columns['y'][position_rows]
+    speed = velocity.columns['speed'][velocity_rows]
+    direction = velocity.columns['direction'][velocity_rows]
+    counter = zigzag.column('counter')
+    sweep = zigzag.column('sweep')
+    drop = zigzag.column('drop')
+    max_x = zigzag.column('max_x')
+
+    for _ in range(steps):
+        x = round_position(x + direction * speed)
+        counter += 1
+        turn = np.abs(counter) > sweep
+        if turn.any():
+            direction[turn] *= -1
+            counter[turn] *= direction[turn]
+            y[turn] += drop[turn]
+        left = x < 0
+        x[left] = 0
+        direction[left] = 1
+        right = x > max_x
+        x[right] = max_x[right]
+        direction[right] = -1
+
+    position.columns['x'][position_rows] = x
+    position.columns['y'][position_rows] = y
+    velocity.columns['direction'][velocity_rows] = direction
+
+
+def sync_sprites(registry):
+    """
+    Copy the POSITION store into the rects of every attached sprite.
+
+    Args:
+        registry: EntityRegistry to sync
+    """
+    sprites = registry.stores[SPRITE]
+    n = len(sprites)
+    if n == 0:
+        return
+    position = registry.stores[POSITION]
+    rows = position.rows(sprites.entities[:n])
+    xs = position.columns['x'][rows].tolist()
+    ys = position.columns['y'][rows].tolist()
+    for sprite, x, y in zip(sprites.objects[:n], xs, ys):
+        sprite.rect.topleft = (x, y)
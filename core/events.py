@@ -0,0 +1,52 @@
+"""
+Event Bus for Galaxy Shooter
+
+A minimal publish/subscribe hub. The World announces every entity that
+enters or leaves play; levels, the fire scheduler and anything else
+interested subscribe to the (event, kind) pairs they care about instead
+of keeping their own copies of the entity groups.
+
+Design principles used:
+- Loose Coupling: Publishers do not know who listens
+- Single Source of Truth: Listeners react to changes instead of mirroring state
+"""
+
+# Events published by the World, with (kind, entity) arguments
+SPAWNED = "SPAWNED"
+KILLED = "KILLED"
+
+
+class EventBus:
+    """Routes published events to the handlers subscribed to them"""
+
+    def __init__(self):
+        self._handlers = {}  # (event, kind) -> list of handlers
+
+    def subscribe(self, event, kind, handler):
+        """
+        Call a handler whenever an event is published for a kind of entity.
+
+        Args:
+            event: Event name (e.g. SPAWNED)
+            kind: Entity kind (e.g. world.ENEMY)
+            handler: Callable taking the entity
+        """
+        self._handlers.setdefault((event, kind), []).append(handler)
+
+    def unsubscribe(self, event, kind, handler):
+        """Stop calling a handler (does nothing if it is not subscribed)"""
+        handlers = self._handlers.get((event, kind))
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+
+    def publish(self, event, kind, entity):
+        """
+        Notify every handler subscribed to an event for a kind of entity.
+
+        Args:
+            event: Event name
+            kind: Entity kind
+            entity: The entity the event is about
+        """
+        for handler in self._handlers.get((event, kind), ()):
+            handler(entity)
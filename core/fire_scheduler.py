@@ -0,0 +1,71 @@
+"""
+Enemy Fire Scheduler for Galaxy Shooter
+
+Regular enemies fire at random: once their shot delay has passed, every
+tick they shoot with a small fixed chance. Rolling that chance for every
+enemy on every tick costs O(enemies) even though almost no roll succeeds.
+
+The scheduler instead asks each enemy when its next shot will happen
+(drawn from the same distribution, see Enemy.next_shot_time()) and keeps
+those times in a min-heap. Each tick only the enemies that are due are
+popped, fired and pushed back with their following shot time, so a tick
+costs O(log n) per shot. Enemies that died in the meantime are simply
+skipped when they come up.
+
+Design principles used:
+- Single Responsibility: Only decides which enemies fire this tick
+- Performance: Work proportional to shots fired, not to enemies alive
+"""
+
+import heapq
+import itertools
+
+
+class FireScheduler:
+    """Min-heap of (next shot time, enemy) for the enemies in play"""
+
+    def __init__(self):
+        self._heap = []
+        self._order = itertools.count()  # Tie-breaker: enemies are not comparable
+
+    def __len__(self):
+        return len(self._heap)
+
+    def clear(self):
+        """Forget every scheduled shot"""
+        self._heap.clear()
+
+    def add(self, enemy):
+        """
+        Schedule the first shot of an enemy entering play.
+
+        Args:
+            enemy: Enemy with next_shot_time() and fire()
+        """
+        self._push(enemy)
+
+    def fire_due(self, now):
+        """
+        Fire every enemy whose shot is due.
+
+        Args:
+            now: Current game time in milliseconds
+
+        Returns:
+            List of the (x, y) centres of the bullets fired
+        """
+        heap = self._heap
+        bullets = []
+        while heap and heap[0][0] <= now:
+            enemy = heapq.heappop(heap)[2]
+            if not enemy.alive():
+                continue  # Killed since it was scheduled
+            bullets.append(enemy.fire(now))
+            self._push(enemy)
+        return bullets
+
+    def _push(self, enemy):
+        """Schedule an enemy's next shot (enemies that never shoot are dropped)"""
+        due = enemy.next_shot_time()
+        if due is not None:
+            heapq.heappush(self._heap, (due, next(self._order), enemy))
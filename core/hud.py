@@ -0,0 +1,53 @@
+"""
+HUD Widgets for Galaxy Shooter
+
+Drawing helpers for the in-game HUD that work from plain values rather
+than from game objects, so the HUD can be drawn from a render snapshot
+while the simulation runs on another thread.
+
+Design principles used:
+- Reusability: Bosses and the session HUD draw the same HP bar
+- Separation of Concerns: Widgets only draw the values they are given
+"""
+
+import pygame
+from core.text_cache import text_cache
+
+
+def draw_hp_bar(surface, x, y, width, height, current_hp, max_hp):
+    """
+    Draw an HP bar with its "current/max" label.
+
+    Args:
+        surface: Surface to draw on
+        x: X position of the HP bar
+        y: Y position of the HP bar
+        width: Width of the HP bar
+        height: Height of the HP bar
+        current_hp: Hit points left
+        max_hp: Hit points at full health
+
+    Returns:
+        Rect covering everything that was drawn
+    """
+    background_rect = pygame.Rect(x, y, width, height)
+    pygame.draw.rect(surface, (100, 20, 20), background_rect)
+
+    hp_percentage = current_hp / max_hp if max_hp > 0 else 0.0
+    hp_width = int(width * hp_percentage)
+
+    if hp_width > 0:
+        hp_rect = pygame.Rect(x, y, hp_width, height)
+        if hp_percentage > 0.6:
+            color = (50, 200, 50)
+        elif hp_percentage > 0.3:
+            color = (200, 200, 50)
+        else:
+            color = (200, 50, 50)
+        pygame.draw.rect(surface, color, hp_rect)
+
+    pygame.draw.rect(surface, (255, 255, 255), background_rect, 2)
+
+    hp_text = text_cache.render(f"{current_hp}/{max_hp}", (255, 255, 255), 24)
+    text_rect = hp_text.get_rect(center=(x + width // 2, y + height // 2))
+    return background_rect.union(surface.blit(hp_text, text_rect))
@@ -0,0 +1,193 @@
+"""
+Input Sources for Galaxy Shooter
+
+The gameplay step reads player input through a small Controls tuple
+instead of querying the keyboard directly. This lets the same game logic
+be driven by the keyboard, by a script, or by nothing at all (headless
+runs on machines without a display).
+
+Design principles used:
+- Abstraction: Gameplay code does not know where input comes from
+- Polymorphism: Every input source exposes the same poll() method
+"""
+
+from collections import namedtuple
+import pygame
+
+
+class Controls(namedtuple('Controls', ['left', 'right', 'fire'])):
+    """
+    Player input for a single simulation tick.
+
+    Attributes:
+        left: Move left is held
+        right: Move right is held
+        fire: Fire was pressed this tick
+    """
+    __slots__ = ()
+
+
+NO_INPUT = Controls(False, False, False)
+
+
+class NullInput:
+    """Input source that never presses anything"""
+
+    def poll(self):
+        """Return the controls for the next tick"""
+        return NO_INPUT
+
+
+class KeyboardInput:
+    """
+    Input source reading the real keyboard.
+
+    Movement keys are sampled when poll() is called. Fire is edge triggered:
+    the main loop calls press_fire() when it sees the SPACE key go down and
+    the press is reported by the next poll(). Presses and polls are
+    counted rather than latched in one flag, so a press is never lost when
+    poll() runs on the simulation thread (see core.sim_thread).
+    """
+
+    def __init__(self):
+        self._presses = 0
+        self._reported = 0
+
+    def press_fire(self):
+        """Latch a fire press for the next tick"""
+        self._presses += 1
+
+    def poll(self):
+        """Return the controls for the next tick"""
+        keys = pygame.key.get_pressed()
+        presses = self._presses
+        fire = presses != self._reported
+        self._reported = presses
+        return Controls(
+            keys[pygame.K_LEFT] or keys[pygame.K_a],
+            keys[pygame.K_RIGHT] or keys[pygame.K_d],
+            fire
+        )
+
+
+class ScriptedInput:
+    """
+    Input source replaying a fixed sequence of Controls.
+
+    When the sequence runs out it either starts over (loop=True) or keeps
+    returning NO_INPUT.
+    """
+
+    def __init__(self, frames, loop=True):
+        """
+        Initialize the scripted input.
+
+        Args:
+            frames: Sequence of Controls, one per tick
+            loop: Restart the sequence when it is exhausted
+        """
+        self.frames = list(frames)
+        self.loop = loop
+        self.position = 0
+
+    @classmethod
+    def sweep(cls, width=60):
+        """
+        Build a script that sweeps left and right while firing constantly.
+
+        Args:
+            width: Number of ticks spent moving in each direction
+        """
+        left = [Controls(True, False, True)] * width
+        right = [Controls(False, True, True)] * width
+        return cls(left + right)
+
+    def poll(self):
+        """Return the controls for the next tick"""
+        if self.position >= len(self.frames):
+            if not self.loop or not self.frames:
+                return NO_INPUT
+            self.position = 0
+        controls = self.frames[self.position]
+        self.position += 1
+        return controls
+
+
+class BotInput:
+    """
+    Input source playing the game on its own, for batch simulations.
+
+    Each tick the bot dodges enemy bullets falling towards the ship and
+    otherwise lines up under its target (the boss, or the lowest enemy,
+    which is the closest to invading) and keeps firing. It reads the
+    session's state but never changes it.
+    """
+
+    # How far above the ship (pixels) falling bullets are treated as a threat
+    LOOKAHEAD = 150
+
+    # Extra horizontal margin (pixels) around the ship when looking for threats
+    MARGIN = 12
+
+    def __init__(self, session):
+        """
+        Initialize the bot.
+
+        Args:
+            session: GameSession being played
+        """
+        self.session = session
+
+    def poll(self):
+        """Return the controls for the next tick"""
+        session = self.session
+        player = session.player
+        if player is None or not player.alive():
+            return NO_INPUT
+        ship = player.rect
+
+        threat_x = self._nearest_threat(ship)
+        if threat_x is not None:
+            # Step away from the threat, unless that runs into a wall
+            go_left = threat_x >= ship.centerx
+            if go_left and ship.left <= 0:
+                go_left = False
+            elif not go_left and ship.right >= session.screen_width:
+                go_left = True
+            return Controls(go_left, not go_left, True)
+
+        target = self._target()
+        if target is None:
+            return Controls(False, False, True)
+        dx = target.rect.centerx - ship.centerx
+        if abs(dx) <= player.speed:
+            return Controls(False, False, True)
+        return Controls(dx < 0, dx > 0, abs(dx) < target.rect.width // 2)
+
+    def _nearest_threat(self, ship):
+        """Get the x centre of the lowest enemy bullet about to hit the ship, if any"""
+        bullets = self.session.enemy_bullets
+        n = bullets.count
+        if n == 0:
+            return None
+        x = bullets.x[:n]
+        y = bullets.y[:n]
+        danger = ((x < ship.right + self.MARGIN) & (x + bullets.width > ship.left - self.MARGIN) &
+                  (y + bullets.height > ship.top - self.LOOKAHEAD) & (y < ship.bottom))
+        if not danger.any():
+            return None
+        lowest = y[danger].argmax()
+        return float(x[danger][lowest]) + bullets.width / 2
+
+    def _target(self):
+        """Get the sprite to line up under"""
+        session = self.session
+        level = session.current_level
+        boss = level.get_boss() if level else None
+        if boss and not boss.is_defeated():
+            return boss
+        lowest = None
+        for enemy in session.enemy_group:
+            if lowest is None or enemy.rect.bottom > lowest.rect.bottom:
+                lowest = enemy
+        return lowest
@@ -0,0 +1,188 @@
+"""
+Object Pools for Galaxy Shooter
+
+Short-lived sprites would otherwise be built for every use and thrown
+away. Pools keep a fixed number of pre-allocated instances around and
+hand them out again instead of building new ones, which keeps garbage
+collection out of busy boss fights. Bullets and explosions do not need
+pools any more: they are entries in NumPy arrays (core.bullet_engine,
+core.particles), not sprites.
+
+Design principles used:
+- Reusability: One pool implementation serves every short-lived sprite type
+- Encapsulation: Sprites return themselves to their pool when killed
+- Observability: Each pool counts hits, misses and peak use
+"""
+
+from abc import ABC, abstractmethod
+import pygame
+
+
+# Every pool that has been created, used for warm-up and statistics
+_pools = []
+
+
+class PooledSprite(pygame.sprite.Sprite, ABC):
+    """
+    Base class for sprites that can be recycled by an ObjectPool.
+
+    Subclasses must implement reset() with the same arguments as __init__
+    so a recycled instance can be put back into its initial state.
+    """
+
+    _pool = None
+    _in_pool = False
+
+    @abstractmethod
+    def reset(self, *args):
+        """
+        Restore the sprite to a freshly created state.
+        Must be implemented by subclasses.
+        """
+        pass
+
+    def kill(self):
+        """Remove the sprite from all groups and hand it back to its pool"""
+        pygame.sprite.Sprite.kill(self)
+        if self._pool is not None and not self._in_pool:
+            self._pool.release(self)
+
+
+class ObjectPool:
+    """
+    Fixed-capacity pool of reusable PooledSprite instances.
+
+    acquire() takes an instance from the free list (a hit) or builds a new
+    one when the free list is empty (a miss). Released instances go back to
+    the free list until it holds `capacity` instances; extras are dropped.
+    """
+
+    def __init__(self, factory, capacity, name=None):
+        """
+        Initialize the pool.
+
+        Args:
+            factory: Class (or callable) building a new instance from the acquire() arguments
+            capacity: Maximum number of idle instances kept for reuse
+            name: Name used in statistics (defaults to the factory name)
+        """
+        self.factory = factory
+        self.capacity = capacity
+        self.name = name or factory.__name__
+        self._free = []
+        self._warmed = False
+
+        self.hits = 0
+        self.misses = 0
+        self.in_use = 0
+        self.peak = 0
+
+        _pools.append(self)
+
+    def warm(self, *args):
+        """
+        Pre-allocate instances until the pool holds `capacity` idle ones.
+
+        Args:
+            *args: Arguments used to build the placeholder instances
+        """
+        args = args or (0, 0)
+        while len(self._free) < self.capacity:
+            obj = self.factory(*args)
+            obj._pool = self
+            obj._in_pool = True
+            self._free.append(obj)
+        self._warmed = True
+
+    def acquire(self, *args):
+        """
+        Get an instance initialised with the given arguments.
+
+        Args:
+            *args: Arguments passed to reset() (or to the factory on a miss)
+
+        Returns:
+            A sprite ready to be added to a group
+        """
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args)
+            self.hits += 1
+        else:
+            obj = self.factory(*args)
+            obj._pool = self
+            self.misses += 1
+        obj._in_pool = False
+
+        self.in_use += 1
+        if self.in_use > self.peak:
+            self.peak = self.in_use
+        return obj
+
+    def release(self, obj):
+        """
+        Return an instance to the pool.
+        Releasing an instance that is already in the pool does nothing.
+
+        Args:
+            obj: Instance previously returned by acquire()
+        """
+        if obj._in_pool:
+            return
+        obj._in_pool = True
+        self.in_use -= 1
+        if len(self._free) < self.capacity:
+            self._free.append(obj)
+
+    def idle_count(self):
+        """Get the number of idle instances ready for reuse"""
+        return len(self._free)
+
+    def reset_stats(self):
+        """Reset the hit, miss and peak counters"""
+        self.hits = 0
+        self.misses = 0
+        self.peak = self.in_use
+
+    def get_stats(self):
+        """
+        Get usage statistics for this pool.
+
+        Returns:
+            Dictionary with pool counters
+        """
+        return {
+            'name': self.name,
+            'capacity': self.capacity,
+            'idle': len(self._free),
+            'in_use': self.in_use,
+            'peak': self.peak,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+def warm_pools():
+    """Pre-allocate every pool. Call after the display mode has been set."""
+    for pool in _pools:
+        if not pool._warmed:
+            pool.warm()
+
+
+def release_group(group):
+    """
+    Empty a sprite group, returning pooled sprites to their pools.
+    Use this instead of group.empty() for groups holding pooled sprites.
+    """
+    for sprite in group.sprites():
+        sprite.kill()
+
+
+def get_pool_stats():
+    """
+    Get statistics for every pool.
+
+    Returns:
+        List of dictionaries, one per pool
+    """
+    return [pool.get_stats() for pool in _pools]
@@ -0,0 +1,256 @@
+"""
+Frame Profiler for Galaxy Shooter
+
+Measures where each frame's time goes. The game loop and GameSession call
+lap() at the end of every phase (event handling, shooting, collisions,
+...); the time since the previous lap is added to that phase. At the end
+of the frame the per-phase totals are stored in fixed-size ring buffers,
+optionally streamed to a CSV or JSONL file, and summarised by an
+on-screen overlay.
+
+When the profiler is disabled, lap() and the frame hooks are replaced by a
+function that does nothing, so the calls can stay in the game loop.
+Laps are only taken on the thread that runs the frames; calls from other
+threads (the simulation thread of the threaded mode) are ignored.
+
+Design principles used:
+- Single Responsibility: Only collects and reports timings
+- Performance: Preallocated ring buffers, no-op methods while disabled
+"""
+
+import json
+import threading
+import time
+from array import array
+import pygame
+from core.text_cache import fonts
+
+# Frame phases in the order the game loop runs them
+PHASES = ('events', 'shooting', 'collision', 'groups', 'level', 'draw', 'display')
+
+# Number of frames kept in the ring buffers
+DEFAULT_HISTORY = 300
+
+# Frames between refreshes of the overlay text
+OVERLAY_REFRESH_FRAMES = 25
+
+OVERLAY_FONT_SIZE = 20
+OVERLAY_COLOR = (0, 255, 0)
+OVERLAY_BACKGROUND = (0, 0, 0, 160)
+
+
+def _noop(*args):
+    """Stands in for the profiler hooks while profiling is off"""
+    pass
+
+
+class FrameProfiler:
+    """
+    Per-frame phase timings kept in ring buffers.
+
+    Usage per frame:
+        profiler.begin_frame()
+        ...; profiler.lap('events')
+        ...; profiler.lap('draw')
+        profiler.end_frame()
+
+    A phase that runs several times in one frame (one per simulation tick)
+    accumulates; a phase that does not run in a frame records 0.
+    """
+
+    def __init__(self, phases=PHASES, history=DEFAULT_HISTORY):
+        """
+        Initialize the profiler (disabled).
+
+        Args:
+            phases: Names of the phases passed to lap()
+            history: Number of frames kept in the ring buffers
+        """
+        self.phases = tuple(phases)
+        self.history = history
+        self._buffers = {phase: array('d', [0.0]) * history for phase in self.phases}
+        self._totals = array('d', [0.0]) * history
+        self._current = dict.fromkeys(self.phases, 0.0)
+        self._last = 0.0
+        self._frame_start = 0.0
+        self._thread = None  # Thread that runs the frames
+        self.frames = 0
+        self._log = None
+        self._log_csv = False
+
+        self.enabled = False
+        self.lap = _noop
+        self.begin_frame = _noop
+        self.end_frame = _noop
+
+    def set_enabled(self, enabled):
+        """
+        Turn profiling on or off. Turning it on starts a fresh history and
+        times the current frame from this point.
+
+        Args:
+            enabled: True to start collecting timings
+        """
+        self.enabled = enabled
+        if enabled:
+            self.reset()
+            self._begin_frame()
+            self.lap = self._lap
+            self.begin_frame = self._begin_frame
+            self.end_frame = self._end_frame
+        else:
+            self.lap = _noop
+            self.begin_frame = _noop
+            self.end_frame = _noop
+
+    def reset(self):
+        """Forget every recorded frame"""
+        self.frames = 0
+        for phase in self.phases:
+            self._current[phase] = 0.0
+
+    def open_log(self, path):
+        """
+        Stream every frame's timings to a file.
+
+        Args:
+            path: File path; a .csv extension writes CSV, anything else JSON lines
+        """
+        self.close_log()
+        self._log = open(path, 'w')
+        self._log_csv = path.endswith('.csv')
+        if self._log_csv:
+            self._log.write(','.join(('frame', 'total') + self.phases) + '\n')
+
+    def close_log(self):
+        """Stop streaming and close the log file"""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def _begin_frame(self):
+        self._thread = threading.get_ident()
+        now = time.perf_counter()
+        self._frame_start = now
+        self._last = now
+
+    def _lap(self, phase):
+        if threading.get_ident() != self._thread:
+            return
+        now = time.perf_counter()
+        self._current[phase] += now - self._last
+        self._last = now
+
+    def _end_frame(self):
+        current = self._current
+        slot = self.frames % self.history
+        total = (self._last - self._frame_start) * 1000
+        self._totals[slot] = total
+        for phase, buffer in self._buffers.items():
+            buffer[slot] = current[phase] * 1000
+            current[phase] = 0.0
+
+        if self._log is not None:
+            self._write_log(slot, total)
+        self.frames += 1
+
+    def _write_log(self, slot, total):
+        """Append the frame stored in a ring buffer slot to the log"""
+        values = [self._buffers[phase][slot] for phase in self.phases]
+        if self._log_csv:
+            row = [str(self.frames), f"{total:.4f}"] + [f"{value:.4f}" for value in values]
+            self._log.write(','.join(row) + '\n')
+        else:
+            record = {'frame': self.frames, 'total': round(total, 4)}
+            record.update((phase, round(value, 4)) for phase, value in zip(self.phases, values))
+            self._log.write(json.dumps(record) + '\n')
+
+    def latest(self):
+        """
+        Get the timings of the last completed frame.
+
+        Returns:
+            Dictionary of phase -> milliseconds, plus 'total'
+        """
+        if self.frames == 0:
+            return None
+        slot = (self.frames - 1) % self.history
+        timings = {phase: buffer[slot] for phase, buffer in self._buffers.items()}
+        timings['total'] = self._totals[slot]
+        return timings
+
+    def summary(self):
+        """
+        Get the mean and maximum of every phase over the kept frames.
+
+        Returns:
+            Dictionary of phase -> (mean ms, max ms), plus 'total'
+        """
+        count = min(self.frames, self.history)
+        if count == 0:
+            return {}
+        series = dict(self._buffers)
+        series['total'] = self._totals
+        return {name: (sum(values[:count]) / count, max(values[:count]))
+                for name, values in series.items()}
+
+
+class ProfilerOverlay:
+    """
+    Small text panel with the profiler's per-phase averages.
+
+    The panel is rendered into a cached surface and refreshed every few
+    frames, so drawing it costs one blit per frame.
+    """
+
+    def __init__(self, profiler, position=(5, 5)):
+        """
+        Initialize the overlay.
+
+        Args:
+            profiler: FrameProfiler to report on
+            position: Top-left corner of the panel on the screen
+        """
+        self.profiler = profiler
+        self.position = position
+        self._surface = None
+        self._rendered_frame = -OVERLAY_REFRESH_FRAMES
+
+    def draw(self, surface):
+        """
+        Draw the panel (only while the profiler is enabled).
+
+        Args:
+            surface: Surface to draw on
+
+        Returns:
+            List of the screen rects that were drawn to
+        """
+        profiler = self.profiler
+        if not profiler.enabled or profiler.frames == 0:
+            return []
+        age = profiler.frames - self._rendered_frame
+        if self._surface is None or not 0 <= age < OVERLAY_REFRESH_FRAMES:
+            self._surface = self._render()
+            self._rendered_frame = profiler.frames
+        return [surface.blit(self._surface, self.position)]
+
+    def _render(self):
+        """Render the current summary into a new panel surface"""
+        font = fonts.get(OVERLAY_FONT_SIZE)
+        summary = self.profiler.summary()
+        lines = [f"{name:<10}{mean:6.2f} avg {peak:6.2f} max"
+                 for name, (mean, peak) in summary.items()]
+        rendered = [font.render(line, True, OVERLAY_COLOR) for line in lines]
+
+        line_height = font.get_linesize()
+        width = max(text.get_width() for text in rendered) + 10
+        panel = pygame.Surface((width, line_height * len(rendered) + 10), pygame.SRCALPHA)
+        panel.fill(OVERLAY_BACKGROUND)
+        for i, text in enumerate(rendered):
+            panel.blit(text, (5, 5 + i * line_height))
+        return panel
+
+
+# Shared profiler used by the game loop and the game session
+frame_profiler = FrameProfiler()
@@ -0,0 +1,141 @@
+"""
+Adaptive Effects Quality for Galaxy Shooter
+
+When frames take longer than the frame budget (a level 5 boss fight with
+explosions everywhere), the cosmetic work is scaled down step by step:
+explosion animations skip frames and throw fewer sparks, the number of
+explosions on screen is capped and the HUD values are refreshed less often. When there is headroom
+again, quality comes back one level at a time.
+
+Two thresholds and a minimum time at each level give the controller
+hysteresis, so a frame time hovering around the budget does not make the
+quality flap back and forth.
+
+Only cosmetic effects read these settings; the simulation (movement,
+shooting, collisions, spawning) never does, so gameplay and replays are
+the same at every quality level.
+
+Design principles used:
+- Single Responsibility: Only decides how much cosmetic work to do
+- Separation of Concerns: Effects read the settings, the game loop feeds frame times
+"""
+
+from collections import namedtuple
+
+
+class QualitySettings(namedtuple('QualitySettings', ['explosion_frame_step', 'max_explosions', 'hud_interval'])):
+    """
+    Cosmetic settings of one quality level.
+
+    Attributes:
+        explosion_frame_step: Explosion animation frames advanced at a time (1: every frame
+                              shown); explosions also throw this many times fewer sparks
+        max_explosions: Explosions on screen at most; the oldest is retired for a new one
+        hud_interval: Frames between refreshes of the values the HUD shows (1: every frame)
+    """
+    __slots__ = ()
+
+
+# Quality levels from full to lowest
+QUALITY_LEVELS = (
+    QualitySettings(explosion_frame_step=1, max_explosions=32, hud_interval=1),
+    QualitySettings(explosion_frame_step=2, max_explosions=16, hud_interval=2),
+    QualitySettings(explosion_frame_step=3, max_explosions=8, hud_interval=4),
+    QualitySettings(explosion_frame_step=4, max_explosions=4, hud_interval=8),
+)
+
+# Frame time (fraction of the budget) above which quality is lowered...
+DEGRADE_RATIO = 0.9
+
+# ...and below which it is raised again
+RESTORE_RATIO = 0.6
+
+# Frames the smoothed frame time must stay past a threshold before the level
+# changes; quality is lowered quickly and raised slowly
+DEGRADE_FRAMES = 10
+RESTORE_FRAMES = 120
+
+# Weight of the newest frame in the smoothed frame time
+SMOOTHING = 0.1
+
+# Longest frame counted, as a multiple of the budget, so a one-off stall
+# (loading a level) cannot lower the quality on its own
+MAX_FRAME_RATIO = 4.0
+
+
+class QualityController:
+    """
+    Chooses the effects quality level from recent frame times.
+
+    Usage per frame:
+        controller.update(clock.get_rawtime())
+        ... effects read controller.settings ...
+
+    Until update() is called the controller stays at full quality, so
+    headless runs and benchmarks are unaffected.
+    """
+
+    def __init__(self, budget_ms=20.0, levels=QUALITY_LEVELS):
+        """
+        Initialize the controller at full quality.
+
+        Args:
+            budget_ms: Milliseconds of work allowed per frame
+            levels: QualitySettings from full to lowest quality
+        """
+        self.budget_ms = budget_ms
+        self.levels = levels
+        self.level = 0
+        self.settings = levels[0]
+        self.frame_ms = 0.0  # Smoothed frame time
+        self._over = 0  # Consecutive frames above the degrade threshold
+        self._under = 0  # Consecutive frames below the restore threshold
+        self.changes = 0
+
+    def reset(self):
+        """Go back to full quality and forget the frame history"""
+        self._set_level(0)
+        self.frame_ms = 0.0
+        self.changes = 0
+
+    def update(self, frame_ms):
+        """
+        Record the duration of a frame and adjust the quality level.
+
+        Args:
+            frame_ms: Milliseconds the frame took, without the time spent
+                      waiting for the frame rate cap (Clock.get_rawtime())
+
+        Returns:
+            The current quality level (0 is full quality)
+        """
+        frame_ms = min(frame_ms, self.budget_ms * MAX_FRAME_RATIO)
+        self.frame_ms += (frame_ms - self.frame_ms) * SMOOTHING
+        if self.frame_ms > self.budget_ms * DEGRADE_RATIO:
+            self._over += 1
+            self._under = 0
+            if self._over >= DEGRADE_FRAMES and self.level < len(self.levels) - 1:
+                self._set_level(self.level + 1)
+        elif self.frame_ms < self.budget_ms * RESTORE_RATIO:
+            self._under += 1
+            self._over = 0
+            if self._under >= RESTORE_FRAMES and self.level > 0:
+                self._set_level(self.level - 1)
+        else:
+            # Between the thresholds: keep the current level
+            self._over = 0
+            self._under = 0
+        return self.level
+
+    def _set_level(self, level):
+        """Switch to a quality level and restart the dwell counters"""
+        if level != self.level:
+            self.changes += 1
+        self.level = level
+        self.settings = self.levels[level]
+        self._over = 0
+        self._under = 0
+
+
+# Shared by the game loop (which feeds it) and the effects (which read it)
+effects_quality = QualityController()
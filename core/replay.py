@@ -0,0 +1,189 @@
+"""
+Replays for Galaxy Shooter
+
+A replay stores everything needed to re-run a play session exactly: for
+every run of a level (a segment) the level index, the RNG seed and the
+Controls of every tick. Because gameplay only depends on those (game time
+comes from the simulation clock and randomness from the seeded game RNG),
+feeding a replay back into GameSession reproduces the original session.
+
+File format (little endian):
+    header:   b"GSRP", version (u8), segment count (u32)
+    segment:  level index (u8), seed (u64), tick count (u32), run count (u32),
+              runs of (controls bitmask (u8), length (u16))
+
+Controls are packed into a bitmask and consecutive equal ticks are stored
+as one run, so long stretches of holding a key cost three bytes. Pausing
+is not part of the controls: the game loop simply stops ticking while the
+game is paused.
+
+Design principles used:
+- Single Responsibility: Only records, stores and plays back input
+- Polymorphism: ReplayInput is an input source like KeyboardInput
+"""
+
+import struct
+from core.input import Controls, NO_INPUT
+
+MAGIC = b"GSRP"
+VERSION = 1
+
+# Controls bitmask
+LEFT = 1
+RIGHT = 2
+FIRE = 4
+
+# Longest run stored in one record; longer runs are split
+MAX_RUN = 0xFFFF
+
+_HEADER = struct.Struct('<4sBI')
+_SEGMENT = struct.Struct('<BQII')
+_RUN = struct.Struct('<BH')
+
+
+def encode_controls(controls):
+    """Pack Controls into a bitmask"""
+    return (LEFT if controls.left else 0) | (RIGHT if controls.right else 0) | (FIRE if controls.fire else 0)
+
+
+def decode_controls(mask):
+    """Unpack a bitmask into Controls"""
+    return Controls(bool(mask & LEFT), bool(mask & RIGHT), bool(mask & FIRE))
+
+
+class ReplaySegment:
+    """Input of one run of a level, stored as (bitmask, length) runs"""
+
+    def __init__(self, level_index, seed, runs=None):
+        """
+        Initialize the segment.
+
+        Args:
+            level_index: Index of the level played (0 = Level 1)
+            seed: Seed of the game RNG for this run
+            runs: List of [bitmask, length] runs
+        """
+        self.level_index = level_index
+        self.seed = seed
+        self.runs = runs if runs is not None else []
+        self.ticks = sum(length for _, length in self.runs)
+
+    def append(self, controls):
+        """Add the controls of the next tick"""
+        mask = encode_controls(controls)
+        runs = self.runs
+        if runs and runs[-1][0] == mask and runs[-1][1] < MAX_RUN:
+            runs[-1][1] += 1
+        else:
+            runs.append([mask, 1])
+        self.ticks += 1
+
+    def controls(self):
+        """Iterate over the Controls of every tick"""
+        for mask, length in self.runs:
+            controls = decode_controls(mask)
+            for _ in range(length):
+                yield controls
+
+
+class Replay:
+    """A recorded play session: a list of ReplaySegments"""
+
+    def __init__(self, segments=None):
+        self.segments = segments if segments is not None else []
+
+    def save(self, path):
+        """
+        Write the replay to a file.
+
+        Args:
+            path: Destination file path
+        """
+        parts = [_HEADER.pack(MAGIC, VERSION, len(self.segments))]
+        for segment in self.segments:
+            parts.append(_SEGMENT.pack(segment.level_index, segment.seed,
+                                       segment.ticks, len(segment.runs)))
+            parts.extend(_RUN.pack(mask, length) for mask, length in segment.runs)
+        with open(path, 'wb') as f:
+            f.write(b''.join(parts))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a replay file.
+
+        Args:
+            path: Replay file path
+
+        Returns:
+            Replay instance
+
+        Raises:
+            ValueError: If the file is not a replay or uses an unknown version
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        magic, version, segment_count = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a replay file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported replay version {version} in {path}")
+
+        offset = _HEADER.size
+        segments = []
+        for _ in range(segment_count):
+            level_index, seed, ticks, run_count = _SEGMENT.unpack_from(data, offset)
+            offset += _SEGMENT.size
+            runs = [list(run) for run in _RUN.iter_unpack(data[offset:offset + run_count * _RUN.size])]
+            offset += run_count * _RUN.size
+            segment = ReplaySegment(level_index, seed, runs)
+            if segment.ticks != ticks:
+                raise ValueError(f"Corrupt replay segment in {path}")
+            segments.append(segment)
+        return cls(segments)
+
+
+class ReplayRecorder:
+    """
+    Records a GameSession into a Replay.
+
+    Attach it as the session's `recorder`: GameSession.start() opens a new
+    segment and GameSession.step() records every tick's controls.
+    """
+
+    def __init__(self):
+        self.replay = Replay()
+        self._segment = None
+
+    def begin_segment(self, level_index, seed):
+        """Start recording a new run of a level"""
+        self._segment = ReplaySegment(level_index, seed)
+        self.replay.segments.append(self._segment)
+
+    def record(self, controls):
+        """Record the controls of one tick"""
+        if self._segment is not None:
+            self._segment.append(controls)
+
+    def save(self, path):
+        """Write everything recorded so far to a file"""
+        self.replay.save(path)
+
+
+class ReplayInput:
+    """Input source playing back one replay segment (NO_INPUT once it ends)"""
+
+    def __init__(self, segment):
+        """
+        Initialize the replay input.
+
+        Args:
+            segment: ReplaySegment to play back
+        """
+        self.segment = segment
+        self._controls = segment.controls()
+
+    def poll(self):
+        """Return the controls for the next tick"""
+        return next(self._controls, NO_INPUT)
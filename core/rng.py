@@ -0,0 +1,27 @@
+"""
+Gameplay Random Numbers for Galaxy Shooter
+
+Every gameplay decision that uses randomness (enemy looks, shot delays,
+shot chances, boss fire timing) draws from one shared random.Random
+instance instead of the global random module. GameSession seeds it at the
+start of every run, so a run is fully determined by its seed, its level
+and the player's input, and can be replayed exactly.
+"""
+
+import random
+
+# Seeds are stored in replays as unsigned 64-bit integers
+SEED_BITS = 64
+
+# Shared generator used by every entity
+game_rng = random.Random()
+
+
+def new_seed():
+    """
+    Pick a fresh seed for a run.
+
+    Returns:
+        Random non-negative integer that fits in SEED_BITS bits
+    """
+    return random.getrandbits(SEED_BITS)
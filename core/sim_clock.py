@@ -0,0 +1,89 @@
+"""
+Simulation Clock for Galaxy Shooter
+
+Gameplay timers (shot delays, fire rates) read time from this clock
+instead of pygame.time.get_ticks(). The clock only moves when the
+simulation steps, one fixed tick at a time, so gameplay runs the same
+whether frames are rendered at 30, 50 or 144 Hz, or not at all.
+"""
+
+# Milliseconds of game time per simulation tick (50 ticks per second)
+TICK_MS = 20
+
+# Longest real frame fed into the accumulator; protects against a
+# spiral of catch-up ticks after a stall (window drag, breakpoint, ...)
+MAX_FRAME_MS = 250
+
+
+class SimClock:
+    """Game time in milliseconds, advanced by the simulation step"""
+
+    def __init__(self):
+        self.time_ms = 0
+
+    def now(self):
+        """Get the current game time in milliseconds"""
+        return self.time_ms
+
+    def advance(self, dt):
+        """
+        Move game time forward.
+
+        Args:
+            dt: Milliseconds to advance
+        """
+        self.time_ms += dt
+
+    def reset(self, time_ms=0):
+        """Set game time back to a known value (at the start of a run)"""
+        self.time_ms = time_ms
+
+
+class FixedStepAccumulator:
+    """
+    Turns variable real frame times into a whole number of fixed ticks.
+
+    Each frame, add() the real elapsed time and run one simulation tick for
+    every tick consume() grants. alpha() tells the renderer how far the
+    leftover time is into the next tick, for interpolation.
+    """
+
+    def __init__(self, step_ms=TICK_MS, max_frame_ms=MAX_FRAME_MS):
+        """
+        Initialize the accumulator.
+
+        Args:
+            step_ms: Length of one simulation tick in milliseconds
+            max_frame_ms: Largest frame time accepted in one add() call
+        """
+        self.step_ms = step_ms
+        self.max_frame_ms = max_frame_ms
+        self.accumulated = 0
+
+    def add(self, frame_ms):
+        """Add real elapsed time for this frame"""
+        self.accumulated += min(frame_ms, self.max_frame_ms)
+
+    def consume(self):
+        """
+        Take one tick's worth of time if enough has accumulated.
+
+        Returns:
+            True if a simulation tick should run
+        """
+        if self.accumulated >= self.step_ms:
+            self.accumulated -= self.step_ms
+            return True
+        return False
+
+    def alpha(self):
+        """Get the fraction (0.0-1.0) of the next tick already elapsed"""
+        return self.accumulated / self.step_ms
+
+    def reset(self):
+        """Drop any accumulated time (when the simulation is not running)"""
+        self.accumulated = 0
+
+
+# Shared clock read by every entity
+sim_clock = SimClock()
@@ -0,0 +1,196 @@
+"""
+Simulation Thread for Galaxy Shooter
+
+In the threaded mode the game logic runs on a worker thread at the fixed
+tick rate while the main thread only draws. After every tick the worker
+publishes a RenderSnapshot (see core.snapshot); the main thread draws the
+latest one, interpolating from the previous tick by how long ago it was
+published. pygame releases the GIL while it blits and flips the display,
+so on a multicore machine drawing a frame overlaps the next ticks instead
+of delaying them.
+
+Every tick the worker builds a new immutable snapshot while the renderer
+draws the published one, then publishes it by replacing the reference
+under a lock, so the renderer never sees a half-built one.
+
+The session is only touched by the worker while the thread runs. Before
+the main thread uses the session itself (menus, restarts) it calls
+pause(), which returns once the worker is between ticks. The worker also
+pauses itself when a tick ends the game or completes the level.
+
+Design principles used:
+- Separation of Concerns: Simulation on one thread, rendering on another
+- Immutability: Threads share nothing but published snapshots
+- Determinism: The same fixed ticks run as in the single-threaded loop
+"""
+
+import threading
+import time
+from core.sim_clock import TICK_MS, MAX_FRAME_MS
+
+
+class SimulationThread:
+    """
+    Steps a GameSession on a worker thread and publishes render snapshots.
+
+    Usage:
+        simulation = SimulationThread(session, keyboard)
+        simulation.start()          # After session.start(), starts paused
+        simulation.resume()
+        each frame:
+            outcome = simulation.take_outcome()
+            snapshot, alpha = simulation.latest()
+            snapshot.draw(screen, alpha)
+        simulation.pause()          # Before touching the session directly
+        simulation.stop()
+    """
+
+    def __init__(self, session, input_source, step_ms=TICK_MS, max_lag_ms=MAX_FRAME_MS):
+        """
+        Initialize the thread (not started).
+
+        Args:
+            session: GameSession to step
+            input_source: Input source polled once per tick, on the worker
+            step_ms: Length of one simulation tick in milliseconds
+            max_lag_ms: Game time the worker catches up on at most after
+                        falling behind; beyond that, ticks are skipped
+        """
+        self.session = session
+        self.input_source = input_source
+        self.step_ms = step_ms
+        self.max_lag_ms = max_lag_ms
+
+        self._condition = threading.Condition()
+        self._thread = None
+        self._paused = True
+        self._stopped = False
+        self._stepping = False  # A tick is in progress
+        self._outcome = None  # Outcome of the tick that paused the worker
+
+        # Published snapshot and when it was published
+        self._front = None
+        self._front_time = 0.0
+        self.ticks = 0
+
+    @property
+    def running(self):
+        """Whether the worker is stepping the session"""
+        return not self._paused
+
+    def start(self):
+        """Start the worker thread, paused"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+            self._thread.start()
+
+    def resume(self):
+        """
+        Let the worker step the session from now on.
+
+        Does nothing while an outcome is waiting to be taken: the worker
+        stays paused on it until take_outcome() hands it over.
+        """
+        with self._condition:
+            if not self._paused or self._outcome is not None:
+                return
+            self._paused = False
+            self._publish(self.session.snapshot())
+            self._condition.notify_all()
+
+    def pause(self):
+        """Stop stepping; returns once no tick is in progress"""
+        with self._condition:
+            self._paused = True
+            while self._stepping:
+                self._condition.wait()
+
+    def stop(self):
+        """Stop and join the worker thread"""
+        with self._condition:
+            self._stopped = True
+            self._paused = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def take_outcome(self):
+        """
+        Get the outcome (GAME_OVER or LEVEL_COMPLETE) that paused the
+        worker, once. Call it after pause() and before restarting the
+        session, so an outcome of the old game is not reported later.
+
+        Returns:
+            The outcome, or None if play continues
+        """
+        with self._condition:
+            outcome = self._outcome
+            self._outcome = None
+            return outcome
+
+    def latest(self):
+        """
+        Get the snapshot to draw and how far into the next tick it is.
+
+        Returns:
+            (RenderSnapshot or None, alpha between 0.0 and 1.0)
+        """
+        with self._condition:
+            snapshot = self._front
+            published = self._front_time
+            paused = self._paused
+        if paused:
+            return snapshot, 1.0
+        alpha = (time.perf_counter() - published) * 1000 / self.step_ms
+        return snapshot, min(alpha, 1.0)
+
+    def _publish(self, snapshot):
+        """Make a snapshot the one drawn (called with the condition held)"""
+        self._front = snapshot
+        self._front_time = time.perf_counter()
+
+    def _run(self):
+        """Worker loop: one session step per tick of real time"""
+        step_s = self.step_ms / 1000
+        next_tick = time.perf_counter()
+        while True:
+            with self._condition:
+                while self._paused and not self._stopped:
+                    self._condition.wait()
+                    next_tick = time.perf_counter() + step_s
+                if self._stopped:
+                    return
+
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif -delay * 1000 > self.max_lag_ms:
+                # Too far behind (the machine stalled): drop the backlog
+                next_tick = time.perf_counter()
+
+            with self._condition:
+                if self._paused:
+                    continue
+                self._stepping = True
+            try:
+                outcome = self.session.step(self.input_source.poll(), self.step_ms)
+                # Built outside the lock; the renderer keeps the published one
+                snapshot = self.session.snapshot()
+            except BaseException:
+                with self._condition:
+                    self._stepping = False
+                    self._condition.notify_all()
+                raise
+            next_tick += step_s
+
+            with self._condition:
+                # Published before pause() can return, so a paused thread
+                # never publishes a tick of a session that was restarted since
+                self._stepping = False
+                self.ticks += 1
+                self._publish(snapshot)
+                if outcome is not None:
+                    self._outcome = outcome
+                    self._paused = True
+                self._condition.notify_all()
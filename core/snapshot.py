@@ -0,0 +1,111 @@
+"""
+Render Snapshots for Galaxy Shooter
+
+A RenderSnapshot is everything needed to draw one simulation tick: for
+each layer (player, bullets, enemies, effects, boss) the images and the
+positions of this tick and of the tick before, plus the values the HUD
+shows. It holds no references to live game objects, so one thread can
+draw it while another thread is already advancing the simulation.
+
+Design principles used:
+- Immutability: Snapshots are never changed after they are built
+- Separation of Concerns: Building (simulation side) and drawing (render side) are separate
+"""
+
+from collections import namedtuple
+import numpy as np
+
+
+class RenderLayer(namedtuple('RenderLayer', ['images', 'x', 'y', 'previous_x', 'previous_y'])):
+    """
+    Items drawn together, in order.
+
+    Attributes:
+        images: One Surface shared by every item, or a sequence with one Surface per item
+        x: NumPy array of the items' top-left x this tick
+        y: NumPy array of the items' top-left y this tick
+        previous_x: NumPy array of the top-left x one tick earlier
+        previous_y: NumPy array of the top-left y one tick earlier
+    """
+    __slots__ = ()
+
+    def __len__(self):
+        return len(self.x)
+
+
+class HudState(namedtuple('HudState', ['level_number', 'level_name', 'boss_name', 'boss_hp', 'boss_max_hp',
+                                       'enemies', 'total_enemies'])):
+    """
+    Values shown by the HUD.
+
+    Attributes:
+        level_number: Number of the level being played
+        level_name: Name of the level
+        boss_name: Name of the live boss (None without one)
+        boss_hp: Boss hit points left
+        boss_max_hp: Boss hit points at full health
+        enemies: Enemies alive (None once the boss has appeared)
+        total_enemies: Enemies in the whole level
+    """
+    __slots__ = ()
+
+
+class RenderSnapshot(namedtuple('RenderSnapshot', ['layers', 'hud', 'tick'])):
+    """
+    One simulation tick, ready to be drawn.
+
+    Attributes:
+        layers: Tuple of RenderLayers in drawing order
+        hud: HudState, or None when there is no level
+        tick: Simulation tick the snapshot was taken after
+    """
+    __slots__ = ()
+
+    def draw(self, surface, alpha=1.0):
+        """
+        Draw every layer.
+
+        Args:
+            surface: Surface to draw on
+            alpha: Fraction of the next tick elapsed; positions are
+                   interpolated from the previous tick (1.0 = this tick)
+
+        Returns:
+            List of the screen rects that were drawn to
+        """
+        rects = []
+        for layer in self.layers:
+            rects += draw_layer(surface, layer, alpha)
+        return rects
+
+
+def draw_layer(surface, layer, alpha=1.0):
+    """
+    Draw the items of one layer.
+
+    Args:
+        surface: Surface to draw on
+        layer: RenderLayer to draw
+        alpha: Fraction of the next tick elapsed (1.0 = the layer's own tick)
+
+    Returns:
+        List of the screen rects that were drawn to
+    """
+    if not len(layer):
+        return []
+    if alpha >= 1.0:
+        xs = layer.x.tolist()
+        ys = layer.y.tolist()
+    else:
+        xs = (layer.previous_x + (layer.x - layer.previous_x) * alpha).tolist()
+        ys = (layer.previous_y + (layer.y - layer.previous_y) * alpha).tolist()
+    images = layer.images
+    if isinstance(images, (list, tuple)):
+        return surface.blits(list(zip(images, zip(xs, ys))))
+    return surface.blits([(images, position) for position in zip(xs, ys)])
+
+
+def empty_layer():
+    """Get a layer with no items"""
+    empty = np.zeros(0, dtype=np.float64)
+    return RenderLayer((), empty, empty, empty, empty)
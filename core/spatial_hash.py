@@ -0,0 +1,178 @@
+"""
+Spatial Hash for Galaxy Shooter
+
+A uniform grid over the playfield used as a collision broadphase. Sprites
+are bucketed into the grid cells their rect overlaps, so a collision query
+only has to test the few sprites sharing cells with the query rect instead
+of every sprite in a group.
+
+Design principles used:
+- Single Responsibility: Only answers "what is near this rect?"
+- Performance: Queries cost O(sprites nearby), not O(sprites in group)
+"""
+
+import numpy as np
+
+# Default edge length of a grid cell in pixels (about one enemy wide)
+DEFAULT_CELL_SIZE = 64
+
+
+class SpatialHash:
+    """
+    Uniform grid of buckets covering a fixed-size playfield.
+
+    The grid is rebuilt once per tick with rebuild(). Rects that stick out of
+    the playfield are clamped into the border cells, so sprites slightly off
+    screen can still be found.
+    """
+
+    def __init__(self, width, height, cell_size=DEFAULT_CELL_SIZE):
+        """
+        Initialize the grid.
+
+        Args:
+            width: Playfield width in pixels
+            height: Playfield height in pixels
+            cell_size: Edge length of a grid cell in pixels
+        """
+        self.cell_size = cell_size
+        self.columns = max(1, -(-width // cell_size))
+        self.rows = max(1, -(-height // cell_size))
+        self._cells = [[] for _ in range(self.columns * self.rows)]
+        self._occupied = []
+        self.sprites = []  # Every sprite in insertion order
+        self._rank = {}  # Sprite -> index in `sprites`
+        self.count = 0
+
+    def clear(self):
+        """Remove every sprite from the grid"""
+        cells = self._cells
+        for index in self._occupied:
+            cells[index].clear()
+        self._occupied.clear()
+        self.sprites.clear()
+        self._rank.clear()
+        self.count = 0
+
+    def insert(self, sprite):
+        """
+        Add a sprite to every cell its rect overlaps.
+
+        Args:
+            sprite: Object with a pygame Rect in `rect`
+        """
+        cells = self._cells
+        occupied = self._occupied
+        columns = self.columns
+        x0, y0, x1, y1 = self._cell_span(sprite.rect)
+        for row in range(y0, y1 + 1):
+            base = row * columns
+            for column in range(x0, x1 + 1):
+                cell = cells[base + column]
+                if not cell:
+                    occupied.append(base + column)
+                cell.append(sprite)
+        self._rank[sprite] = self.count
+        self.sprites.append(sprite)
+        self.count += 1
+
+    def rebuild(self, sprites):
+        """
+        Replace the grid contents with the given sprites.
+
+        Args:
+            sprites: Iterable of sprites (e.g. a sprite group)
+        """
+        self.clear()
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def query(self, rect):
+        """
+        Get the sprites sharing at least one cell with a rect.
+
+        Args:
+            rect: pygame Rect to look around
+
+        Returns:
+            List of candidate sprites, without duplicates
+        """
+        return self.query_span(*self._cell_span(rect))
+
+    def query_span(self, x0, y0, x1, y1):
+        """
+        Get the sprites in a block of cells.
+
+        Args:
+            x0, y0: First column and row
+            x1, y1: Last column and row
+
+        Returns:
+            List of candidate sprites, without duplicates
+        """
+        cells = self._cells
+        columns = self.columns
+        if x0 == x1 and y0 == y1:
+            return list(cells[y0 * columns + x0])
+
+        found = {}
+        for row in range(y0, y1 + 1):
+            base = row * columns
+            for column in range(x0, x1 + 1):
+                for sprite in cells[base + column]:
+                    found[sprite] = None
+        return list(found)
+
+    def collide(self, rect):
+        """
+        Get the live sprites whose rect overlaps a rect.
+
+        Sprites killed since the grid was built are skipped.
+
+        Args:
+            rect: pygame Rect to test against
+
+        Returns:
+            List of colliding sprites
+        """
+        return [sprite for sprite in self.query(rect)
+                if sprite.rect.colliderect(rect) and sprite.alive()]
+
+    def rank(self, sprite):
+        """Get the insertion index of a sprite (its index in `sprites`)"""
+        return self._rank[sprite]
+
+    def cell_spans(self, left, top, width, height):
+        """
+        Get the cells covered by many boxes at once.
+
+        Args:
+            left: NumPy array of box left edges (may be fractional)
+            top: NumPy array of box top edges
+            width: Width shared by every box
+            height: Height shared by every box
+
+        Returns:
+            Integer array with one (first column, first row, last column,
+            last row) row per box
+        """
+        size = self.cell_size
+        left = np.floor(left)
+        top = np.floor(top)
+        spans = np.empty((len(left), 4), dtype=np.int64)
+        spans[:, 0] = np.clip(left // size, 0, self.columns - 1)
+        spans[:, 1] = np.clip(top // size, 0, self.rows - 1)
+        spans[:, 2] = np.clip((np.ceil(left + width) - 1) // size, 0, self.columns - 1)
+        spans[:, 3] = np.clip((np.ceil(top + height) - 1) // size, 0, self.rows - 1)
+        return spans
+
+    def _cell_span(self, rect):
+        """Get the (first column, first row, last column, last row) a rect covers"""
+        size = self.cell_size
+        last_column = self.columns - 1
+        last_row = self.rows - 1
+        x0 = min(max(rect.left // size, 0), last_column)
+        y0 = min(max(rect.top // size, 0), last_row)
+        x1 = min(max((rect.right - 1) // size, 0), last_column)
+        y1 = min(max((rect.bottom - 1) // size, 0), last_row)
+        return x0, y0, x1, y1
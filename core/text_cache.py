@@ -0,0 +1,108 @@
+"""
+Text Cache for Galaxy Shooter
+
+Fonts are created once and shared through a registry, and rendered text
+surfaces are kept in a least-recently-used cache. HUD labels and menu
+options are drawn every frame but rarely change, so a string is only
+rasterised again when its content (or color) actually changes.
+
+Design principles used:
+- Single Responsibility: Only creates fonts and renders text
+- Reusability: HUD, boss HP bar and every menu share the same fonts
+- Performance: Unchanged text costs a dictionary lookup, not a render
+"""
+
+from collections import OrderedDict
+import pygame
+
+# Default number of rendered strings kept around
+DEFAULT_MAX_ENTRIES = 256
+
+
+class FontRegistry:
+    """Creates each (font file, size) combination once and shares it"""
+
+    def __init__(self):
+        self._fonts = {}
+
+    def get(self, size, name=None):
+        """
+        Get a shared font.
+
+        Args:
+            size: Font size in pixels
+            name: Font file path (None = pygame's default font)
+
+        Returns:
+            pygame Font instance
+        """
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(name, size)
+            self._fonts[key] = font
+        return font
+
+    def clear(self):
+        """Drop every font (e.g. after pygame.font.quit())"""
+        self._fonts.clear()
+
+
+class TextCache:
+    """
+    LRU cache of rendered text surfaces.
+
+    Entries are keyed by font, text, color and antialias setting. Surfaces
+    returned by the cache are shared and must not be modified.
+    """
+
+    def __init__(self, fonts, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the text cache.
+
+        Args:
+            fonts: FontRegistry used to look up fonts
+            max_entries: Number of rendered strings to keep
+        """
+        self.fonts = fonts
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text, color, size, antialias=True, font_name=None):
+        """
+        Get a surface with rendered text, rendering it only if not cached.
+
+        Args:
+            text: String to render
+            color: RGB color tuple
+            size: Font size in pixels
+            antialias: Render with antialiasing
+            font_name: Font file path (None = pygame's default font)
+
+        Returns:
+            pygame Surface with the rendered text
+        """
+        key = (font_name, size, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.fonts.get(size, font_name).render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Drop every cached surface"""
+        self._surfaces.clear()
+
+
+# Shared registry and cache used by the HUD and the menus
+fonts = FontRegistry()
+text_cache = TextCache(fonts)
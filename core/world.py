@@ -0,0 +1,128 @@
+"""
+Entity World for Galaxy Shooter
+
+The World is the one place that owns every live entity of a run, grouped
+by kind (player, enemies, bosses). Entities enter play with
+spawn() and leave it with kill(); both are announced on the World's event
+bus, so levels and other systems follow along without holding parallel
+groups of their own. update() steps every entity exactly once per tick.
+
+The ships' gameplay state lives in the World's EntityRegistry (see
+core.ecs): spawn() attaches their facades to it and killing them detaches
+them. Enemies that belong to a Formation are moved by it; every other
+enemy and the bosses are moved together by the zig-zag system, so no
+enemy is moved twice.
+
+Design principles used:
+- Single Source of Truth: One group per kind, shared by everyone
+- Loose Coupling: Interested parties subscribe to spawn and kill events
+- Performance: Each entity is updated once per tick, in bulk where possible
+"""
+
+import pygame
+from core.ecs import EntityRegistry, EntityFacade, ZIGZAG, MOVE_STEPS_PER_TICK, zigzag_system, sync_sprites
+from core.events import EventBus, SPAWNED, KILLED
+from core.pool import release_group
+
+# Entity kinds
+PLAYER = "player"
+ENEMY = "enemy"
+BOSS = "boss"
+
+KINDS = (PLAYER, ENEMY, BOSS)
+
+
+class World:
+    """Registry of every live entity, keyed by kind"""
+
+    def __init__(self):
+        self.events = EventBus()
+        self.registry = EntityRegistry()
+        self.groups = {kind: pygame.sprite.Group() for kind in KINDS}
+        self.formations = []
+        self.loose_enemies = pygame.sprite.Group()  # Enemies moving on their own
+
+    def group(self, kind):
+        """Get the sprite group holding every live entity of a kind"""
+        return self.groups[kind]
+
+    def count(self, kind):
+        """Get the number of live entities of a kind"""
+        return len(self.groups[kind])
+
+    def spawn(self, kind, entity, formation=None):
+        """
+        Bring an entity into play.
+
+        Args:
+            kind: Entity kind (PLAYER, ENEMY or BOSS)
+            entity: The sprite
+            formation: For enemies, the Formation moving it (None: it moves
+                       on its own); the formation must be added with add_formation()
+        """
+        if isinstance(entity, EntityFacade):
+            # Formation members are moved by their formation, not the zig-zag system
+            entity.attach(self.registry, (ZIGZAG,) if formation is not None else ())
+        self.groups[kind].add(entity)
+        if kind == ENEMY:
+            if formation is not None:
+                formation.add(entity)
+            else:
+                self.loose_enemies.add(entity)
+        self.events.publish(SPAWNED, kind, entity)
+
+    def kill(self, kind, entity):
+        """
+        Take an entity out of play (destroyed by the player or the game).
+
+        Args:
+            kind: Entity kind
+            entity: The sprite
+        """
+        entity.kill()
+        self.events.publish(KILLED, kind, entity)
+
+    def add_formation(self, formation):
+        """Let the World move a Formation's members"""
+        self.formations.append(formation)
+
+    def clear(self):
+        """Remove every entity (pooled sprites go back to their pools)"""
+        for group in self.groups.values():
+            release_group(group)
+        self.loose_enemies.empty()
+        self.formations = []
+        self.registry.clear()
+
+    def update(self, controls, dt):
+        """
+        Step every entity once.
+
+        Args:
+            controls: Controls for the player this tick
+            dt: Length of the tick in milliseconds of game time
+        """
+        self.groups[PLAYER].update(controls)
+
+        formations = self.formations
+        for formation in formations:
+            formation.update()
+        if not all(formations):
+            # Drop formations whose members are all gone
+            self.formations = [formation for formation in formations if formation]
+        # Loose enemies and bosses
+        zigzag_system(self.registry, MOVE_STEPS_PER_TICK)
+
+        sync_sprites(self.registry)
+
+    def get_enemy_bottom(self):
+        """
+        Get the lowest edge of any enemy, for the invasion check.
+
+        Returns:
+            Largest rect bottom of all enemies (0 if there are none)
+        """
+        bottom = max((formation.get_bottom() for formation in self.formations), default=0)
+        for enemy in self.loose_enemies:
+            bottom = max(bottom, enemy.rect.bottom)
+        return bottom
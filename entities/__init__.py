@@ -1,15 +1,34 @@
-from .base_entity import *
-from .player import Player
-from .enemy import Enemy
-from .bullet import *
-from .enemyBullets import EnemyBullet
-from .explosion import Explosion
-from .base_boss import BaseBoss
-from .boss3 import Boss3
-from .boss4 import Boss4
-from .boss5 import Boss5
+"""
+Game entities. Names are imported from their modules on first access
+(PEP 562), so importing one entity does not pull in every boss.
+"""
+
+# Exported name -> module it lives in
+_EXPORTS = {
+    'Player': '.player',
+    'Enemy': '.enemy',
+    'Formation': '.formation',
+    'BaseBoss': '.base_boss',
+    'Boss3': '.boss3',
+    'Boss4': '.boss4',
+    'Boss5': '.boss5',
+}
 
 __all__ = [
-    'Player', 'Enemy', 'EnemyBullet', 'Explosion',
+    'Player', 'Enemy', 'Formation',
     'BaseBoss', 'Boss3', 'Boss4', 'Boss5'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # __import__ rather than importlib, so -X importtime reports the module
+    value = getattr(__import__(__name__ + module, fromlist=[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
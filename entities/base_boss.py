@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
 import pygame
-import random
-import os
+from core.assets import asset_cache
+from core.rng import game_rng
+from core.sim_clock import sim_clock
+from core.hud import draw_hp_bar
+from core.particles import effect_particles
+from core.ecs import ComponentField, MOVE_STEPS_PER_TICK, POSITION, SPRITE, VELOCITY, ZIGZAG, SHOOTER, HEALTH
 from .enemy import Enemy
-from .enemyBullets import EnemyBullet
 
 class BaseBoss(Enemy, ABC):
     """
@@ -22,6 +25,14 @@ class BaseBoss(Enemy, ABC):
     - Modularity: Each boss is self-contained with its own configuration
     - Encapsulation: Boss state and logic are encapsulated in the class
     """
+
+    COMPONENTS = (POSITION, SPRITE, VELOCITY, ZIGZAG, SHOOTER, HEALTH)
+
+    # Bosses move sideways only; the VELOCITY speed is their horizontal speed
+    speed = 0
+    horizontal_speed = ComponentField(VELOCITY, 'speed')
+    max_hp = ComponentField(HEALTH, 'max_hp')
+    current_hp = ComponentField(HEALTH, 'hp')
     
     def __init__(self, x, y, screen_width, screen_height, level):
         """
@@ -43,6 +54,7 @@ class BaseBoss(Enemy, ABC):
         
         self.rect.centerx = x
         self.rect.y = y
+        self.max_x = self.screen_width - self.rect.width
         
         self.max_hp = self._get_max_hp_by_level()
         self.current_hp = self.max_hp
@@ -52,19 +64,19 @@ class BaseBoss(Enemy, ABC):
         self.move_direction = 1
         self.move_counter = 0
         self.horizontal_speed = 2
+        self.sweep_steps = 50
+        self.drop_height = 0
         
     def _load_boss_image(self):
         """
         Load the appropriate boss image based on level.
         """
-        image_path = f"assets/images/boss{self.level}.png"
+        image_path = f"boss{self.level}.png"
         
-        if os.path.exists(image_path):
+        if asset_cache.exists(image_path):
             try:
-                # Load and scale the boss image
-                original_image = pygame.image.load(image_path)
-                # Scale the boss image to be larger than regular enemies
-                self.image = pygame.transform.scale(original_image, (120, 90))
+                # Shared boss image, scaled once to be larger than regular enemies
+                self.image = asset_cache.boss_image(self.level)
             except pygame.error as e:
                 print(f"Could not load boss image {image_path}: {e}")
                 self._create_fallback_image()
@@ -93,14 +105,21 @@ class BaseBoss(Enemy, ABC):
     def update(self, dt=None):
         """
         Update boss behavior. Override enemy update to prevent downward movement.
+        Only for bosses outside a World, which moves its bosses together
+        with the enemies (core.ecs.zigzag_system: a sweep of 50 steps with no drop).
         
         Args:
             dt: Delta time in milliseconds (optional, for compatibility with sprite group updates)
         """
+        for _ in range(MOVE_STEPS_PER_TICK):
+            self._step()
+    
+    def _step(self):
+        """One step of the side-to-side movement"""
         self.rect.x += self.move_direction * self.horizontal_speed
         self.move_counter += 1
         
-        if abs(self.move_counter) > 50:
+        if abs(self.move_counter) > self.sweep_steps:
             self.move_direction *= -1
             self.move_counter *= self.move_direction
         
@@ -110,6 +129,7 @@ class BaseBoss(Enemy, ABC):
         if self.rect.right > self.screen_width:
             self.rect.right = self.screen_width
             self.move_direction = -1
+        self.store_rect()
             
     def shoot(self):
         """
@@ -117,13 +137,13 @@ class BaseBoss(Enemy, ABC):
         Bosses shoot more frequently than regular enemies.
         
         Returns:
-            EnemyBullet if shooting, None otherwise
+            (x, y) centre of the bullet fired, or None
         """
-        now = pygame.time.get_ticks()
+        now = sim_clock.now()
         if now - self.last_shot > self.shoot_delay:
             self.last_shot = now
-            self.shoot_delay = random.randint(500, 1500)
-            return EnemyBullet(self.rect.centerx, self.rect.bottom)
+            self.shoot_delay = game_rng.randint(500, 1500)
+            return self.rect.centerx, self.rect.bottom
         return None
     
     def take_damage(self, damage=1):
@@ -137,6 +157,8 @@ class BaseBoss(Enemy, ABC):
             True if boss is still alive, False if defeated
         """
         self.current_hp -= damage
+        # Hit feedback where player bullets arrive
+        effect_particles.emit_sparks(self.rect.centerx, self.rect.bottom)
         
         if self.current_hp <= 0:
             self.current_hp = 0
@@ -173,29 +195,11 @@ class BaseBoss(Enemy, ABC):
             y: Y position of the HP bar
             width: Width of the HP bar
             height: Height of the HP bar
+            
+        Returns:
+            Rect covering everything that was drawn
         """
-        background_rect = pygame.Rect(x, y, width, height)
-        pygame.draw.rect(surface, (100, 20, 20), background_rect)
-        
-        hp_percentage = self.get_hp_percentage()
-        hp_width = int(width * hp_percentage)
-        
-        if hp_width > 0:
-            hp_rect = pygame.Rect(x, y, hp_width, height)
-            if hp_percentage > 0.6:
-                color = (50, 200, 50)
-            elif hp_percentage > 0.3:
-                color = (200, 200, 50)
-            else:
-                color = (200, 50, 50)
-            pygame.draw.rect(surface, color, hp_rect)
-        
-        pygame.draw.rect(surface, (255, 255, 255), background_rect, 2)
-        
-        font = pygame.font.Font(None, 24)
-        hp_text = font.render(f"{self.current_hp}/{self.max_hp}", True, (255, 255, 255))
-        text_rect = hp_text.get_rect(center=(x + width // 2, y + height // 2))
-        surface.blit(hp_text, text_rect)
+        return draw_hp_bar(surface, x, y, width, height, self.current_hp, self.max_hp)
         
     def update_shooting(self, dt):
         """
@@ -205,7 +209,7 @@ class BaseBoss(Enemy, ABC):
             dt: Delta time in milliseconds
             
         Returns:
-            EnemyBullet if boss shoots, None otherwise
+            (x, y) centre of the bullet fired, or None
         """
         return self.shoot()
         
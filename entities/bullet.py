@@ -1,14 +0,0 @@
-import pygame
-
-class Bullets(pygame.sprite.Sprite):
-    def __init__(self, x, y):
-        pygame.sprite.Sprite.__init__(self)
-        self.image = pygame.image.load('assets/images/bullet.png')
-        self.rect = self.image.get_rect()
-        self.rect.center = [x, y]
-        self.speed = 7
-
-    def update(self):
-        self.rect.y -= self.speed
-        if self.rect.bottom < 0:
-            self.kill()
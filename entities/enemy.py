@@ -1,30 +1,81 @@
+import math
 import pygame
-import random
-from .enemyBullets import EnemyBullet
+from core.assets import asset_cache
+from core.ecs import (EntityFacade, ComponentField, MOVE_STEPS_PER_TICK,
+                      POSITION, SPRITE, VELOCITY, ZIGZAG, SHOOTER)
+from core.rng import game_rng
+from core.sim_clock import sim_clock, TICK_MS
 
-class Enemy(pygame.sprite.Sprite):
-    def __init__(self, x, y, screen_width):
+class Enemy(EntityFacade, pygame.sprite.Sprite):
+    """Regular enemy; its state lives in the World's component stores (see core.ecs)"""
+
+    COMPONENTS = (POSITION, SPRITE, VELOCITY, ZIGZAG, SHOOTER)
+
+    speed = ComponentField(VELOCITY, 'speed')
+    move_direction = ComponentField(VELOCITY, 'direction')
+    move_counter = ComponentField(ZIGZAG, 'counter')
+    sweep_steps = ComponentField(ZIGZAG, 'sweep')
+    drop_height = ComponentField(ZIGZAG, 'drop')
+    max_x = ComponentField(ZIGZAG, 'max_x')
+    last_shot = ComponentField(SHOOTER, 'last_shot')
+    shoot_delay = ComponentField(SHOOTER, 'delay')
+    shoot_chance = ComponentField(SHOOTER, 'chance')
+
+    def __init__(self, x, y, screen_width, rng=None):
         pygame.sprite.Sprite.__init__(self)
-        self.image = pygame.image.load(f"assets/images/alien{random.randint(1, 5)}.png")
+        EntityFacade.__init__(self)
+        self.speed = 1
+        self.screen_width = screen_width
+        self.sweep_steps = 75
+        self.drop_height = 20
+        self.shoot_chance = 0.002  
+        self.formation = None  # Formation moving this enemy, if any
+        self.reset(x, y, rng)
+
+    def reset(self, x, y, rng=None):
+        """
+        Put the enemy at a position in its starting state, rolling a new
+        look and shot delay. Speed and shoot chance are kept.
+
+        Args:
+            x: X position of the enemy centre
+            y: Y position of the enemy centre
+            rng: random.Random to roll from (the game RNG if None)
+        """
+        rng = rng or game_rng
+        self.image = asset_cache.image(f"alien{rng.randint(1, 5)}.png")
         self.rect = self.image.get_rect()
         self.rect.center = [x, y]
+        self.store_rect()
+        self.max_x = self.screen_width - self.rect.width
         self.move_counter = 0
         self.move_direction = 1
-        self.speed = 1
-        self.screen_width = screen_width
-        self.last_shot = pygame.time.get_ticks()
-        self.shoot_delay = random.randint(1000, 3000) 
-        self.shoot_chance = 0.002  
+        self.last_shot = sim_clock.now()
+        self.shoot_delay = rng.randint(1000, 3000) 
+
+    def kill(self):
+        """Remove the enemy from all groups and from its formation"""
+        if self.formation is not None:
+            self.formation.remove(self)
+        super().kill()
 
     def update(self):
-        
+        """
+        Zig-zag on its own. Only for enemies outside a World: the World
+        moves its enemies in bulk (core.ecs.zigzag_system) or by formation.
+        """
+        for _ in range(MOVE_STEPS_PER_TICK):
+            self._step()
+
+    def _step(self):
+        """One step of the zig-zag"""
         self.rect.x += self.move_direction * self.speed
         self.move_counter += 1
         
-        if abs(self.move_counter) > 75:
+        if abs(self.move_counter) > self.sweep_steps:
             self.move_direction *= -1
             self.move_counter *= self.move_direction
-            self.rect.y += 20 
+            self.rect.y += self.drop_height
         
         if self.rect.left < 0:
             self.rect.left = 0
@@ -32,12 +83,43 @@ class Enemy(pygame.sprite.Sprite):
         if self.rect.right > self.screen_width:
             self.rect.right = self.screen_width
             self.move_direction = -1
+        self.store_rect()
 
     def shoot(self):
         """Randomly shoot bullets to keep the game easy to play"""
-        now = pygame.time.get_ticks()
-        if now - self.last_shot > self.shoot_delay and random.random() < self.shoot_chance:
-            self.last_shot = now
-            self.shoot_delay = random.randint(1000, 3000)
-            return EnemyBullet(self.rect.centerx, self.rect.bottom)
-        return None
\ No newline at end of file
+        now = sim_clock.now()
+        if now - self.last_shot > self.shoot_delay and game_rng.random() < self.shoot_chance:
+            return self.fire(now)
+        return None
+
+    def fire(self, now):
+        """
+        Shoot now and roll the delay before the next shot.
+
+        Args:
+            now: Current game time in milliseconds
+
+        Returns:
+            (x, y) centre of the bullet fired
+        """
+        self.last_shot = now
+        self.shoot_delay = game_rng.randint(1000, 3000)
+        return self.rect.centerx, self.rect.bottom
+
+    def next_shot_time(self):
+        """
+        Draw the game time of the next shot, as polling shoot() every tick
+        would produce it: the first tick after the shot delay, plus a
+        geometric number of ticks until the per-tick chance succeeds.
+
+        Returns:
+            Game time in milliseconds, or None if the enemy never shoots
+        """
+        chance = self.shoot_chance
+        if chance <= 0:
+            return None
+        first_tick = self.last_shot + (self.shoot_delay // TICK_MS + 1) * TICK_MS
+        if chance >= 1:
+            return first_tick
+        misses = int(math.log(1.0 - game_rng.random()) / math.log(1.0 - chance))
+        return first_tick + misses * TICK_MS
\ No newline at end of file
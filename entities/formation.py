@@ -0,0 +1,183 @@
+"""
+Enemy Formation for Galaxy Shooter
+
+Enemies that enter together move together: the same zig-zag (sideways,
+then down and back) driven by one shared counter and direction.
+A Formation runs that logic once per tick for all of its members instead
+of once per enemy, keeps the members' positions as NumPy offsets from a
+shared origin, and tracks the bounding box of the whole group, so wall
+bounces and the "reached the bottom" check cost the same for 5 enemies
+as for 5000. Member positions are written straight into the World's
+POSITION store (see core.ecs); the World syncs the rects afterwards.
+
+Design principles used:
+- Performance: One movement decision per formation per tick
+- Encapsulation: Members are moved only through their formation
+"""
+
+import numpy as np
+import pygame
+from core.ecs import MOVE_STEPS_PER_TICK, POSITION, round_position
+
+# Initial size of the member arrays; grows by doubling when full
+INITIAL_CAPACITY = 32
+
+
+class Formation:
+    """
+    A group of enemies moving in lockstep.
+
+    Members keep their own rects (for drawing and collisions); the
+    formation moves every member by the same step and bounces off the
+    screen edges as one block.
+
+    Member data is kept packed in arrays, in the same order as `members`.
+    A killed member is swapped with the last one, so removing a member
+    costs the same however large the formation is; the bounding box is
+    then recomputed from the arrays the next time it is needed.
+    """
+
+    def __init__(self, speed, sweep_steps, drop_height, screen_width):
+        """
+        Initialize an empty formation.
+
+        Args:
+            speed: Sideways pixels per movement step
+            sweep_steps: Movement steps sideways before dropping and turning
+            drop_height: Pixels dropped at every turn
+            screen_width: Width of the game screen
+        """
+        self.speed = speed
+        self.sweep_steps = sweep_steps
+        self.drop_height = drop_height
+        self.screen_width = screen_width
+        self.move_counter = 0
+        self.move_direction = 1
+
+        self.members = []
+        self._row_of = {}  # Member -> index in `members` and the arrays
+        self.x = 0  # Origin every member offset is relative to
+        self.y = 0
+        self._entities = np.zeros(INITIAL_CAPACITY, dtype=np.int64)  # Entity ids of the members
+        self._offset_x = np.zeros(INITIAL_CAPACITY, dtype=np.int64)
+        self._offset_y = np.zeros(INITIAL_CAPACITY, dtype=np.int64)
+        self._width = np.zeros(INITIAL_CAPACITY, dtype=np.int64)
+        self._height = np.zeros(INITIAL_CAPACITY, dtype=np.int64)
+        self.bounds = pygame.Rect(0, 0, 0, 0)
+        self._bounds_dirty = False  # A member was removed since the bounds were computed
+
+    def __len__(self):
+        return len(self.members)
+
+    def add(self, enemy):
+        """
+        Make an enemy a member at its current position.
+
+        Args:
+            enemy: Enemy to add, attached to the World's registry
+        """
+        n = len(self.members)
+        if n == len(self._entities):
+            self._grow()
+        rect = enemy.rect
+        self._entities[n] = enemy.entity
+        self._offset_x[n] = rect.left - self.x
+        self._offset_y[n] = rect.top - self.y
+        self._width[n] = rect.width
+        self._height[n] = rect.height
+        enemy.formation = self
+        self._row_of[enemy] = n
+        self.members.append(enemy)
+        if n == 0:
+            self.bounds = rect.copy()
+            self._bounds_dirty = False
+        elif not self._bounds_dirty:
+            self.bounds.union_ip(rect)
+
+    def remove(self, enemy):
+        """
+        Drop a member (called when the enemy is killed).
+
+        Args:
+            enemy: Member to remove
+        """
+        if enemy.formation is not self:
+            return
+        enemy.formation = None
+        row = self._row_of.pop(enemy)
+        last = len(self.members) - 1
+        if row != last:
+            moved = self.members[last]
+            self.members[row] = moved
+            self._row_of[moved] = row
+            for array in (self._entities, self._offset_x, self._offset_y, self._width, self._height):
+                array[row] = array[last]
+        self.members.pop()
+        self._bounds_dirty = True
+
+    def get_bottom(self):
+        """Get the lowest edge of any member (0 for an empty formation)"""
+        if not self.members:
+            return 0
+        if self._bounds_dirty:
+            self._compute_bounds()
+        return self.bounds.bottom
+
+    def update(self):
+        """Advance every member by one tick of the zig-zag"""
+        n = len(self.members)
+        if n == 0:
+            return
+        if self._bounds_dirty:
+            self._compute_bounds()
+
+        for _ in range(MOVE_STEPS_PER_TICK):
+            self._step()
+        position = self.members[0].registry.stores[POSITION]
+        rows = position.rows(self._entities[:n])
+        position.columns['x'][rows] = self._offset_x[:n] + self.x
+        position.columns['y'][rows] = self._offset_y[:n] + self.y
+
+    def _step(self):
+        """Move the origin and bounding box by one step of the zig-zag"""
+        # Same integer step every member's rect.x += direction * speed gave
+        dx = int(round_position(self.move_direction * self.speed))
+        dy = 0
+        self.move_counter += 1
+        if abs(self.move_counter) > self.sweep_steps:
+            self.move_direction *= -1
+            self.move_counter *= self.move_direction
+            dy = self.drop_height
+
+        bounds = self.bounds.move(dx, dy)
+        if bounds.left < 0:
+            dx -= bounds.left
+            self.move_direction = 1
+        if bounds.right > self.screen_width:
+            dx -= bounds.right - self.screen_width
+            self.move_direction = -1
+
+        self.x += dx
+        self.y += dy
+        self.bounds.move_ip(dx, dy)
+
+    def _compute_bounds(self):
+        """Recompute the bounding box of the members from the arrays"""
+        self._bounds_dirty = False
+        n = len(self.members)
+        left = self._offset_x[:n]
+        top = self._offset_y[:n]
+        x0 = int(left.min())
+        y0 = int(top.min())
+        x1 = int((left + self._width[:n]).max())
+        y1 = int((top + self._height[:n]).max())
+        self.bounds = pygame.Rect(self.x + x0, self.y + y0, x1 - x0, y1 - y0)
+
+    def _grow(self):
+        """Double the capacity of the member arrays"""
+        size = len(self._entities) * 2
+        for name in ('_entities', '_offset_x', '_offset_y', '_width', '_height'):
+            array = getattr(self, name)
+            grown = np.zeros(size, dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
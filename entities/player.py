@@ -1,27 +1,44 @@
 import pygame
-from .bullet import Bullets
+from core.assets import asset_cache
+from core.ecs import EntityFacade, ComponentField, POSITION, SPRITE, VELOCITY, SHOOTER
+from core.sim_clock import sim_clock
+
+class Player(EntityFacade, pygame.sprite.Sprite):
+    """The player ship; its state lives in the World's component stores (see core.ecs)"""
+
+    COMPONENTS = (POSITION, SPRITE, VELOCITY, SHOOTER)
+
+    speed = ComponentField(VELOCITY, 'speed')
+    last_shot = ComponentField(SHOOTER, 'last_shot')
+    shoot_delay = ComponentField(SHOOTER, 'delay')
 
-class Player(pygame.sprite.Sprite):
     def __init__(self, x, y, screen_width):
         pygame.sprite.Sprite.__init__(self)
-        self.image = pygame.image.load('assets/images/spaceship.png')
+        EntityFacade.__init__(self)
+        self.image = asset_cache.image('spaceship.png')
         self.rect = self.image.get_rect()
         self.rect.center = [x, y]
         self.speed = 5
         self.screen_width = screen_width
-        self.last_shot = pygame.time.get_ticks()
+        self.last_shot = sim_clock.now()
         self.shoot_delay = 300  # milliseconds between shots
         
-    def update(self):
-        # Get key presses
-        keys = pygame.key.get_pressed()
+    def update(self, controls=None):
+        # Read the keyboard unless an input source supplied the controls
+        if controls is None:
+            keys = pygame.key.get_pressed()
+            move_left = keys[pygame.K_LEFT] or keys[pygame.K_a]
+            move_right = keys[pygame.K_RIGHT] or keys[pygame.K_d]
+        else:
+            move_left = controls.left
+            move_right = controls.right
         
         # Move left
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        if move_left:
             self.rect.x -= self.speed
             
         # Move right
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        if move_right:
             self.rect.x += self.speed
             
         # Keep player on screen
@@ -29,11 +46,18 @@ class Player(pygame.sprite.Sprite):
             self.rect.left = 0
         if self.rect.right > self.screen_width:
             self.rect.right = self.screen_width
+        self.store_rect()
     
     def shoot(self):
-        now = pygame.time.get_ticks()
+        """
+        Fire if the shot delay has passed.
+
+        Returns:
+            (x, y) centre of the new bullet, or None if not firing
+        """
+        now = sim_clock.now()
         if now - self.last_shot > self.shoot_delay:
             self.last_shot = now
             # Play shooting sound effect
-            return Bullets(self.rect.centerx, self.rect.top)
+            return self.rect.centerx, self.rect.top
         return None
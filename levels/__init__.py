@@ -1,8 +1,32 @@
-from .base_level import BaseLevel
-from .level_1 import Level1
-from .level_2 import Level2
-from .level_3 import Level3
-from .level_4 import Level4
-from .level_5 import Level5
-
-__all__ = ['BaseLevel', 'Level1', 'Level2', 'Level3', 'Level4', 'Level5']
+"""
+Game levels. Names are imported from their modules on first access
+(PEP 562), so a level (and its boss) is only imported when it is built.
+"""
+
+# Exported name -> module it lives in
+_EXPORTS = {
+    'BaseLevel': '.base_level',
+    'Level1': '.level_1',
+    'Level2': '.level_2',
+    'Level3': '.level_3',
+    'Level4': '.level_4',
+    'Level5': '.level_5',
+    'Wave': '.waves',
+    'WaveScheduler': '.waves',
+}
+
+__all__ = ['BaseLevel', 'Level1', 'Level2', 'Level3', 'Level4', 'Level5', 'Wave', 'WaveScheduler']
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # __import__ rather than importlib, so -X importtime reports the module
+    value = getattr(__import__(__name__ + module, fromlist=[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
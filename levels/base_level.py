@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
-import pygame
+from core.events import KILLED
+from core.sim_clock import sim_clock
+from core.world import ENEMY, BOSS
 from entities.enemy import Enemy
+from entities.formation import Formation
+from .waves import Wave, WaveScheduler, DEFAULT_SPAWN_BUDGET
 
 
 class BaseLevel(ABC):
@@ -13,6 +17,7 @@ class BaseLevel(ABC):
     - Enemy speed
     - Enemy behavior (shooting frequency)
     - Level layout and patterns
+    - Enemy waves streamed in over time
     
     Design Principles:
     - Reusability: Common level logic is implemented once in base class
@@ -33,7 +38,7 @@ class BaseLevel(ABC):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.level_number = level_number
-        self.enemy_group = pygame.sprite.Group()
+        self.world = None  # World the level plays in, set by attach()
         self.is_complete = False
         self.total_enemies = 0
         self.enemies_killed = 0
@@ -44,6 +49,15 @@ class BaseLevel(ABC):
         self.boss_spawned = False
         self.enemies_phase_complete = False
         
+        # Wave sequence being played, and the formation of the wave
+        # currently being spawned
+        self.waves = None
+        self._formation = None
+        self._formation_wave = None
+        
+        # Enemies built ahead of time by prefetch(), used by the next spawn
+        self._prefetched_enemies = None
+        
     @abstractmethod
     def get_level_name(self):
         """
@@ -93,7 +107,7 @@ class BaseLevel(ABC):
         """
         return None
     
-    def create_enemy(self, x, y):
+    def create_enemy(self, x, y, rng=None):
         """
         Create an enemy with level-specific attributes.
         This method applies the level's difficulty modifiers to the enemy.
@@ -101,29 +115,78 @@ class BaseLevel(ABC):
         Args:
             x: X position for the enemy
             y: Y position for the enemy
+            rng: random.Random for the enemy's traits (the game RNG if None)
             
         Returns:
             Enemy instance configured for this level
         """
-        enemy = Enemy(x, y, self.screen_width)
+        enemy = Enemy(x, y, self.screen_width, rng)
         enemy.speed *= self.get_enemy_speed_multiplier()
         enemy.shoot_chance *= self.get_enemy_shoot_chance_multiplier()
         return enemy
     
-    def spawn_enemies(self):
+    def get_waves(self):
         """
-        Spawn all enemies for this level based on the pattern defined by subclass.
-        This is a template method that calls get_enemy_positions() which must be
-        implemented by subclasses.
+        Return the waves of enemies in this level, in order.
+        Can be overridden by subclasses; may return a generator for
+        arbitrarily long (e.g. endless) sequences.
+        
+        Returns:
+            Iterable of Wave objects (default: one wave holding
+            get_enemy_positions(), present from the start)
         """
-        self.enemy_group.empty()
-        positions = self.get_enemy_positions()
+        return [Wave(self.get_enemy_positions())]
+    
+    def get_spawn_budget(self):
+        """
+        Return the maximum number of enemies spawned per tick after the start.
+        Can be overridden by subclasses.
+        """
+        return DEFAULT_SPAWN_BUDGET
+    
+    def attach(self, world):
+        """
+        Play this level in a World: its enemies and boss are spawned there,
+        and kills are followed through the World's events.
         
-        for x, y in positions:
-            enemy = self.create_enemy(x, y)
-            self.enemy_group.add(enemy)
+        Args:
+            world: World owning the entities of the run
+        """
+        self.detach()
+        self.world = world
+        world.events.subscribe(KILLED, ENEMY, self._on_enemy_killed)
+        world.events.subscribe(KILLED, BOSS, self._on_boss_killed)
+    
+    def detach(self):
+        """Stop following the World the level was attached to"""
+        if self.world is not None:
+            self.world.events.unsubscribe(KILLED, ENEMY, self._on_enemy_killed)
+            self.world.events.unsubscribe(KILLED, BOSS, self._on_boss_killed)
+            self.world = None
+    
+    def _on_enemy_killed(self, enemy):
+        """World event: the player destroyed an enemy"""
+        self.enemy_killed()
+    
+    def _on_boss_killed(self, boss):
+        """World event: the player defeated the boss"""
+        self.boss_killed()
+    
+    def spawn_enemies(self):
+        """
+        Start this level's waves and spawn its opening formation into the
+        attached World. This is a template method that calls get_waves()
+        (by default built from get_enemy_positions(), which must be
+        implemented by subclasses). Later waves are spawned by update() as
+        they become due.
+        """
+        self._formation = None
+        self._formation_wave = None
+        self.waves = WaveScheduler(self.get_waves(), self._spawn_enemy, self.get_spawn_budget())
+        self.waves.start(sim_clock.now())
+        self._prefetched_enemies = None
         
-        self.total_enemies = len(positions)
+        self.total_enemies = self.waves.total if self.waves.total is not None else self.waves.spawned
         self.enemies_killed = 0
         self.is_complete = False
         
@@ -132,6 +195,44 @@ class BaseLevel(ABC):
         self.boss_spawned = False
         self.enemies_phase_complete = False
     
+    def _spawn_enemy(self, x, y, wave):
+        """Build an enemy of a wave for the wave scheduler and spawn it into the World"""
+        if self._prefetched_enemies:
+            # Reuse a prebuilt enemy; its traits are rolled again from the
+            # game RNG exactly as creating it here would have done
+            enemy = self._prefetched_enemies.pop()
+            enemy.reset(x, y)
+        else:
+            enemy = self.create_enemy(x, y)
+        
+        formation = None
+        if wave.formation:
+            # Waves are spawned one after the other, so only the current
+            # wave's formation can still gain members
+            formation = self._formation
+            if wave is not self._formation_wave or not formation:
+                formation = Formation(enemy.speed, enemy.sweep_steps, enemy.drop_height,
+                                      self.screen_width)
+                self._formation = formation
+                self._formation_wave = wave
+                self.world.add_formation(formation)
+        self.world.spawn(ENEMY, enemy, formation)
+        return enemy
+    
+    def prefetch(self, rng):
+        """
+        Build this level's opening formation ahead of time. Safe to run on
+        a worker thread; the next spawn_enemies() uses the prebuilt enemies.
+        Images are not loaded here: AssetCache.preload() has loaded (and
+        converted, which must happen on the main thread) every one of them.
+        
+        Args:
+            rng: random.Random used while building (not the game RNG)
+        """
+        first = next(iter(self.get_waves()), None)
+        if first is not None and first.delay == 0 and first.size is not None:
+            self._prefetched_enemies = [self.create_enemy(x, y, rng) for x, y in first.positions]
+    
     @abstractmethod
     def get_enemy_positions(self):
         """
@@ -145,27 +246,32 @@ class BaseLevel(ABC):
     
     def update(self):
         """
-        Update the level state.
-        Handles both regular enemies and boss encounters.
+        Update the level state: spawn due waves and run the boss encounter.
+        The entities themselves are moved by the World.
         """
-        self.enemy_group.update()
+        # Spawn the enemies of the waves that are due
+        waves = self.waves
+        if waves is not None and not waves.finished:
+            waves.update(sim_clock.now())
+            if waves.total is None:
+                self.total_enemies = waves.spawned
         
         # Check if all regular enemies are defeated
-        if len(self.enemy_group) == 0 and not self.enemies_phase_complete:
+        waves_done = waves is None or waves.finished
+        if self.world.count(ENEMY) == 0 and waves_done and not self.enemies_phase_complete:
             self.enemies_phase_complete = True
             
             # If this level has a boss, spawn it
             if self.has_boss and not self.boss_spawned:
                 self.boss = self.create_boss()
                 self.boss_spawned = True
+                if self.boss is not None:
+                    self.world.spawn(BOSS, self.boss)
             elif not self.has_boss:
                 # No boss, level is complete
                 self.is_complete = True
         
-        # Update boss if it exists
-        if self.boss and not self.boss.is_defeated():
-            self.boss.update()
-        elif self.boss and self.boss.is_defeated() and not self.is_complete:
+        if self.boss and self.boss.is_defeated() and not self.is_complete:
             # Boss is defeated, level is complete
             self.is_complete = True
     
@@ -212,11 +318,21 @@ class BaseLevel(ABC):
     
     def reset(self):
         """
-        Reset the level to its initial state.
-        Useful for restarting a level.
+        Reset the level to its initial state, before any enemy was spawned.
+        Nothing is spawned: a reset level is started again through
+        attach() and spawn_enemies(), like a level never played.
         """
-        self.spawn_enemies()
-        # Boss state will be reset in spawn_enemies()
+        self.detach()
+        self.waves = None
+        self._formation = None
+        self._formation_wave = None
+        self._prefetched_enemies = None
+        self.total_enemies = 0
+        self.enemies_killed = 0
+        self.is_complete = False
+        self.boss = None
+        self.boss_spawned = False
+        self.enemies_phase_complete = False
     
     def get_info(self):
         """
@@ -1,5 +1,4 @@
 from .base_level import BaseLevel
-from entities.boss3 import Boss3
 
 
 class Level3(BaseLevel):
@@ -39,6 +38,7 @@ class Level3(BaseLevel):
     
     def create_boss(self):
         """Create the Guardian Destroyer boss"""
+        from entities.boss3 import Boss3  # Imported when the boss first appears
         return Boss3(self.screen_width, self.screen_height)
     
     def get_enemy_positions(self):
@@ -1,5 +1,4 @@
 from .base_level import BaseLevel
-from entities.boss4 import Boss4
 
 
 class Level4(BaseLevel):
@@ -39,6 +38,7 @@ class Level4(BaseLevel):
     
     def create_boss(self):
         """Create the War Machine boss"""
+        from entities.boss4 import Boss4  # Imported when the boss first appears
         return Boss4(self.screen_width, self.screen_height)
     
     def get_enemy_positions(self):
@@ -1,5 +1,4 @@
 from .base_level import BaseLevel
-from entities.boss5 import Boss5
 
 
 class Level5(BaseLevel):
@@ -39,6 +38,7 @@ class Level5(BaseLevel):
     
     def create_boss(self):
         """Create the Omega Commander final boss"""
+        from entities.boss5 import Boss5  # Imported when the boss first appears
         return Boss5(self.screen_width, self.screen_height)
     
     def get_enemy_positions(self):
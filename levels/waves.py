@@ -0,0 +1,136 @@
+"""
+Enemy Waves for Galaxy Shooter
+
+A level describes its enemies as a sequence of timed waves instead of one
+formation. The WaveScheduler walks through that sequence while the level
+is played and spawns the enemies of each wave when it is due, at most a
+fixed number per tick, so a large wave is spread over several frames.
+
+Waves and their positions are consumed lazily: a level can return a
+generator of waves, and a wave can take a generator of positions, so an
+endless or survival sequence never exists in memory as a whole. Only the
+enemies currently alive do.
+
+Design principles used:
+- Single Responsibility: Only decides when and where enemies appear
+- Open/Closed: Levels declare waves; spawning itself stays in one place
+- Performance: Bounded spawn work per tick and bounded memory per session
+"""
+
+# Enemies spawned per tick at most, once the level has started
+DEFAULT_SPAWN_BUDGET = 4
+
+
+class Wave:
+    """A group of enemies entering together"""
+
+    def __init__(self, positions, delay=0, formation=True):
+        """
+        Initialize the wave.
+
+        Args:
+            positions: Iterable of (x, y) enemy positions (may be a generator)
+            delay: Milliseconds of game time between the start of the
+                   previous wave (or of the level, for the first wave) and this one
+            formation: Whether the wave moves in lockstep as one Formation
+                       (False: every enemy moves on its own)
+        """
+        self.positions = positions
+        self.delay = delay
+        self.formation = formation
+        # Number of enemies, if known up front (None for generators)
+        self.size = len(positions) if hasattr(positions, '__len__') else None
+
+
+class WaveScheduler:
+    """
+    Spawns the enemies of a sequence of waves over time.
+
+    The opening waves (due at the start and of known size) are spawned
+    whole by start(), so a level's first formation appears at once. Every
+    later enemy is spawned by update(), within the per-tick budget.
+    """
+
+    def __init__(self, waves, spawn, spawn_budget=DEFAULT_SPAWN_BUDGET):
+        """
+        Initialize the scheduler.
+
+        Args:
+            waves: Iterable of Wave objects, in order (may be a generator)
+            spawn: Callable building an enemy from (x, y, wave)
+            spawn_budget: Maximum number of enemies spawned per update()
+        """
+        self.spawn_budget = spawn_budget
+        self._spawn = spawn
+        # Total number of enemies, if every wave is known up front
+        if isinstance(waves, (list, tuple)) and all(wave.size is not None for wave in waves):
+            self.total = sum(wave.size for wave in waves)
+        else:
+            self.total = None
+        self.spawned = 0
+        self.finished = False
+
+        self._waves = iter(waves)
+        self._next_wave = None
+        self._next_start = 0
+        self._wave = None  # Wave being spawned
+        self._positions = None  # Positions left in it
+
+    def start(self, now):
+        """
+        Begin the sequence and spawn the opening formation.
+
+        Args:
+            now: Current game time in milliseconds
+
+        Returns:
+            List of the enemies spawned
+        """
+        self._next_wave = next(self._waves, None)
+        if self._next_wave is not None:
+            self._next_start = now + self._next_wave.delay
+        return self._run(now, None)
+
+    def update(self, now):
+        """
+        Spawn the enemies that are due, up to the spawn budget.
+
+        Args:
+            now: Current game time in milliseconds
+
+        Returns:
+            List of the enemies spawned
+        """
+        if self.finished:
+            return []
+        return self._run(now, self.spawn_budget)
+
+    def _run(self, now, budget):
+        """
+        Spawn due enemies until the budget is used up or nothing is due.
+        Without a budget, only waves of known size are spawned.
+        """
+        spawned = []
+        while budget is None or len(spawned) < budget:
+            if self._positions is None:
+                wave = self._next_wave
+                if wave is None:
+                    self.finished = True
+                    break
+                if now < self._next_start or (budget is None and wave.size is None):
+                    break
+                self._wave = wave
+                self._positions = iter(wave.positions)
+                self._next_wave = next(self._waves, None)
+                if self._next_wave is not None:
+                    self._next_start += self._next_wave.delay
+                continue
+
+            position = next(self._positions, None)
+            if position is None:
+                self._positions = None
+                continue
+            spawned.append(self._spawn(position[0], position[1], self._wave))
+
+        self.spawned += len(spawned)
+        return spawned
@@ -1,12 +1,13 @@
+import argparse
+import time
 import pygame
-import random
 from pygame.locals import *
-from entities.player import Player
-from entities.enemy import Enemy
-from entities.explosion import Explosion
-from menus import MainMenu, GameOverMenu, PauseMenu, LevelCompleteMenu, LevelSelectMenu
-from levels import Level1, Level2, Level3, Level4, Level5
-from managers.level_manager import LevelManager
+from menus import LoadingScreen
+from core.assets import asset_cache, BACKGROUND
+from core.asset_loader import AsyncAssetLoader
+from core.profiler import frame_profiler, ProfilerOverlay
+# Everything else (menus, levels, entities, session) is imported once the
+# loading screen is up, so the window appears as early as possible
 
 # Game states
 MAIN_MENU = "MAIN_MENU"
@@ -16,11 +17,30 @@ PAUSED = "PAUSED"
 GAME_OVER = "GAME_OVER"
 LEVEL_COMPLETE = "LEVEL_COMPLETE"
 
-def main():
+def main(fps=50, dirty_rects=False, profile=False, profile_log=None, record=None, exit_after_first_frame=False,
+         adaptive_quality=True, threaded=False):
+    """
+    Run the game.
+
+    Args:
+        fps: Render frame rate cap. Gameplay always advances in fixed
+             ticks of TICK_MS, independent of this value.
+        dirty_rects: During gameplay, only redraw and update the screen
+                     areas that changed instead of the full frame
+        profile: Start with the frame profiler and its overlay on (F3 toggles)
+        profile_log: Stream per-frame phase timings to this .csv/.jsonl file
+        record: Record every level played (seed and per-tick input) to this replay file
+        exit_after_first_frame: Quit as soon as the main menu has been shown
+                                (used by the startup benchmark)
+        adaptive_quality: Lower the quality of cosmetic effects while frames
+                          run over the frame budget, and raise it again with headroom
+        threaded: Run the game logic on a worker thread at the fixed tick
+                  rate while this thread only draws the published snapshots
+    """
+    started = time.perf_counter()
     pygame.init()
 
     clock = pygame.time.Clock()
-    fps = 50
 
     screenWidth = 600
     screenHeight = 800
@@ -28,77 +48,148 @@ def main():
     screen = pygame.display.set_mode((screenWidth, screenHeight))
     pygame.display.set_caption('Galaxy Shooter')
 
-    font = pygame.font.Font(None, 74)
-    small_font = pygame.font.Font(None, 36)
+    # Use the baked asset pack if there is one; otherwise decode every
+    # image on worker threads behind a loading screen
+    packed = asset_cache.load_pack()
+    loader = AsyncAssetLoader(asset_cache, [] if packed else asset_cache.manifest())
+    loader.start()
+    loading_screen = LoadingScreen(screenWidth, screenHeight)
+    loading_screen.draw(screen, 0.0)
+    pygame.display.update()
+    loading_screen_ms = (time.perf_counter() - started) * 1000
 
-    bg = pygame.image.load('assets/images/background2.png')
+    # The rest of the game is imported behind the loading screen
+    from menus import MainMenu, GameOverMenu, PauseMenu, LevelCompleteMenu, LevelSelectMenu
+    from managers.level_manager import LevelManager
+    from managers.game_session import GameSession
+    from core.input import KeyboardInput
+    from core.pool import warm_pools
+    from core.sim_clock import FixedStepAccumulator, TICK_MS
+    from core.dirty_renderer import DirtyRectRenderer
+    from core.replay import ReplayRecorder
+    from core.quality import effects_quality
+    from core.sim_thread import SimulationThread
 
-    bg_x = 0
-    bg_y = 0
+    accumulator = FixedStepAccumulator()
 
-    def draw_bg():
-        screen.blit(bg, (bg_x, bg_y))
-    
-    # Initialize menus
+    profiler_overlay = ProfilerOverlay(frame_profiler)
+    if profile_log:
+        frame_profiler.open_log(profile_log)
+    frame_profiler.set_enabled(profile or bool(profile_log))
+
+    # The frame budget is one frame at the frame rate cap
+    effects_quality.budget_ms = 1000 / fps if fps > 0 else 1000 / 50
+    effects_quality.reset()
+
+    # Initialize menus (while the images are still decoding)
     main_menu = MainMenu(screenWidth, screenHeight)
     level_select_menu = LevelSelectMenu(screenWidth, screenHeight)
     game_over_menu = GameOverMenu(screenWidth, screenHeight)
     pause_menu = PauseMenu(screenWidth, screenHeight)
     level_complete_menu = LevelCompleteMenu(screenWidth, screenHeight)
-    
+
+    while not loader.done:
+        # Decoded images are converted here, on the main thread
+        progress = loader.poll()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                loader.close()
+                pygame.quit()
+                return
+        loading_screen.draw(screen, progress)
+        pygame.display.update()
+        clock.tick(60)
+
+    # Scaled and grouped variants of the decoded images, then the pools
+    asset_cache.preload()
+    warm_pools()
+    bg = asset_cache.image(BACKGROUND)
+
+    bg_x = 0
+    bg_y = 0
+
+    def draw_bg():
+        screen.blit(bg, (bg_x, bg_y))
+
+    renderer = DirtyRectRenderer(screen, bg) if dirty_rects else None
+
     # Game state
     current_state = MAIN_MENU
-    
+
     level_manager = LevelManager(screenWidth, screenHeight)
-    current_level = None
+    session = GameSession(screenWidth, screenHeight, level_manager)
+    if record:
+        session.recorder = ReplayRecorder()
+    keyboard = KeyboardInput()
 
-    player = None
-    player_group = pygame.sprite.Group()
-    bullet_group = pygame.sprite.Group()
-    enemy_group = pygame.sprite.Group()
-    enemy_bullet_group = pygame.sprite.Group()
-    explosion_group = pygame.sprite.Group()
-    boss_group = pygame.sprite.Group()  # New boss group
+    # In threaded mode the worker steps the session during play; the main
+    # thread pauses it before using the session itself
+    simulation = None
+    if threaded:
+        simulation = SimulationThread(session, keyboard)
+        simulation.start()
 
     def initialize_game(level_index=0):
         """
         Initialize/reset the game to starting state with specified level.
-        
+
         Args:
             level_index: Index of the level to start (0 = Level 1, 1 = Level 2, etc.)
         """
-        nonlocal player, current_level
-        
-        # Load the level using level manager
-        current_level = level_manager.load_level(level_index)
-        
-        # Clear all sprite groups
-        bullet_group.empty()
-        enemy_group.empty()
-        enemy_bullet_group.empty()
-        explosion_group.empty()
-        player_group.empty()
-        boss_group.empty()  # Clear boss group too
-        
-        # Create new player
-        player = Player(screenWidth // 2, screenHeight - 130, screenWidth)
-        player_group.add(player)
-        
-        # Copy enemies from level to game enemy_group
-        if current_level:
-            for enemy in current_level.enemy_group:
-                enemy_group.add(enemy)
-        
+        if simulation is not None:
+            simulation.pause()
+            # An outcome of the previous game no longer applies
+            simulation.take_outcome()
+        session.start(level_index)
+
         # Reset game over menu timer
         game_over_menu.reset_timer()
 
+    def finish_play(outcome):
+        """
+        Set up the menu shown after a tick ended the game or completed the level.
+
+        Args:
+            outcome: GAME_OVER or LEVEL_COMPLETE
+
+        Returns:
+            The state to switch to
+        """
+        if outcome == GAME_OVER:
+            game_over_menu.reset_timer()
+            return GAME_OVER
+        current_level = session.current_level
+        level_complete_menu.set_level_info(
+            current_level.level_number,
+            current_level.get_level_name()
+        )
+        # Build the next level in the background during the menu's countdown
+        level_manager.prefetch_level(level_manager.get_current_level_index() + 1)
+        return LEVEL_COMPLETE
+
+    def draw_session(show_hud, alpha):
+        """Draw the game objects: the worker's latest snapshot while it plays"""
+        if simulation is not None and simulation.running:
+            snapshot, alpha = simulation.latest()
+            return session.draw_snapshot(screen, snapshot, show_hud, alpha)
+        return session.draw(screen, show_hud, alpha)
+
+    first_frame_ms = None
+
     run = True
     while run:
         dt = clock.tick(fps)
-        
+        frame_profiler.begin_frame()
+        if adaptive_quality:
+            # Time the last frame took, without waiting for the frame rate cap
+            effects_quality.update(clock.get_rawtime())
+
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 run = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                # Toggle the frame profiler and its overlay
+                frame_profiler.set_enabled(not frame_profiler.enabled)
             elif event.type == pygame.KEYDOWN:
                 # Handle state-specific input
                 if current_state == MAIN_MENU:
@@ -110,7 +201,7 @@ def main():
                         current_state = LEVEL_SELECT
                     elif action == "QUIT_GAME":
                         run = False
-                
+
                 elif current_state == LEVEL_SELECT:
                     action = level_select_menu.handle_input(event)
                     if action == "MAIN_MENU":
@@ -120,17 +211,15 @@ def main():
                         level_num = int(action.split("_")[1])
                         initialize_game(level_num - 1)  # Convert to 0-based index
                         current_state = PLAYING
-                
+
                 elif current_state == PLAYING:
                     # Pause key
                     if event.key == pygame.K_ESCAPE or event.key == pygame.K_p:
                         current_state = PAUSED
                     # Shooting
                     elif event.key == pygame.K_SPACE:
-                        bullet = player.shoot()
-                        if bullet:
-                            bullet_group.add(bullet)
-                
+                        keyboard.press_fire()
+
                 elif current_state == PAUSED:
                     # Resume with ESC or P
                     if event.key == pygame.K_ESCAPE or event.key == pygame.K_p:
@@ -145,7 +234,7 @@ def main():
                             current_state = PLAYING
                         elif action == "MAIN_MENU":
                             current_state = MAIN_MENU
-                
+
                 elif current_state == GAME_OVER:
                     action = game_over_menu.handle_input(event)
                     if action == "RESTART_GAME":
@@ -155,14 +244,14 @@ def main():
                         current_state = PLAYING
                     elif action == "MAIN_MENU":
                         current_state = MAIN_MENU
-                
+
                 elif current_state == LEVEL_COMPLETE:
                     action = level_complete_menu.handle_input(event)
                     if action == "NEXT_LEVEL":
-                        # Load next level
-                        next_level = level_manager.load_next_level()
-                        if next_level:
-                            initialize_game(level_manager.get_current_level_index())
+                        # Start next level (prefetched while this menu was shown)
+                        next_index = level_manager.get_current_level_index() + 1
+                        if next_index < level_manager.get_level_count():
+                            initialize_game(next_index)
                             current_state = PLAYING
                     elif action == "RESTART_LEVEL":
                         # Restart current level
@@ -174,129 +263,64 @@ def main():
                     elif action == "MAIN_MENU":
                         current_state = MAIN_MENU
 
-        # Update game logic based on current state
-        if current_state == PLAYING:
-
-            for enemy in enemy_group:
-                enemy_bullet = enemy.shoot()
-                if enemy_bullet:
-                    enemy_bullet_group.add(enemy_bullet)
-            
-            boss = current_level.get_boss() if current_level else None
-            if boss and not boss.is_defeated():
-                boss_bullet = boss.update_shooting(dt)
-                if boss_bullet:
-                    if isinstance(boss_bullet, list):
-                        for bullet in boss_bullet:
-                            enemy_bullet_group.add(bullet)
-                    else:
-                        enemy_bullet_group.add(boss_bullet)
-                
-                if boss not in boss_group:
-                    boss_group.add(boss)
-
-            for bullet in bullet_group:
-                hit_enemies = pygame.sprite.spritecollide(bullet, enemy_group, True)
-                if hit_enemies:
-                    bullet.kill()
-                    for enemy in hit_enemies:
-                        explosion = Explosion(enemy.rect.centerx, enemy.rect.centery)
-                        explosion_group.add(explosion)
-                        current_level.enemy_killed()
-            
-            if boss and not boss.is_defeated():
-                hit_bullets = pygame.sprite.spritecollide(boss, bullet_group, True)
-                for bullet in hit_bullets:
-                    if not boss.take_damage(1):
-                        
-                        explosion = Explosion(boss.rect.centerx, boss.rect.centery)
-                        explosion_group.add(explosion)
-                        current_level.boss_killed()
-                        boss_group.remove(boss)
-            
-            for enemy in enemy_group:
-                if enemy.rect.bottom >= screenHeight - 100:  # Near bottom edge
-                    explosion = Explosion(player.rect.centerx, player.rect.centery)
-                    explosion_group.add(explosion)
-                    player.kill()
-                    game_over_menu.reset_timer()
-                    current_state = GAME_OVER
+        if simulation is not None:
+            # The worker only runs during play; it pauses itself when a
+            # tick ends the game or completes the level
+            if current_state == PLAYING:
+                outcome = simulation.take_outcome()
+                if outcome is not None:
+                    current_state = finish_play(outcome)
+                else:
+                    simulation.resume()
+            else:
+                simulation.pause()
+
+        # Update game logic based on current state, in fixed ticks
+        if current_state in [GAME_OVER, LEVEL_COMPLETE] or (current_state == PLAYING and simulation is None):
+            accumulator.add(dt)
+        else:
+            accumulator.reset()
+        frame_profiler.lap('events')
+
+        if current_state == PLAYING and simulation is None:
+            while accumulator.consume():
+                outcome = session.step(keyboard.poll(), TICK_MS)
+                if outcome is not None:
+                    current_state = finish_play(outcome)
                     break
-            
-            # Player-enemy bullet collision (game over)
-            if pygame.sprite.spritecollide(player, enemy_bullet_group, True):
-                explosion = Explosion(player.rect.centerx, player.rect.centery)
-                explosion_group.add(explosion)
-                player.kill()
-                game_over_menu.reset_timer()
-                current_state = GAME_OVER
-            
-            # Check for level completion
-            if current_level and current_level.is_level_complete():
-                level_manager.mark_level_completed(level_manager.get_current_level_index())
-                level_complete_menu.set_level_info(
-                    current_level.level_number,
-                    current_level.get_level_name()
-                )
-                current_state = LEVEL_COMPLETE
-            
-            # Update all game sprites
-            player_group.update()
-            bullet_group.update()
-            enemy_group.update()
-            enemy_bullet_group.update()
-            explosion_group.update()
-            boss_group.update(dt)  # Boss group needs dt for timing
-            
-            # Update level
-            if current_level is not None:
-                current_level.update()
-        
+
         elif current_state == GAME_OVER:
             # Only update explosions in game over state
-            explosion_group.update()
+            while accumulator.consume():
+                session.update_effects()
             game_over_menu.update(dt)
-        
+
         elif current_state == LEVEL_COMPLETE:
             # Update explosions and level complete menu timer
-            explosion_group.update()
+            while accumulator.consume():
+                session.update_effects()
             level_complete_menu.update(dt)
 
         # Drawing
+        alpha = accumulator.alpha() if current_state != PAUSED else 1.0
+
+        if renderer is not None and current_state == PLAYING:
+            # Only refresh the areas that changed since the last frame
+            renderer.begin_frame()
+            rects = draw_session(show_hud=True, alpha=alpha)
+            rects += profiler_overlay.draw(screen)
+            frame_profiler.lap('draw')
+            renderer.present(rects)
+            frame_profiler.lap('display')
+            frame_profiler.end_frame()
+            continue
+
         draw_bg()
-        
+
         if current_state in [PLAYING, PAUSED, GAME_OVER, LEVEL_COMPLETE]:
-            # Draw game objects
-            player_group.draw(screen)
-            bullet_group.draw(screen)
-            enemy_group.draw(screen)
-            enemy_bullet_group.draw(screen)
-            explosion_group.draw(screen)
-            boss_group.draw(screen)  # Draw bosses
-            
-            # Draw boss HP bar if boss exists
-            if current_state == PLAYING and current_level:
-                boss = current_level.get_boss()
-                if boss and not boss.is_defeated():
-                    # Draw boss HP bar at top of screen
-                    boss_name = boss.get_boss_name()
-                    boss_text = small_font.render(f"Boss: {boss_name}", True, (255, 255, 255))
-                    screen.blit(boss_text, (screenWidth // 2 - boss_text.get_width() // 2, 10))
-                    boss.draw_hp_bar(screen, screenWidth // 2 - 100, 35, 200, 15)
-            
-            # Draw level info HUD during gameplay
-            if current_state == PLAYING and current_level is not None:
-                level_info = f"Level {current_level.level_number}: {current_level.get_level_name()}"
-                level_text = small_font.render(level_info, True, (255, 255, 255))
-                screen.blit(level_text, (10, 10))
-                
-                # Draw enemy count (only if no boss or boss not spawned)
-                boss = current_level.get_boss()
-                if not boss:
-                    progress = current_level.get_progress()
-                    enemy_text = small_font.render(f"Enemies: {len(enemy_group)}/{progress[1]}", True, (255, 255, 255))
-                    screen.blit(enemy_text, (10, 40))
-        
+            # Draw game objects, plus the HUD during gameplay
+            draw_session(show_hud=current_state == PLAYING, alpha=alpha)
+
         # Draw menus on top
         if current_state == MAIN_MENU:
             main_menu.draw(screen)
@@ -309,10 +333,97 @@ def main():
         elif current_state == LEVEL_COMPLETE:
             level_complete_menu.draw(screen)
 
+        profiler_overlay.draw(screen)
+        frame_profiler.lap('draw')
+
         pygame.display.update()
+        frame_profiler.lap('display')
+        frame_profiler.end_frame()
+        if first_frame_ms is None:
+            first_frame_ms = (time.perf_counter() - started) * 1000
+            print(f"Time to first frame: {first_frame_ms:.0f} ms "
+                  f"(loading screen after {loading_screen_ms:.0f} ms)")
+            if exit_after_first_frame:
+                run = False
+        if renderer is not None:
+            # Menus cover the whole screen; the next dirty-rect frame starts from scratch
+            renderer.invalidate()
+
+    if simulation is not None:
+        simulation.stop()
+    level_manager.close()
+    frame_profiler.close_log()
+    if session.recorder is not None:
+        session.recorder.save(record)
+    pygame.quit()
+
+
+def main_headless(args):
+    """
+    Run levels without a window, as fast as possible, and print the results.
+
+    Args:
+        args: Parsed command line arguments
+    """
+    from managers.headless_runner import init_headless_display, run_headless, run_replay
+    from core.input import NullInput, ScriptedInput
+    from core.replay import Replay
 
+    init_headless_display()
+    if args.replay:
+        for segment_number, result in enumerate(run_replay(Replay.load(args.replay))):
+            print(f"segment {segment_number + 1}: {result}")
+        pygame.quit()
+        return
+
+    for run_number in range(args.runs):
+        input_source = ScriptedInput.sweep() if args.input == "sweep" else NullInput()
+        seed = None if args.seed is None else args.seed + run_number
+        result = run_headless(args.level - 1, input_source, args.max_ticks, seed=seed)
+        print(f"run {run_number + 1}: {result}")
     pygame.quit()
 
 
+def parse_args(argv=None):
+    """Parse the command line options"""
+    parser = argparse.ArgumentParser(description="Galaxy Shooter")
+    parser.add_argument("--fps", type=int, default=50,
+                        help="render frame rate cap; gameplay speed does not depend on it (default: 50)")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="during gameplay, redraw only the screen areas that changed")
+    parser.add_argument("--profile", action="store_true",
+                        help="start with the frame profiler overlay on (toggle with F3)")
+    parser.add_argument("--profile-log", metavar="PATH",
+                        help="stream per-frame phase timings to a .csv or .jsonl file")
+    parser.add_argument("--headless", action="store_true",
+                        help="simulate gameplay without a window, as fast as possible")
+    parser.add_argument("--level", type=int, default=1, choices=range(1, 6),
+                        help="level to play in headless mode (default: 1)")
+    parser.add_argument("--runs", type=int, default=1,
+                        help="number of headless runs (default: 1)")
+    parser.add_argument("--max-ticks", type=int, default=50 * 60 * 10,
+                        help="stop a headless run after this many ticks (default: 10 minutes of play)")
+    parser.add_argument("--input", choices=["null", "sweep"], default="null",
+                        help="headless input source (default: null)")
+    parser.add_argument("--seed", type=int,
+                        help="RNG seed of the first headless run (default: random)")
+    parser.add_argument("--record", metavar="PATH",
+                        help="record the levels played to a replay file")
+    parser.add_argument("--replay", metavar="PATH",
+                        help="re-run a replay file without a window, as fast as possible")
+    parser.add_argument("--exit-after-first-frame", action="store_true",
+                        help="quit once the main menu is shown (for startup benchmarks)")
+    parser.add_argument("--fixed-quality", action="store_true",
+                        help="keep cosmetic effects at full quality even when frames run over budget")
+    parser.add_argument("--threaded", action="store_true",
+                        help="run the game logic on a worker thread, separate from drawing")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    main()
+    options = parse_args()
+    if options.headless or options.replay:
+        main_headless(options)
+    else:
+        main(options.fps, options.dirty_rects, options.profile, options.profile_log, options.record,
+             options.exit_after_first_frame, not options.fixed_quality, options.threaded)
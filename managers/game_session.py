@@ -0,0 +1,422 @@
+"""
+Game Session for Galaxy Shooter
+
+This class owns the gameplay state of a run (the World of entities, the
+bullets and the current level) and advances it one tick at a time. The window, menus and
+event handling stay in main.py, so the same gameplay step can run inside
+the normal game loop or headless without a display.
+
+Design principles used:
+- Single Responsibility: Only gameplay state and rules live here
+- Separation of Concerns: Simulation (step) and presentation (draw) are separate
+- Abstraction: Player input arrives as Controls from any input source
+"""
+
+import numpy as np
+from entities.player import Player
+from core.input import NO_INPUT
+from core.events import SPAWNED
+from core.world import World, PLAYER, ENEMY, BOSS
+from core.sim_clock import sim_clock, TICK_MS
+from core.rng import game_rng, new_seed
+from core.spatial_hash import SpatialHash
+from core.fire_scheduler import FireScheduler
+from core.bullet_engine import BulletSystem
+from core.particles import effect_particles
+from core.text_cache import text_cache
+from core.hud import draw_hp_bar
+from core.snapshot import RenderSnapshot, RenderLayer, HudState, empty_layer
+from core.profiler import frame_profiler
+from core.quality import effects_quality
+from managers.level_manager import LevelManager
+
+# Outcomes returned by GameSession.step()
+GAME_OVER = "GAME_OVER"
+LEVEL_COMPLETE = "LEVEL_COMPLETE"
+
+# Causes of a game over, kept in GameSession.game_over_cause
+HIT_BY_BULLET = "BULLET"
+ENEMY_INVASION = "INVASION"  # An enemy got too close to the bottom of the screen
+
+# Sprites that moved further than this in one tick were teleported
+# (e.g. a recycled bullet) and are drawn without interpolation
+SNAP_DISTANCE = 50
+
+# Font size of the gameplay HUD text
+HUD_FONT_SIZE = 36
+
+
+class GameSession:
+    """
+    Gameplay state for one run of a level.
+
+    This class is responsible for:
+    - Creating the player and loading the level into the World
+    - Running shooting, collisions and one World update for each tick
+    - Reporting game over and level completion to the caller
+    - Drawing the game objects and the gameplay HUD
+
+    Each step() is one fixed simulation tick of game time. Sprite positions
+    from before the last tick are kept so draw() can interpolate between the
+    previous and current state when frames fall between ticks.
+    """
+
+    def __init__(self, screen_width, screen_height, level_manager=None):
+        """
+        Initialize the game session.
+
+        Args:
+            screen_width: Width of the game screen
+            screen_height: Height of the game screen
+            level_manager: LevelManager to load levels from (created if None)
+        """
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.level_manager = level_manager or LevelManager(screen_width, screen_height)
+        self.current_level = None
+
+        # Every live entity; the groups below are the World's own groups
+        self.world = World()
+        self.player = None
+        self.player_group = self.world.group(PLAYER)
+        self.enemy_group = self.world.group(ENEMY)
+        self.boss_group = self.world.group(BOSS)
+
+        # Bullets live in vectorized array systems rather than sprite groups
+        self.player_bullets = BulletSystem('bullet.png', -7, screen_width, screen_height)
+        self.enemy_bullets = BulletSystem('alien_bullet.png', 3, screen_width, screen_height)
+
+        # Explosions and sparks (shared with the bosses, which emit hit sparks)
+        self.particles = effect_particles
+
+        # Collision broadphase grid for enemies, rebuilt once per tick
+        self.enemy_grid = SpatialHash(screen_width, screen_height)
+
+        # Next shot time of every enemy in play
+        self.fire_scheduler = FireScheduler()
+        self.world.events.subscribe(SPAWNED, ENEMY, self.fire_scheduler.add)
+
+        self.ticks = 0
+        self.seed = None
+        self.game_over_cause = None
+        self.recorder = None  # Optional ReplayRecorder fed with every run and tick
+        self.interpolate = True  # Keep previous positions for draw(); off when nothing is drawn
+        self._hud_state = None  # HudState shown while the effects quality thins HUD updates
+        self._hud_age = 0
+        self._previous_positions = {}
+
+    def start(self, level_index=0, seed=None):
+        """
+        Initialize/reset the session to starting state with specified level.
+
+        Args:
+            level_index: Index of the level to start (0 = Level 1, 1 = Level 2, etc.)
+            seed: Seed for the game RNG (a fresh one if None)
+
+        Returns:
+            The loaded level instance, or None if invalid index
+        """
+        # Game time and randomness restart with every run so runs are reproducible
+        sim_clock.reset()
+        self.seed = new_seed() if seed is None else seed
+        game_rng.seed(self.seed)
+        if self.recorder is not None:
+            self.recorder.begin_segment(level_index, self.seed)
+
+        # Clear the World and the bullets, returning pooled sprites to their pools
+        self.world.clear()
+        self.fire_scheduler.clear()
+        self.player_bullets.clear()
+        self.enemy_bullets.clear()
+        self.particles.clear()
+        self._hud_state = None
+
+        # Load the level using level manager; it spawns its enemies into the World
+        self.current_level = self.level_manager.load_level(level_index, self.world)
+
+        # Create new player
+        self.player = Player(self.screen_width // 2, self.screen_height - 130, self.screen_width)
+        self.world.spawn(PLAYER, self.player)
+
+        self.ticks = 0
+        self.game_over_cause = None
+        self._previous_positions = {}
+        return self.current_level
+
+    def step(self, controls=NO_INPUT, dt=TICK_MS):
+        """
+        Advance gameplay by one fixed tick.
+
+        Args:
+            controls: Controls for this tick
+            dt: Length of the tick in milliseconds of game time
+
+        Returns:
+            GAME_OVER, LEVEL_COMPLETE or None if play continues
+        """
+        outcome = None
+        current_level = self.current_level
+        player = self.player
+        if self.recorder is not None:
+            self.recorder.record(controls)
+        self.ticks += 1
+        sim_clock.advance(dt)
+        if self.interpolate:
+            self._capture_previous_positions()
+
+        if controls.fire:
+            shot = player.shoot()
+            if shot:
+                self.player_bullets.spawn(*shot)
+
+        for shot in self.fire_scheduler.fire_due(sim_clock.now()):
+            self.enemy_bullets.spawn(*shot)
+
+        boss = current_level.get_boss() if current_level else None
+        if boss and not boss.is_defeated():
+            boss_shot = boss.update_shooting(dt)
+            if boss_shot:
+                if isinstance(boss_shot, list):
+                    for shot in boss_shot:
+                        self.enemy_bullets.spawn(*shot)
+                else:
+                    self.enemy_bullets.spawn(*boss_shot)
+
+        frame_profiler.lap('shooting')
+
+        self._collide_player_bullets_with_enemies()
+
+        if boss and not boss.is_defeated():
+            hit_bullets = self.player_bullets.collide_rect(boss.rect)
+            self.player_bullets.kill(hit_bullets)
+            for _ in hit_bullets:
+                if not boss.take_damage(1):
+
+                    self._spawn_explosion(boss.rect.center)
+                    self.world.kill(BOSS, boss)
+
+        if self.world.get_enemy_bottom() >= self.screen_height - 100:  # Near bottom edge
+            self._destroy_player()
+            self.game_over_cause = ENEMY_INVASION
+            outcome = GAME_OVER
+
+        # Player-enemy bullet collision (game over)
+        hit_by = self.enemy_bullets.collide_rect(player.rect)
+        if len(hit_by):
+            self.enemy_bullets.kill(hit_by)
+            self._destroy_player()
+            self.game_over_cause = HIT_BY_BULLET
+            outcome = GAME_OVER
+
+        # Check for level completion
+        if current_level and current_level.is_level_complete():
+            self.level_manager.mark_level_completed(self.level_manager.get_current_level_index())
+            outcome = LEVEL_COMPLETE
+        frame_profiler.lap('collision')
+
+        # Update every entity once, then the bullets and effects
+        self.world.update(controls, dt)
+        self.player_bullets.update()
+        self.enemy_bullets.update()
+        self.particles.update()
+        frame_profiler.lap('groups')
+
+        # Update level (spawns due waves and the boss into the World)
+        if current_level is not None:
+            current_level.update()
+        frame_profiler.lap('level')
+
+        return outcome
+
+    def _collide_player_bullets_with_enemies(self):
+        """
+        Destroy enemies hit by player bullets.
+
+        Each bullet is only tested against the enemies in the grid cells it
+        covers. A bullet is used up by the first enemies it hits; enemies
+        already destroyed by an earlier bullet this tick do not stop later
+        bullets.
+        """
+        if len(self.player_bullets) == 0:
+            return
+        self.enemy_grid.rebuild(self.enemy_group)
+        bullet_hits, enemies = self.player_bullets.collide_grid(self.enemy_grid)
+        spent_bullets = []
+        for bullet_index, enemy in zip(bullet_hits.tolist(), enemies):
+            if not enemy.alive():
+                continue
+            if not spent_bullets or spent_bullets[-1] != bullet_index:
+                spent_bullets.append(bullet_index)
+            self.world.kill(ENEMY, enemy)
+            self._spawn_explosion(enemy.rect.center)
+        self.player_bullets.kill(spent_bullets)
+
+    def _spawn_explosion(self, center):
+        """Emit an explosion effect centred on a point"""
+        self.particles.emit_explosion(*center)
+
+    def update_effects(self):
+        """Advance cosmetic effects by one tick (used while menus are shown over the game)"""
+        if self.interpolate:
+            self._capture_previous_positions()
+        self.particles.update()
+        frame_profiler.lap('groups')
+
+    def _drawn_groups(self):
+        """Get the sprite groups in drawing order"""
+        return (self.player_group, self.enemy_group, self.boss_group)
+
+    def _capture_previous_positions(self):
+        """Remember where every sprite was before this tick, for interpolation"""
+        self._previous_positions = {
+            sprite: sprite.rect.topleft
+            for group in self._drawn_groups()
+            for sprite in group
+        }
+
+    def _destroy_player(self):
+        """Blow up the player ship"""
+        self._spawn_explosion(self.player.rect.center)
+        self.world.kill(PLAYER, self.player)
+
+    def draw(self, surface, show_hud=True, alpha=1.0):
+        """
+        Draw the game objects and, during play, the HUD.
+
+        Args:
+            surface: Surface to draw on
+            show_hud: Draw the level info and boss HP bar
+            alpha: Fraction of the next tick elapsed; positions are
+                   interpolated from the previous tick (1.0 = current state)
+
+        Returns:
+            List of the screen rects that were drawn to
+        """
+        return self.draw_snapshot(surface, self.snapshot(), show_hud, alpha)
+
+    def draw_snapshot(self, surface, snapshot, show_hud=True, alpha=1.0):
+        """
+        Draw a snapshot taken by snapshot(), possibly on another thread.
+
+        Args:
+            surface: Surface to draw on
+            snapshot: RenderSnapshot to draw
+            show_hud: Draw the level info and boss HP bar
+            alpha: Fraction of the tick after the snapshot elapsed
+
+        Returns:
+            List of the screen rects that were drawn to
+        """
+        rects = snapshot.draw(surface, alpha)
+        if show_hud and snapshot.hud is not None:
+            rects += self.draw_hud(surface, snapshot.hud)
+        return rects
+
+    def snapshot(self):
+        """
+        Capture everything draw() shows, without references to live game
+        objects, so it can be drawn on another thread (see core.snapshot).
+
+        Returns:
+            RenderSnapshot of the current tick
+        """
+        # Same layering as before: player, bullets, enemies, enemy bullets, explosions, boss
+        player_group, enemy_group, boss_group = self._drawn_groups()
+        layers = (
+            self._group_layer(player_group),
+            self.player_bullets.render_layer(),
+            self._group_layer(enemy_group),
+            self.enemy_bullets.render_layer(),
+            self.particles.render_layer(),
+            self._group_layer(boss_group),
+        )
+        return RenderSnapshot(layers, self.hud_state(), self.ticks)
+
+    def _group_layer(self, group):
+        """
+        Capture a sprite group with the positions of this and the previous
+        tick. Sprites that jumped further than SNAP_DISTANCE are not interpolated.
+        """
+        sprites = group.sprites()
+        if not sprites:
+            return empty_layer()
+        current = np.array([sprite.rect.topleft for sprite in sprites], dtype=np.float64)
+        previous_positions = self._previous_positions
+        previous = np.array([previous_positions.get(sprite, sprite.rect.topleft) for sprite in sprites],
+                            dtype=np.float64)
+        far = (np.abs(current - previous) > SNAP_DISTANCE).any(axis=1)
+        previous[far] = current[far]
+        return RenderLayer([sprite.image for sprite in sprites],
+                           current[:, 0], current[:, 1], previous[:, 0], previous[:, 1])
+
+    def hud_state(self):
+        """
+        Get the values the HUD shows.
+
+        Returns:
+            HudState, or None when no level is loaded
+        """
+        current_level = self.current_level
+        if current_level is None:
+            return None
+        boss = current_level.get_boss()
+        boss_name = boss_hp = boss_max_hp = None
+        if boss and not boss.is_defeated():
+            boss_name = boss.get_boss_name()
+            boss_hp = boss.current_hp
+            boss_max_hp = boss.max_hp
+        # Enemy count only until the boss has appeared
+        enemies = None if boss else len(self.enemy_group)
+        return HudState(current_level.level_number, current_level.get_level_name(),
+                        boss_name, boss_hp, boss_max_hp, enemies, current_level.get_progress()[1])
+
+    def draw_hud(self, surface, state=None):
+        """
+        Draw the level info and, when a boss is alive, its name and HP bar.
+        While the effects quality thins the HUD updates, the values shown
+        are only refreshed every few frames, so changing numbers do not
+        have their text rendered again on every frame; in between, the same
+        cached text surfaces are blitted.
+
+        Args:
+            surface: Surface to draw on
+            state: HudState to show (the session's current state if None)
+
+        Returns:
+            List of the screen rects that were drawn to
+        """
+        if state is None:
+            state = self.hud_state()
+        interval = effects_quality.settings.hud_interval
+        if interval == 1:
+            self._hud_state = None
+            return self._render_hud(surface, state)
+
+        self._hud_age += 1
+        if self._hud_state is None or self._hud_age >= interval:
+            self._hud_state = state
+            self._hud_age = 0
+        return self._render_hud(surface, self._hud_state)
+
+    def _render_hud(self, surface, state):
+        """Draw a HudState onto a surface and return the rects drawn to"""
+        rects = []
+
+        # Draw boss HP bar if boss exists
+        if state.boss_name is not None:
+            # Draw boss HP bar at top of screen
+            boss_text = text_cache.render(f"Boss: {state.boss_name}", (255, 255, 255), HUD_FONT_SIZE)
+            rects.append(surface.blit(boss_text, (self.screen_width // 2 - boss_text.get_width() // 2, 10)))
+            rects.append(draw_hp_bar(surface, self.screen_width // 2 - 100, 35, 200, 15,
+                                     state.boss_hp, state.boss_max_hp))
+
+        # Draw level info HUD during gameplay
+        level_info = f"Level {state.level_number}: {state.level_name}"
+        level_text = text_cache.render(level_info, (255, 255, 255), HUD_FONT_SIZE)
+        rects.append(surface.blit(level_text, (10, 10)))
+
+        # Draw enemy count (only if no boss or boss not spawned)
+        if state.enemies is not None:
+            enemy_text = text_cache.render(f"Enemies: {state.enemies}/{state.total_enemies}", (255, 255, 255), HUD_FONT_SIZE)
+            rects.append(surface.blit(enemy_text, (10, 40)))
+        return rects
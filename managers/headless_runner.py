@@ -0,0 +1,105 @@
+"""
+Headless Runner for Galaxy Shooter
+
+Runs the PLAYING logic of a GameSession without a window. SDL's dummy
+video driver is used so images can still be loaded and converted, nothing
+is ever drawn or flipped, and ticks are stepped back to back as fast as
+the CPU allows. Useful for simulating many level runs on CI machines.
+"""
+
+import os
+import time
+import pygame
+from core.assets import asset_cache
+from core.input import NullInput
+from core.pool import warm_pools
+from core.replay import ReplayInput
+from core.sim_clock import TICK_MS
+from managers.game_session import GameSession
+
+
+def init_headless_display(screen_width=600, screen_height=800):
+    """
+    Initialize pygame on SDL's dummy video driver and load all assets.
+
+    Args:
+        screen_width: Width of the (invisible) game screen
+        screen_height: Height of the (invisible) game screen
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    # Only the modules gameplay needs: pygame.init() would also start the
+    # audio thread, which is useless here and can deadlock forked workers
+    pygame.display.init()
+    pygame.font.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((screen_width, screen_height))
+    asset_cache.load_pack()
+    asset_cache.preload()
+    warm_pools()
+
+
+def run_headless(level_index=0, input_source=None, max_ticks=None, session=None, dt=TICK_MS, seed=None):
+    """
+    Play one level without rendering until it is won, lost or times out.
+
+    Args:
+        level_index: Index of the level to play (0 = Level 1)
+        input_source: Object with a poll() method returning Controls (NullInput if None)
+        max_ticks: Stop after this many ticks (None = run until the level ends)
+        session: GameSession to use (a new 600x800 session if None)
+        dt: Milliseconds of game time per tick
+        seed: Seed for the game RNG (a fresh one if None)
+
+    Returns:
+        Dictionary describing the run
+    """
+    if pygame.display.get_surface() is None:
+        init_headless_display()
+    if session is None:
+        width, height = pygame.display.get_surface().get_size()
+        session = GameSession(width, height)
+    session.interpolate = False  # Nothing is drawn
+    session.particles.enabled = False
+    input_source = input_source or NullInput()
+
+    level = session.start(level_index, seed)
+    outcome = None
+    started = time.perf_counter()
+    while outcome is None and (max_ticks is None or session.ticks < max_ticks):
+        outcome = session.step(input_source.poll(), dt)
+    elapsed = time.perf_counter() - started
+
+    killed, total = level.get_progress() if level else (0, 0)
+    return {
+        'level': level_index + 1,
+        'seed': session.seed,
+        'outcome': outcome or "TIMEOUT",
+        'cause': session.game_over_cause,
+        'ticks': session.ticks,
+        'enemies_killed': killed,
+        'total_enemies': total,
+        'elapsed_seconds': elapsed,
+        'ticks_per_second': session.ticks / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def run_replay(replay, session=None):
+    """
+    Re-run every segment of a recorded session at maximum speed.
+
+    Each segment is played until it reaches its outcome or its recorded
+    input runs out (e.g. the player quit to the menu mid-level).
+
+    Args:
+        replay: Replay to play back
+        session: GameSession to use (a new 600x800 session if None)
+
+    Returns:
+        List with one run_headless() result per segment
+    """
+    results = []
+    for segment in replay.segments:
+        results.append(run_headless(segment.level_index, ReplayInput(segment),
+                                    segment.ticks, session, seed=segment.seed))
+    return results
@@ -11,9 +11,23 @@ Design principles used:
 - Single Responsibility: Manages only level-related concerns
 - Encapsulation: Keeps level state and logic together
 - Abstraction: Provides simple interface for level management
+- Performance: Levels are built on first use, and the next level can be
+  prefetched on a worker thread while the level-complete screen is shown
 """
 
-from levels import Level1, Level2, Level3, Level4, Level5
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Level classes in play order, as (module, class name); a level's module
+# is only imported when the level is first built
+LEVEL_CLASSES = (
+    ('levels.level_1', 'Level1'),
+    ('levels.level_2', 'Level2'),
+    ('levels.level_3', 'Level3'),
+    ('levels.level_4', 'Level4'),
+    ('levels.level_5', 'Level5'),
+)
 
 
 class LevelManager:
@@ -21,7 +35,8 @@ class LevelManager:
     Manages all levels in the game.
     
     This class is responsible for:
-    - Creating and storing level instances
+    - Creating (lazily) and storing level instances
+    - Prefetching the next level in the background
     - Switching between levels
     - Tracking game progression
     - Providing level information
@@ -38,14 +53,13 @@ class LevelManager:
         self.screen_width = screen_width
         self.screen_height = screen_height
         
-        # Create all level instances
-        self.levels = [
-            Level1(screen_width, screen_height),
-            Level2(screen_width, screen_height),
-            Level3(screen_width, screen_height),
-            Level4(screen_width, screen_height),
-            Level5(screen_width, screen_height)
-        ]
+        # Level instances, created the first time each level is needed
+        self._levels = [None] * len(LEVEL_CLASSES)
+        self._levels_lock = threading.Lock()
+        
+        # Background prefetching (worker thread started on first use)
+        self._prefetcher = None
+        self._prefetches = {}  # level index -> Future
         
         # Current level tracking
         self.current_level_index = 0
@@ -56,7 +70,58 @@ class LevelManager:
         
     def get_level_count(self):
         """Get the total number of levels"""
-        return len(self.levels)
+        return len(LEVEL_CLASSES)
+    
+    def get_level(self, level_index):
+        """
+        Get a level instance, creating it on first use.
+        
+        Args:
+            level_index: Index of the level (0-4 for levels 1-5)
+            
+        Returns:
+            The level instance, or None if invalid index
+        """
+        if not 0 <= level_index < len(LEVEL_CLASSES):
+            return None
+        with self._levels_lock:
+            level = self._levels[level_index]
+            if level is None:
+                module, class_name = LEVEL_CLASSES[level_index]
+                level_class = getattr(__import__(module, fromlist=[class_name]), class_name)
+                level = level_class(self.screen_width, self.screen_height)
+                self._levels[level_index] = level
+        return level
+    
+    def prefetch_level(self, level_index):
+        """
+        Prepare a level on a worker thread so loading it later is instant.
+        
+        The level object, its enemy formation and enemy sprites are built
+        in the background. Does nothing for an
+        invalid index or a level already being prefetched.
+        
+        Args:
+            level_index: Index of the level to prepare
+        """
+        if not 0 <= level_index < len(LEVEL_CLASSES) or level_index in self._prefetches:
+            return
+        if self._prefetcher is None:
+            self._prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-prefetch")
+        self._prefetches[level_index] = self._prefetcher.submit(self._prefetch, level_index)
+    
+    def close(self):
+        """Shut down the prefetch thread, dropping prefetches not started yet"""
+        if self._prefetcher is not None:
+            self._prefetcher.shutdown(wait=False, cancel_futures=True)
+            self._prefetcher = None
+            self._prefetches.clear()
+    
+    def _prefetch(self, level_index):
+        """Build a level and its enemies (runs on the prefetch thread)"""
+        # A private RNG keeps the game RNG untouched; the enemies roll their
+        # real traits from the game RNG when the level is loaded
+        self.get_level(level_index).prefetch(random.Random())
     
     def get_current_level_index(self):
         """Get the current level index (0-based)"""
@@ -66,40 +131,57 @@ class LevelManager:
         """Get the current level instance"""
         return self.current_level
     
-    def load_level(self, level_index):
+    def load_level(self, level_index, world):
         """
-        Load a specific level by index.
+        Load a specific level by index and spawn its enemies.
         
         Args:
             level_index: Index of the level to load (0-4 for levels 1-5)
+            world: World the level is played in
             
         Returns:
             The loaded level instance, or None if invalid index
         """
-        if 0 <= level_index < len(self.levels):
+        if 0 <= level_index < len(LEVEL_CLASSES):
+            prefetch = self._prefetches.pop(level_index, None)
+            if prefetch is not None:
+                prefetch.result()  # Normally finished long ago
+            if self.current_level is not None:
+                self.current_level.detach()
             self.current_level_index = level_index
-            self.current_level = self.levels[level_index]
+            self.current_level = self.get_level(level_index)
+            self.current_level.attach(world)
             self.current_level.spawn_enemies()
             return self.current_level
         return None
     
-    def load_next_level(self):
+    def load_next_level(self, world):
         """
         Load the next level in sequence.
         
+        Args:
+            world: World the level is played in
+        
         Returns:
             The next level instance, or None if no next level exists
         """
         next_index = self.current_level_index + 1
-        if next_index < len(self.levels):
-            return self.load_level(next_index)
+        if next_index < len(LEVEL_CLASSES):
+            return self.load_level(next_index, world)
         return None
     
-    def restart_current_level(self):
-        """Restart the current level"""
+    def restart_current_level(self, world):
+        """
+        Restart the current level.
+        
+        Args:
+            world: World the level is played in
+        
+        Returns:
+            The restarted level instance, or None if no level is loaded
+        """
         if self.current_level:
-            self.current_level.reset()
-            return self.current_level
+            return self.load_level(self.current_level_index, world)
         return None
     
     def mark_level_completed(self, level_index):
@@ -138,8 +220,8 @@ class LevelManager:
             level = self.current_level
             index = self.current_level_index
         else:
-            if 0 <= level_index < len(self.levels):
-                level = self.levels[level_index]
+            if 0 <= level_index < len(LEVEL_CLASSES):
+                level = self.get_level(level_index)
                 index = level_index
             else:
                 return None
@@ -158,7 +240,7 @@ class LevelManager:
         Returns:
             List of dictionaries with information for each level
         """
-        return [self.get_level_info(i) for i in range(len(self.levels))]
+        return [self.get_level_info(i) for i in range(len(LEVEL_CLASSES))]
     
     def get_progress_stats(self):
         """
@@ -168,18 +250,23 @@ class LevelManager:
             Dictionary with progress information
         """
         return {
-            'total_levels': len(self.levels),
+            'total_levels': len(LEVEL_CLASSES),
             'completed_levels': len(self.levels_completed),
             'current_level': self.current_level_index + 1 if self.current_level else 0,
-            'completion_percentage': (len(self.levels_completed) / len(self.levels)) * 100
+            'completion_percentage': (len(self.levels_completed) / len(LEVEL_CLASSES)) * 100
         }
     
     def reset_progress(self):
         """Reset all progress (for new game)"""
+        # A prefetch still running would fill a level after its reset
+        for prefetch in self._prefetches.values():
+            prefetch.result()
+        self._prefetches.clear()
         self.levels_completed.clear()
         self.current_level_index = 0
         self.current_level = None
         
-        # Reset all individual levels
-        for level in self.levels:
-            level.reset()
\ No newline at end of file
+        # Reset all individual levels (levels never built are still pristine)
+        for level in self._levels:
+            if level is not None:
+                level.reset()
\ No newline at end of file
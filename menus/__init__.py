@@ -1,8 +1,32 @@
-from .base_menu import BaseMenu
-from .main_menu import MainMenu
-from .game_over_menu import GameOverMenu
-from .pause_menu import PauseMenu
-from .level_complete_menu import LevelCompleteMenu
-from .level_select_menu import LevelSelectMenu
-
-__all__ = ['BaseMenu', 'MainMenu', 'GameOverMenu', 'PauseMenu', 'LevelCompleteMenu', 'LevelSelectMenu']
\ No newline at end of file
+"""
+Menus and screens. Names are imported from their modules on first access
+(PEP 562), so the loading screen can be shown before the menus are imported.
+"""
+
+# Exported name -> module it lives in
+_EXPORTS = {
+    'BaseMenu': '.base_menu',
+    'MainMenu': '.main_menu',
+    'GameOverMenu': '.game_over_menu',
+    'PauseMenu': '.pause_menu',
+    'LevelCompleteMenu': '.level_complete_menu',
+    'LevelSelectMenu': '.level_select_menu',
+    'LoadingScreen': '.loading_screen',
+}
+
+__all__ = ['BaseMenu', 'MainMenu', 'GameOverMenu', 'PauseMenu', 'LevelCompleteMenu', 'LevelSelectMenu',
+           'LoadingScreen']
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # __import__ rather than importlib, so -X importtime reports the module
+    value = getattr(__import__(__name__ + module, fromlist=[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
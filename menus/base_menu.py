@@ -1,16 +1,32 @@
 from abc import ABC, abstractmethod
 import pygame
+from core.text_cache import fonts, text_cache
 
 
 class BaseMenu(ABC):
-    """Abstract Base Class for all game menus"""
+    """
+    Abstract Base Class for all game menus
+    
+    Menus are drawn from two cached layers: a static layer (overlay, title,
+    instructions) built by draw_static(), and an options layer holding the
+    option list with its selection highlight. Each layer is only rebuilt
+    when its key changes, so a menu costs one or two blits per frame.
+    """
+    
+    # Opacity of the dark overlay drawn over the game scene
+    OVERLAY_ALPHA = 180
+    
+    # Font sizes shared by every menu
+    LARGE = 74
+    MEDIUM = 48
+    SMALL = 36
     
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.font_large = pygame.font.Font(None, 74)
-        self.font_medium = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 36)
+        self.font_large = fonts.get(self.LARGE)
+        self.font_medium = fonts.get(self.MEDIUM)
+        self.font_small = fonts.get(self.SMALL)
         
         self.WHITE = (255, 255, 255)
         self.BLACK = (0, 0, 0)
@@ -24,9 +40,25 @@ class BaseMenu(ABC):
         self.selected_option = 0
         self.options = []
         
+        self._static_layer = None
+        self._static_key = None
+        self._options_layer = None
+        self._options_key = None
+        
+    def render_text(self, text, color, size):
+        """
+        Get rendered text from the shared text cache.
+        
+        Args:
+            text: String to render
+            color: RGB color tuple
+            size: Font size (LARGE, MEDIUM or SMALL)
+        """
+        return text_cache.render(text, color, size)
+    
     def draw_title(self, surface, title):
         """Draw the menu title"""
-        title_text = self.font_large.render(title, True, self.WHITE)
+        title_text = self.render_text(title, self.WHITE, self.LARGE)
         title_rect = title_text.get_rect(center=(self.screen_width // 2, 150))
         surface.blit(title_text, title_rect)
         
@@ -37,24 +69,75 @@ class BaseMenu(ABC):
         
         for i, option in enumerate(self.options):
             color = self.YELLOW if i == self.selected_option else self.WHITE
-            option_text = self.font_medium.render(option, True, color)
+            option_text = self.render_text(option, color, self.MEDIUM)
             option_rect = option_text.get_rect(center=(self.screen_width // 2, start_y + i * option_spacing))
             surface.blit(option_text, option_rect)
             
             # Draw selection indicator
             if i == self.selected_option:
-                indicator = self.font_medium.render("> ", True, self.YELLOW)
+                indicator = self.render_text("> ", self.YELLOW, self.MEDIUM)
                 indicator_rect = indicator.get_rect()
                 indicator_rect.right = option_rect.left - 10
                 indicator_rect.centery = option_rect.centery
                 surface.blit(indicator, indicator_rect)
     
-    def draw_background(self, surface):
-        """Draw semi-transparent background overlay"""
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(180)
-        overlay.fill(self.BLACK)
-        surface.blit(overlay, (0, 0))
+    def draw_static(self, layer):
+        """
+        Draw the content that does not change between frames (title,
+        descriptions, instructions). Override in subclasses.
+        
+        Args:
+            layer: Transparent surface on top of the overlay
+        """
+        pass
+    
+    def get_static_key(self):
+        """
+        Return a value that changes whenever draw_static() would draw
+        something different. Override in subclasses with changing content.
+        """
+        return None
+    
+    def get_static_layer(self):
+        """Get the overlay and static content pre-composited into one surface"""
+        key = self.get_static_key()
+        if self._static_layer is None or key != self._static_key:
+            layer = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+            layer.fill((*self.BLACK, self.OVERLAY_ALPHA))
+            self.draw_static(layer)
+            self._static_layer = layer
+            self._static_key = key
+        return self._static_layer
+    
+    def get_options_layer(self):
+        """
+        Get the option list with its selection highlight as a surface cropped
+        to its content, rebuilt only when the selection or options change.
+        
+        Returns:
+            (surface, position) tuple
+        """
+        key = (self.selected_option, tuple(self.options))
+        if self._options_layer is None or key != self._options_key:
+            layer = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+            self.draw_options(layer)
+            bounds = layer.get_bounding_rect()
+            self._options_layer = (layer.subsurface(bounds).copy(), bounds.topleft)
+            self._options_key = key
+        return self._options_layer
+    
+    def draw_cached(self, surface, show_options=True):
+        """
+        Draw the cached static layer and, optionally, the options layer.
+        
+        Args:
+            surface: Surface to draw on
+            show_options: Draw the option list
+        """
+        surface.blit(self.get_static_layer(), (0, 0))
+        if show_options:
+            options, position = self.get_options_layer()
+            surface.blit(options, position)
     
     def handle_input(self, event):
         """Handle menu input navigation"""
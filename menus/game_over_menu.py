@@ -22,24 +22,28 @@ class GameOverMenu(BaseMenu):
     
     def draw(self, surface):
         """Draw the game over menu"""
-        self.draw_background(surface)
-        
-        game_over_text = self.font_large.render("GAME OVER", True, self.RED)
+        self.draw_cached(surface, show_options=self.timer >= self.show_delay)
+    
+    def get_static_key(self):
+        """The static content changes once the options become available"""
+        return self.timer >= self.show_delay
+    
+    def draw_static(self, layer):
+        """Draw the title and instructions (or waiting message) into the cached layer"""
+        game_over_text = self.render_text("GAME OVER", self.RED, self.LARGE)
         game_over_rect = game_over_text.get_rect(center=(self.screen_width // 2, 200))
-        surface.blit(game_over_text, game_over_rect)
+        layer.blit(game_over_text, game_over_rect)
         
         if self.timer >= self.show_delay:
-            self.draw_options(surface)
-            
             instructions = "Use UP/DOWN or W/S to navigate, ENTER/SPACE to select"
-            instruction_text = self.font_small.render(instructions, True, self.GRAY)
+            instruction_text = self.render_text(instructions, self.GRAY, self.SMALL)
             instruction_rect = instruction_text.get_rect(center=(self.screen_width // 2, self.screen_height - 50))
-            surface.blit(instruction_text, instruction_rect)
+            layer.blit(instruction_text, instruction_rect)
         else:
 
-            waiting_text = self.font_medium.render("Press any key to continue...", True, self.WHITE)
+            waiting_text = self.render_text("Press any key to continue...", self.WHITE, self.MEDIUM)
             waiting_rect = waiting_text.get_rect(center=(self.screen_width // 2, 350))
-            surface.blit(waiting_text, waiting_rect)
+            layer.blit(waiting_text, waiting_rect)
     
     def handle_input(self, event):
         """Handle game over menu input"""
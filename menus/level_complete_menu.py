@@ -59,46 +59,51 @@ class LevelCompleteMenu(BaseMenu):
     
     def draw(self, surface):
         """Draw the level complete menu"""
-        self.draw_background(surface)
+        self.draw_cached(surface, show_options=self.can_proceed)
         
-        title_text = self.font_large.render("LEVEL COMPLETE!", True, self.GREEN)
+        if not self.can_proceed:
+            # Countdown text only changes once per second (cached by the text cache)
+            remaining_time = max(0, (self.wait_time - self.timer) // 1000 + 1)
+            timer_message = f"Please wait {remaining_time} seconds before continuing..."
+            timer_text = self.render_text(timer_message, self.YELLOW, self.SMALL)
+            timer_rect = timer_text.get_rect(center=(self.screen_width // 2, 350))
+            surface.blit(timer_text, timer_rect)
+    
+    def get_static_key(self):
+        """The static content depends on the level and whether options are available"""
+        return (self.current_level, self.level_name, self.can_proceed)
+    
+    def draw_static(self, layer):
+        """Draw the title, level info, messages and instructions into the cached layer"""
+        title_text = self.render_text("LEVEL COMPLETE!", self.GREEN, self.LARGE)
         title_rect = title_text.get_rect(center=(self.screen_width // 2, 120))
-        surface.blit(title_text, title_rect)
+        layer.blit(title_text, title_rect)
         
         level_info = f"Level {self.current_level}: {self.level_name}"
-        level_text = self.font_medium.render(level_info, True, self.WHITE)
+        level_text = self.render_text(level_info, self.WHITE, self.MEDIUM)
         level_rect = level_text.get_rect(center=(self.screen_width // 2, 200))
-        surface.blit(level_text, level_rect)
+        layer.blit(level_text, level_rect)
         
         if self.current_level < self.total_levels:
             message = "Great job! Ready for the next challenge?"
         else:
             message = "CONGRATULATIONS! You've completed all levels!"
-            victory_text = self.font_medium.render(message, True, self.YELLOW)
+            victory_text = self.render_text(message, self.YELLOW, self.MEDIUM)
             victory_rect = victory_text.get_rect(center=(self.screen_width // 2, 250))
-            surface.blit(victory_text, victory_rect)
+            layer.blit(victory_text, victory_rect)
             message = "You are a true Galaxy Shooter champion!"
         
-        message_text = self.font_small.render(message, True, self.WHITE)
+        message_text = self.render_text(message, self.WHITE, self.SMALL)
         message_rect = message_text.get_rect(center=(self.screen_width // 2, 280 if self.current_level < self.total_levels else 300))
-        surface.blit(message_text, message_rect)
-        
-        if not self.can_proceed:
-            remaining_time = max(0, (self.wait_time - self.timer) // 1000 + 1)
-            timer_message = f"Please wait {remaining_time} seconds before continuing..."
-            timer_text = self.font_small.render(timer_message, True, self.YELLOW)
-            timer_rect = timer_text.get_rect(center=(self.screen_width // 2, 350))
-            surface.blit(timer_text, timer_rect)
-        else:
-            self.draw_options(surface)
+        layer.blit(message_text, message_rect)
         
         if self.can_proceed:
             instructions = "Use UP/DOWN or W/S to navigate, ENTER/SPACE to select"
         else:
             instructions = "Enjoy your victory! Options will be available shortly..."
-        instruction_text = self.font_small.render(instructions, True, self.GRAY)
+        instruction_text = self.render_text(instructions, self.GRAY, self.SMALL)
         instruction_rect = instruction_text.get_rect(center=(self.screen_width // 2, self.screen_height - 50))
-        surface.blit(instruction_text, instruction_rect)
+        layer.blit(instruction_text, instruction_rect)
     
     def execute_option(self):
         """Execute the selected menu option"""
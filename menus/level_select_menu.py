@@ -30,40 +30,50 @@ class LevelSelectMenu(BaseMenu):
     
     def draw(self, surface):
         """Draw the level selection menu"""
-        self.draw_background(surface)
+        self.draw_cached(surface)
+    
+    def draw_static(self, layer):
+        """Draw the title, every level in its unselected colors and the instructions"""
+        self.draw_title(layer, "SELECT LEVEL")
+        
+        for i in range(len(self.level_names)):
+            self._draw_level_entry(layer, i, self.WHITE, (100, 100, 100))
         
-        self.draw_title(surface, "SELECT LEVEL")
+        instructions = "Use UP/DOWN or W/S to navigate, ENTER/SPACE to select"
+        instruction_text = self.render_text(instructions, self.GRAY, self.SMALL)
+        instruction_rect = instruction_text.get_rect(center=(self.screen_width // 2, self.screen_height - 50))
+        layer.blit(instruction_text, instruction_rect)
+    
+    def draw_options(self, surface):
+        """Draw only the selected level, highlighted, over the static list"""
+        name_rect = self._draw_level_entry(surface, self.selected_option, self.YELLOW, self.GRAY)
+        
+        indicator = self.render_text("> ", self.YELLOW, self.MEDIUM)
+        indicator_rect = indicator.get_rect()
+        indicator_rect.right = name_rect.left - 10
+        indicator_rect.centery = name_rect.centery
+        surface.blit(indicator, indicator_rect)
+    
+    def _draw_level_entry(self, surface, i, name_color, desc_color):
+        """
+        Draw one level name and its description.
         
+        Returns:
+            Rect of the level name
+        """
         start_y = 250
         option_spacing = 70
         
-        for i, (level_name, description) in enumerate(zip(self.level_names, self.level_descriptions)):
-
-            name_color = self.YELLOW if i == self.selected_option else self.WHITE
-            desc_color = self.GRAY if i == self.selected_option else (100, 100, 100)
-            
-            name_text = self.font_medium.render(level_name, True, name_color)
-            name_rect = name_text.get_rect(center=(self.screen_width // 2, start_y + i * option_spacing))
-            surface.blit(name_text, name_rect)
-            
-
-            if i < len(self.level_descriptions) - 1:
-                desc_text = self.font_small.render(description, True, desc_color)
-                desc_rect = desc_text.get_rect(center=(self.screen_width // 2, start_y + i * option_spacing + 25))
-                surface.blit(desc_text, desc_rect)
-            
-
-            if i == self.selected_option:
-                indicator = self.font_medium.render("> ", True, self.YELLOW)
-                indicator_rect = indicator.get_rect()
-                indicator_rect.right = name_rect.left - 10
-                indicator_rect.centery = name_rect.centery
-                surface.blit(indicator, indicator_rect)
+        name_text = self.render_text(self.level_names[i], name_color, self.MEDIUM)
+        name_rect = name_text.get_rect(center=(self.screen_width // 2, start_y + i * option_spacing))
+        surface.blit(name_text, name_rect)
         
-        instructions = "Use UP/DOWN or W/S to navigate, ENTER/SPACE to select"
-        instruction_text = self.font_small.render(instructions, True, self.GRAY)
-        instruction_rect = instruction_text.get_rect(center=(self.screen_width // 2, self.screen_height - 50))
-        surface.blit(instruction_text, instruction_rect)
+        if i < len(self.level_descriptions) - 1:
+            desc_text = self.render_text(self.level_descriptions[i], desc_color, self.SMALL)
+            desc_rect = desc_text.get_rect(center=(self.screen_width // 2, start_y + i * option_spacing + 25))
+            surface.blit(desc_text, desc_rect)
+        
+        return name_rect
     
     def execute_option(self):
         """Execute the selected menu option"""
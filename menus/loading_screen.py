@@ -0,0 +1,44 @@
+import pygame
+from core.text_cache import text_cache
+
+
+class LoadingScreen:
+    """
+    Screen shown while the assets load at start-up: a title and a
+    progress bar. It needs no images, so it can be drawn before any
+    asset has been decoded.
+    """
+    
+    BAR_WIDTH = 400
+    BAR_HEIGHT = 24
+    FONT_SIZE = 48
+    
+    def __init__(self, screen_width, screen_height):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        
+        self.WHITE = (255, 255, 255)
+        self.BLACK = (0, 0, 0)
+        self.GRAY = (128, 128, 128)
+        
+    def draw(self, surface, progress):
+        """
+        Draw the loading screen.
+        
+        Args:
+            surface: Surface to draw on
+            progress: Fraction of the assets loaded (0.0-1.0)
+        """
+        surface.fill(self.BLACK)
+        
+        title = text_cache.render("Loading...", self.WHITE, self.FONT_SIZE)
+        title_rect = title.get_rect(center=(self.screen_width // 2, self.screen_height // 2 - 50))
+        surface.blit(title, title_rect)
+        
+        bar = pygame.Rect(0, 0, self.BAR_WIDTH, self.BAR_HEIGHT)
+        bar.center = (self.screen_width // 2, self.screen_height // 2 + 10)
+        pygame.draw.rect(surface, self.GRAY, bar, 2)
+        filled = bar.inflate(-6, -6)
+        filled.width = int(filled.width * max(0.0, min(progress, 1.0)))
+        if filled.width > 0:
+            pygame.draw.rect(surface, self.WHITE, filled)
@@ -11,15 +11,17 @@ class MainMenu(BaseMenu):
     
     def draw(self, surface):
         """Draw the main menu"""
-        self.draw_background(surface)
-        self.draw_title(surface, "GALAXY SHOOTER")
-        self.draw_options(surface)
+        self.draw_cached(surface)
+    
+    def draw_static(self, layer):
+        """Draw the title and instructions into the cached layer"""
+        self.draw_title(layer, "GALAXY SHOOTER")
         
         # Draw instructions
         instructions = "Use UP/DOWN or W/S to navigate, ENTER/SPACE to select"
-        instruction_text = self.font_small.render(instructions, True, self.GRAY)
+        instruction_text = self.render_text(instructions, self.GRAY, self.SMALL)
         instruction_rect = instruction_text.get_rect(center=(self.screen_width // 2, self.screen_height - 50))
-        surface.blit(instruction_text, instruction_rect)
+        layer.blit(instruction_text, instruction_rect)
     
     def execute_option(self):
         """Execute the selected menu option"""
@@ -11,21 +11,23 @@ class PauseMenu(BaseMenu):
     
     def draw(self, surface):
         """Draw the pause menu"""
-        self.draw_background(surface)
-        self.draw_title(surface, "GAME PAUSED")
-        self.draw_options(surface)
+        self.draw_cached(surface)
+    
+    def draw_static(self, layer):
+        """Draw the title and instructions into the cached layer"""
+        self.draw_title(layer, "GAME PAUSED")
         
         # Draw instructions
         instructions_1 = "Use UP/DOWN or W/S to navigate, ENTER/SPACE to select"
         instructions_2 = "Press ESC or P to resume game"
         
-        instruction_text_1 = self.font_small.render(instructions_1, True, self.GRAY)
+        instruction_text_1 = self.render_text(instructions_1, self.GRAY, self.SMALL)
         instruction_rect_1 = instruction_text_1.get_rect(center=(self.screen_width // 2, self.screen_height - 80))
-        surface.blit(instruction_text_1, instruction_rect_1)
+        layer.blit(instruction_text_1, instruction_rect_1)
         
-        instruction_text_2 = self.font_small.render(instructions_2, True, self.GRAY)
+        instruction_text_2 = self.render_text(instructions_2, self.GRAY, self.SMALL)
         instruction_rect_2 = instruction_text_2.get_rect(center=(self.screen_width // 2, self.screen_height - 50))
-        surface.blit(instruction_text_2, instruction_rect_2)
+        layer.blit(instruction_text_2, instruction_rect_2)
     
     def execute_option(self):
         """Execute the selected menu option"""
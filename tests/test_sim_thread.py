@@ -0,0 +1,96 @@
+"""
+Tests for the simulation thread's pause/resume and outcome hand-over.
+"""
+
+import threading
+import time
+import unittest
+from core.input import NullInput
+from core.sim_thread import SimulationThread
+
+GAME_OVER = "GAME_OVER"
+
+# Seconds to wait for the worker before failing
+TIMEOUT = 2.0
+
+
+class BlockingSession:
+    """Session stand-in whose steps wait until the test lets them finish"""
+
+    def __init__(self, outcome=None):
+        self.outcome = outcome
+        self.release = threading.Event()
+        self.steps = 0
+
+    def step(self, controls, dt):
+        self.release.wait(TIMEOUT)
+        self.steps += 1
+        return self.outcome
+
+    def snapshot(self):
+        return self.steps
+
+
+def wait_until(condition):
+    """Poll a condition until it holds or TIMEOUT runs out"""
+    deadline = time.perf_counter() + TIMEOUT
+    while not condition():
+        if time.perf_counter() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+
+class SimulationThreadTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = BlockingSession(GAME_OVER)
+        self.simulation = SimulationThread(self.session, NullInput(), step_ms=1)
+        self.simulation.start()
+
+    def tearDown(self):
+        self.session.release.set()
+        self.simulation.stop()
+
+    def test_outcome_published_between_take_and_resume_is_kept(self):
+        simulation = self.simulation
+        simulation.resume()
+
+        # The main loop finds no outcome while the tick is still running...
+        self.assertIsNone(simulation.take_outcome())
+        # ...the tick then ends the game and the worker pauses itself...
+        self.session.release.set()
+        self.assertTrue(wait_until(lambda: not simulation.running))
+        # ...before the main loop gets to resume() in the same frame
+        simulation.resume()
+
+        self.assertFalse(simulation.running)
+        self.assertEqual(simulation.take_outcome(), GAME_OVER)
+        self.assertEqual(self.session.steps, 1)
+
+    def test_resume_after_taking_the_outcome_runs_again(self):
+        simulation = self.simulation
+        simulation.resume()
+        self.session.release.set()
+        self.assertTrue(wait_until(lambda: not simulation.running))
+
+        self.assertEqual(simulation.take_outcome(), GAME_OVER)
+        simulation.resume()
+        self.assertTrue(wait_until(lambda: self.session.steps >= 2))
+
+    def test_pause_waits_for_the_running_tick(self):
+        simulation = self.simulation
+        self.session.outcome = None
+        simulation.resume()
+        self.assertTrue(wait_until(lambda: simulation._stepping))
+
+        threading.Timer(0.05, self.session.release.set).start()
+        simulation.pause()
+        steps = self.session.steps
+        self.assertEqual(steps, 1)
+        time.sleep(0.05)
+        self.assertEqual(self.session.steps, steps)
+
+
+if __name__ == "__main__":
+    unittest.main()
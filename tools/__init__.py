@@ -0,0 +1 @@
+"""Command line tools for tuning and maintaining Galaxy Shooter"""
@@ -0,0 +1,137 @@
+"""
+Asset Baker for Galaxy Shooter
+
+Packs every image the game uses into one texture atlas, written as raw
+RGBA pixels plus a JSON index (see AssetCache.load_pack()). At start-up
+the game memory-maps the atlas instead of decoding PNG files.
+
+Only the files listed by AssetCache.manifest() are packed; bosses are
+packed already scaled to the size the game draws them at. Files the game
+does not use (background.png, the boss .jpeg duplicates, jpg2png.zip)
+are left out.
+
+Usage:
+    python -m tools.bake_assets                 # writes assets/baked/
+    python -m tools.bake_assets --output DIR
+
+Design principles used:
+- Separation of Concerns: Baking runs offline; the game only reads the result
+- Performance: One sequential read replaces a decode per image at start-up
+"""
+
+import argparse
+import json
+import os
+import pygame
+from core.assets import AssetCache, ASSET_DIR, PACK_DIR, PACK_INDEX, PACK_BLOB, PACK_VERSION, \
+    BOSS_LEVELS, BOSS_SIZE
+
+# Atlas width in pixels (widened if a single image is wider)
+ATLAS_WIDTH = 1024
+
+# Empty pixels kept between packed images
+PADDING = 1
+
+
+def collect_images(cache):
+    """
+    Load the images to pack.
+
+    Args:
+        cache: AssetCache pointing at the source images
+
+    Returns:
+        Dictionary of cache key -> unconverted Surface
+    """
+    bosses = {f"boss{level}.png" for level in BOSS_LEVELS}
+    images = {}
+    for name in cache.manifest():
+        surface = pygame.image.load(cache.path(name))
+        if name in bosses:
+            images[cache.scaled_key(name, BOSS_SIZE)] = pygame.transform.scale(surface, BOSS_SIZE)
+        else:
+            images[name] = surface
+    return images
+
+
+def pack(sizes, atlas_width=ATLAS_WIDTH):
+    """
+    Place rectangles on shelves, tallest first.
+
+    Args:
+        sizes: Dictionary of key -> (width, height)
+        atlas_width: Width of the atlas
+
+    Returns:
+        (positions, (width, height)): key -> (x, y), and the atlas size
+    """
+    width = max([atlas_width] + [w for w, _ in sizes.values()])
+    positions = {}
+    x = y = shelf_height = 0
+    for key in sorted(sizes, key=lambda k: (-sizes[k][1], k)):
+        w, h = sizes[key]
+        if x + w > width:
+            x = 0
+            y += shelf_height + PADDING
+            shelf_height = 0
+        positions[key] = (x, y)
+        x += w + PADDING
+        shelf_height = max(shelf_height, h)
+    return positions, (width, y + shelf_height)
+
+
+def is_opaque(surface):
+    """Check whether an image has no transparency at all"""
+    return not (surface.get_flags() & pygame.SRCALPHA) and surface.get_colorkey() is None \
+        and surface.get_alpha() is None
+
+
+def bake(output_dir=PACK_DIR, asset_dir=ASSET_DIR):
+    """
+    Build the atlas and its index.
+
+    Args:
+        output_dir: Directory to write the atlas and index to
+        asset_dir: Directory with the source images
+
+    Returns:
+        The index dictionary that was written
+    """
+    cache = AssetCache(asset_dir)
+    images = collect_images(cache)
+    positions, size = pack({key: surface.get_size() for key, surface in images.items()})
+
+    atlas = pygame.Surface(size, pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+    entries = {}
+    for key, surface in images.items():
+        x, y = positions[key]
+        # Blit without blending so the source alpha is copied as is
+        atlas.blit(surface, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        entries[key] = {'rect': [x, y, surface.get_width(), surface.get_height()],
+                        'opaque': is_opaque(surface)}
+
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, PACK_BLOB), 'wb') as f:
+        f.write(pygame.image.tobytes(atlas, 'RGBA'))
+    sources = {name: cache.source_stamp(name) for name in cache.manifest()}
+    index = {'version': PACK_VERSION, 'size': list(size), 'images': entries, 'sources': sources}
+    with open(os.path.join(output_dir, PACK_INDEX), 'w') as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+    return index
+
+
+def main(argv=None):
+    """Bake the assets from the command line"""
+    parser = argparse.ArgumentParser(description="Pack the game images into a raw RGBA atlas")
+    parser.add_argument("--output", default=PACK_DIR, help=f"output directory (default: {PACK_DIR})")
+    args = parser.parse_args(argv)
+
+    index = bake(args.output)
+    width, height = index['size']
+    print(f"Packed {len(index['images'])} images into a {width}x{height} atlas "
+          f"({width * height * 4 / 1e6:.1f} MB) in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
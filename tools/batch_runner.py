@@ -0,0 +1,181 @@
+"""
+Batch Simulation Runner for Galaxy Shooter
+
+Plays many games per level with the built-in bot, spread over every CPU
+core with multiprocessing, and aggregates the results into one report:
+clear rate, time to clear, and how the bot died (hit by a bullet or an
+enemy reaching the bottom of the screen). Used to tune the per-level
+difficulty multipliers.
+
+Assets are loaded and converted once in the parent process. On platforms
+with fork() the workers inherit them (and the warmed object pools) instead
+of loading everything again; elsewhere each worker loads them at startup.
+
+Usage:
+    python -m tools.batch_runner --games 200
+    python -m tools.batch_runner --level 3 --games 50 --json report.json
+
+Design principles used:
+- Separation of Concerns: Workers only play games; the parent aggregates
+- Reproducibility: Every game has its own seed, listed in the raw results
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import statistics
+import time
+from core.input import BotInput
+from core.sim_clock import TICK_MS
+from managers.game_session import GameSession, GAME_OVER, LEVEL_COMPLETE, HIT_BY_BULLET, ENEMY_INVASION
+from managers.headless_runner import init_headless_display, run_headless
+
+# A game still running after this many ticks (10 minutes of play) is a timeout
+DEFAULT_MAX_TICKS = 50 * 60 * 10
+
+# Session reused by every game played in a worker process
+_worker_session = None
+
+
+def _init_worker(assets_loaded):
+    """Worker start-up: load the assets unless they were inherited through fork()"""
+    if not assets_loaded:
+        init_headless_display()
+
+
+def play_game(job):
+    """
+    Play one game with the bot (runs in a worker process).
+
+    Args:
+        job: (level_index, seed, max_ticks) tuple
+
+    Returns:
+        Dictionary describing the game (see run_headless())
+    """
+    global _worker_session
+    level_index, seed, max_ticks = job
+    if _worker_session is None:
+        _worker_session = GameSession(600, 800)
+    session = _worker_session
+    return run_headless(level_index, BotInput(session), max_ticks, session, seed=seed)
+
+
+def aggregate(results, level_manager=None):
+    """
+    Summarise game results per level.
+
+    Args:
+        results: List of play_game() results
+        level_manager: LevelManager used to describe each level's tuning (optional)
+
+    Returns:
+        Dictionary of level number -> summary
+    """
+    by_level = {}
+    for result in results:
+        by_level.setdefault(result['level'], []).append(result)
+
+    report = {}
+    for level_number in sorted(by_level):
+        games = by_level[level_number]
+        clear_seconds = [game['ticks'] * TICK_MS / 1000 for game in games
+                         if game['outcome'] == LEVEL_COMPLETE]
+        losses = [game for game in games if game['outcome'] == GAME_OVER]
+        summary = {
+            'games': len(games),
+            'clears': len(clear_seconds),
+            'clear_rate': len(clear_seconds) / len(games),
+            'clear_seconds_mean': statistics.fmean(clear_seconds) if clear_seconds else None,
+            'clear_seconds_median': statistics.median(clear_seconds) if clear_seconds else None,
+            'deaths_by_bullet': sum(1 for game in losses if game['cause'] == HIT_BY_BULLET),
+            'deaths_by_invasion': sum(1 for game in losses if game['cause'] == ENEMY_INVASION),
+            'timeouts': sum(1 for game in games if game['outcome'] == "TIMEOUT"),
+            'kill_ratio': statistics.fmean(game['enemies_killed'] / game['total_enemies']
+                                           for game in games if game['total_enemies']) if games else 0.0,
+        }
+        if level_manager is not None:
+            level = level_manager.get_level(level_number - 1)
+            summary['speed_multiplier'] = level.get_enemy_speed_multiplier()
+            summary['shoot_chance_multiplier'] = level.get_enemy_shoot_chance_multiplier()
+        report[level_number] = summary
+    return report
+
+
+def run_batch(levels, games, seed=0, max_ticks=DEFAULT_MAX_TICKS, processes=None):
+    """
+    Play `games` games of every level in a process pool.
+
+    Args:
+        levels: Level indices to play (0 = Level 1)
+        games: Number of games per level
+        seed: Seed of the first game; game i of a level uses seed + i
+        max_ticks: Tick limit per game
+        processes: Worker count (CPU count if None)
+
+    Returns:
+        List of per-game results
+    """
+    # Load assets once here so forked workers inherit them
+    init_headless_display()
+
+    methods = multiprocessing.get_all_start_methods()
+    forked = 'fork' in methods
+    context = multiprocessing.get_context('fork' if forked else None)
+    jobs = [(level_index, seed + i, max_ticks) for level_index in levels for i in range(games)]
+    processes = processes or os.cpu_count() or 1
+    pool = context.Pool(processes, initializer=_init_worker, initargs=(forked,))
+    try:
+        return pool.map(play_game, jobs, chunksize=max(1, len(jobs) // (processes * 4)))
+    finally:
+        # Let the workers exit on their own: SDL's signal handlers swallow
+        # the SIGTERM that Pool.terminate() would send them
+        pool.close()
+        pool.join()
+
+
+def print_report(report):
+    """Print the aggregated report as a table"""
+    print(f"{'level':<6}{'games':>6}{'clear%':>8}{'clear s':>9}{'bullet':>8}{'invade':>8}"
+          f"{'timeout':>8}{'kills%':>8}{'speed':>7}{'shoot':>7}")
+    for level_number, summary in report.items():
+        clear_time = summary['clear_seconds_median']
+        print(f"{level_number:<6}{summary['games']:>6}{summary['clear_rate'] * 100:>7.1f}%"
+              f"{clear_time if clear_time is not None else float('nan'):>9.1f}"
+              f"{summary['deaths_by_bullet']:>8}{summary['deaths_by_invasion']:>8}"
+              f"{summary['timeouts']:>8}{summary['kill_ratio'] * 100:>7.1f}%"
+              f"{summary.get('speed_multiplier', float('nan')):>7.2f}"
+              f"{summary.get('shoot_chance_multiplier', float('nan')):>7.2f}")
+
+
+def main(argv=None):
+    """Run the batch from the command line"""
+    parser = argparse.ArgumentParser(description="Play many bot games per level and report the results")
+    parser.add_argument("--level", type=int, action="append", choices=range(1, 6),
+                        help="level to play (repeatable; default: all levels)")
+    parser.add_argument("--games", type=int, default=100, help="games per level (default: 100)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game (default: 0)")
+    parser.add_argument("--max-ticks", type=int, default=DEFAULT_MAX_TICKS,
+                        help="tick limit per game (default: 10 minutes of play)")
+    parser.add_argument("--processes", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--json", metavar="PATH", help="write the report and raw results as JSON")
+    args = parser.parse_args(argv)
+
+    levels = [level - 1 for level in args.level] if args.level else list(range(5))
+    started = time.perf_counter()
+    results = run_batch(levels, args.games, args.seed, args.max_ticks, args.processes)
+    elapsed = time.perf_counter() - started
+
+    from managers.level_manager import LevelManager
+    report = aggregate(results, LevelManager(600, 800))
+    print_report(report)
+    print(f"{len(results)} games in {elapsed:.1f} s")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'levels': report, 'games': results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()